@@ -0,0 +1,44 @@
+"""Setup and timing helpers shared by the benchmark scripts.
+
+The scripts are run as ``python benchmarks/<name>.py``, which puts this directory on the import path.
+"""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ssb_timeseries import config
+
+
+def best_of(repeat: int, call: Callable[..., Any], *args: Any, **kwargs: Any) -> float:
+    """Return the best latency in seconds of a call."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call(*args, **kwargs)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def configure(root: Path) -> dict:
+    """Write and activate a configuration with a single repository under root, and return the repository."""
+    repository = {
+        "name": "benchmark",
+        "directory": {
+            "handler": "simple-parquet",
+            "options": {"path": str(root / "data")},
+        },
+        "catalog": {"handler": "json", "options": {"path": str(root / "metadata")}},
+        "default": True,
+    }
+    configuration_file = str(root / "config.json")
+    config.active_file(configuration_file)
+    config.Config(
+        configuration_file=configuration_file,
+        io_handlers=config.BUILTIN_IO_HANDLERS,
+        repositories={"benchmark": repository},
+        logging=config.LOGGING_PRESETS["simple"],
+        ignore_file=True,
+    ).save()
+    return repository
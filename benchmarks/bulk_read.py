@@ -0,0 +1,120 @@
+"""Compare reading many datasets one at a time with :py:func:`ssb_timeseries.io.read_many`.
+
+Datasets are written to a repository in a temporary directory, configured through a temporary configuration file.
+To mimic object storage, a latency is injected in every :py:func:`~ssb_timeseries.io.fs.read_json`
+and :py:func:`~ssb_timeseries.io.fs.parquet_file` call.
+The script reports the time (best of N) to read all the datasets:
+
+* 'one by one': a :py:func:`~ssb_timeseries.io.find` and a :py:func:`~ssb_timeseries.io.read_data` per dataset,
+  which is what creating each :py:class:`~ssb_timeseries.dataset.Dataset` in turn does.
+* 'read_many': one catalog search and concurrent data reads with an increasing number of workers.
+
+Usage::
+
+    python benchmarks/bulk_read.py [--datasets 100] [--latency-ms 20] [--repeat 3]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from _common import best_of
+from _common import configure
+
+from ssb_timeseries import config
+from ssb_timeseries import io
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import json_metadata
+from ssb_timeseries.io import pyarrow_simple
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+_read_json = fs.read_json
+_parquet_file = fs.parquet_file
+_latency = 0.0
+
+
+def slow_read_json(path: str) -> dict:
+    """Read a json file after sleeping for the injected latency."""
+    time.sleep(_latency)
+    return _read_json(path)
+
+
+def slow_parquet_file(path: str, *args: Any, **kwargs: Any) -> Any:
+    """Open a Parquet file after sleeping for the injected latency."""
+    time.sleep(_latency)
+    return _parquet_file(path, *args, **kwargs)
+
+
+def write_datasets(repository: dict, datasets: int) -> list[str]:
+    """Write small datasets with metadata, and return their names."""
+    names = []
+    for d in range(datasets):
+        name = f"set_{d:05d}"
+        df = create_df(
+            [f"{name}_x", f"{name}_y", f"{name}_z"],
+            start_date="2020-01-01",
+            end_date="2024-12-01",
+            freq="MS",
+        )
+        tags = {
+            "name": name,
+            "versioning": "NONE",
+            "temporality": "AT",
+            "series": {c: {"name": c, "dataset": name} for c in df.columns[1:]},
+        }
+        pyarrow_simple.FileSystem(
+            repository=repository, set_name=name, set_type=SeriesType.simple()
+        ).write(data=df, tags=tags)
+        json_metadata.JsonMetaIO(repository=repository).write(tags=tags, set_name=name)
+        names.append(name)
+    return names
+
+
+def one_by_one(names: list[str]) -> None:
+    """Find and read each dataset in turn."""
+    for name in names:
+        io.find(set_name=name, repository="benchmark")
+        io.read_data("benchmark", name)
+
+
+def main() -> None:
+    """Write datasets and time reading them one by one and with read_many."""
+    global _latency
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    previous_config = os.environ.get(config.ENV_VAR_NAME, "")
+    with tempfile.TemporaryDirectory() as root:
+        repository = configure(Path(root))
+        names = write_datasets(repository, args.datasets)
+        io.read_many(names)  # builds the catalog index
+
+        _latency = args.latency_ms / 1000
+        fs.read_json = slow_read_json
+        fs.parquet_file = slow_parquet_file
+        print(f"{args.datasets} datasets, {args.latency_ms:.0f} ms latency per read")
+        print(f"{'method':>16}{'seconds':>10}{'speedup':>10}")
+        baseline = best_of(args.repeat, one_by_one, names)
+        print(f"{'one by one':>16}{baseline:>10.2f}{1:>10.1f}")
+        for workers in (1, 4, 16, 64):
+            seconds = best_of(args.repeat, io.read_many, names, max_workers=workers)
+            label = f"read_many/{workers}"
+            print(f"{label:>16}{seconds:>10.2f}{baseline / seconds:>10.1f}")
+
+    if previous_config:
+        config.active_file(previous_config)
+    else:
+        config.unset_env_var()
+
+
+if __name__ == "__main__":
+    main()
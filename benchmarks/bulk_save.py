@@ -0,0 +1,109 @@
+"""Compare saving many datasets one at a time with :py:func:`ssb_timeseries.io.save_many`.
+
+Datasets are saved to a repository in a temporary directory, configured through a temporary configuration file.
+To mimic object storage, a latency is injected in every :py:func:`~ssb_timeseries.io.fs.write_json`
+and :py:func:`~ssb_timeseries.io.fs.write_parquet` call.
+The script reports the time (best of N) to save all the datasets:
+
+* 'one by one': :py:meth:`~ssb_timeseries.dataset.Dataset.save` for each dataset,
+  which writes the data, the metadata and the catalog index in turn.
+* 'save_many': concurrent data writes and one metadata batch, with an increasing number of workers.
+
+Usage::
+
+    python benchmarks/bulk_save.py [--datasets 100] [--latency-ms 20] [--repeat 3]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from _common import best_of
+from _common import configure
+
+from ssb_timeseries import config
+from ssb_timeseries import io
+from ssb_timeseries.dataset import Dataset
+from ssb_timeseries.io import fs
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+_write_json = fs.write_json
+_write_parquet = fs.write_parquet
+_latency = 0.0
+
+
+def slow_write_json(path: str, content: Any) -> None:
+    """Write a json file after sleeping for the injected latency."""
+    time.sleep(_latency)
+    _write_json(path, content)
+
+
+def slow_write_parquet(*args: Any, **kwargs: Any) -> None:
+    """Write a Parquet file after sleeping for the injected latency."""
+    time.sleep(_latency)
+    _write_parquet(*args, **kwargs)
+
+
+def create_datasets(datasets: int) -> list[Dataset]:
+    """Create small datasets in memory."""
+    out = []
+    for d in range(datasets):
+        name = f"set_{d:05d}"
+        df = create_df(
+            [f"{name}_x", f"{name}_y", f"{name}_z"],
+            start_date="2020-01-01",
+            end_date="2024-12-01",
+            freq="MS",
+        )
+        out.append(Dataset(name, data_type=SeriesType.simple(), data=df))
+    return out
+
+
+def one_by_one(datasets: list[Dataset]) -> None:
+    """Save each dataset in turn."""
+    for ds in datasets:
+        ds.save()
+
+
+def main() -> None:
+    """Time saving datasets one by one and with save_many."""
+    global _latency
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    previous_config = os.environ.get(config.ENV_VAR_NAME, "")
+    with tempfile.TemporaryDirectory() as root:
+        configure(Path(root))
+        datasets = create_datasets(args.datasets)
+        io.save_many(datasets)
+        io.search()  # builds the catalog index, which is then updated by every save
+
+        _latency = args.latency_ms / 1000
+        fs.write_json = slow_write_json
+        fs.write_parquet = slow_write_parquet
+        print(f"{args.datasets} datasets, {args.latency_ms:.0f} ms latency per write")
+        print(f"{'method':>16}{'seconds':>10}{'speedup':>10}")
+        baseline = best_of(args.repeat, one_by_one, datasets)
+        print(f"{'one by one':>16}{baseline:>10.2f}{1:>10.1f}")
+        for workers in (1, 4, 16, 64):
+            seconds = best_of(args.repeat, io.save_many, datasets, max_workers=workers)
+            label = f"save_many/{workers}"
+            print(f"{label:>16}{seconds:>10.2f}{baseline / seconds:>10.1f}")
+
+    if previous_config:
+        config.active_file(previous_config)
+    else:
+        config.unset_env_var()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare building the catalog index from metadata files with different read concurrency.
+
+Metadata files are written to a temporary directory with :py:class:`~ssb_timeseries.io.json_metadata.JsonMetaIO`.
+To mimic object storage, a latency is injected in every :py:func:`~ssb_timeseries.io.fs.read_json` call.
+For each concurrency, the script reports the time (best of N) to rebuild the catalog index,
+which reads every metadata file with :py:func:`~ssb_timeseries.io.fs.read_json_many`.
+
+Usage::
+
+    python benchmarks/catalog_parallel_reads.py [--datasets 200] [--series 20] [--latency-ms 20] [--repeat 3]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+
+from _common import best_of
+
+from ssb_timeseries.io import catalog_index
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import json_metadata
+
+_read_json = fs.read_json
+_latency = 0.0
+
+
+def slow_read_json(path: str) -> dict:
+    """Read a json file after sleeping for the injected latency."""
+    time.sleep(_latency)
+    return _read_json(path)
+
+
+def write_catalog(directory: str, datasets: int, series: int) -> None:
+    """Write metadata files for datasets with tagged series."""
+    handler = json_metadata.JsonMetaIO(
+        repository={"name": "benchmark", "catalog": {"options": {"path": directory}}}
+    )
+    for d in range(datasets):
+        name = f"set_{d:05d}"
+        tags = {
+            "name": name,
+            "repository": "benchmark",
+            "series": {
+                f"{name}_{s:03d}": {
+                    "name": f"{name}_{s:03d}",
+                    "dataset": name,
+                    "unit": ["NOK", "EUR"][s % 2],
+                }
+                for s in range(series)
+            },
+        }
+        handler.write(tags=tags, set_name=name)
+
+
+def rebuild(directory: str, max_workers: int) -> int:
+    """Rebuild the catalog index from the metadata files."""
+    catalog_index._loaded.clear()
+    return catalog_index.rebuild_index(directory, max_workers=max_workers).num_rows
+
+
+def main() -> None:
+    """Write metadata files and time rebuilding the catalog index with increasing concurrency."""
+    global _latency
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=200)
+    parser.add_argument("--series", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_catalog(directory, args.datasets, args.series)
+        _latency = args.latency_ms / 1000
+        fs.read_json = slow_read_json
+        print(
+            f"{args.datasets} metadata files x {args.series} series, "
+            f"{args.latency_ms:.0f} ms latency per read"
+        )
+        print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}")
+        baseline = 0.0
+        for workers in (1, 4, 16, 64):
+            seconds = best_of(args.repeat, rebuild, directory, workers)
+            baseline = baseline or seconds
+            print(f"{workers:>8}{seconds:>10.2f}{baseline / seconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
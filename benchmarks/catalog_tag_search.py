@@ -0,0 +1,110 @@
+"""Compare searching series by tags with the inverted tag index and with a linear scan.
+
+A catalog index with many datasets and series is built in memory.
+The series have tags with low (unit), medium (region) and high (code) cardinality.
+For a few criteria, the script reports the latency (best of N) of:
+
+* linear: checking every series with :py:func:`~ssb_timeseries.meta.tags.matches_criteria` (tags already parsed),
+* inverted: resolving the criteria with :py:class:`~ssb_timeseries.io.catalog_index.TagIndex`,
+* search: the inverted index plus building the catalog items of the matching series.
+
+Usage::
+
+    python benchmarks/catalog_tag_search.py [--datasets 200] [--series 1000] [--repeat 3]
+"""
+
+import argparse
+import json
+import logging
+import time
+
+import pyarrow
+from _common import best_of
+
+from ssb_timeseries.io import catalog_index
+from ssb_timeseries.meta.tags import matches_criteria
+
+
+def catalog(datasets: int, series: int) -> pyarrow.Table:
+    """Return a catalog index of datasets with series tagged by unit, region and code."""
+    tables = []
+    for d in range(datasets):
+        name = f"set_{d:05d}"
+        tags = {
+            "name": name,
+            "repository": "benchmark",
+            "owner": f"owner_{d % 10}",
+            "series": {
+                f"{name}_{s:05d}": {
+                    "name": f"{name}_{s:05d}",
+                    "dataset": name,
+                    "unit": ["NOK", "EUR", "USD"][s % 3],
+                    "region": f"region_{s % 50}",
+                    "code": f"code_{(d * series + s) % 10000}",
+                }
+                for s in range(series)
+            },
+        }
+        tables.append(catalog_index.object_rows(name, tags, (0, 0)))
+    return pyarrow.concat_tables(tables)
+
+
+def linear(objects: list[dict], criteria: list[dict]) -> int:
+    """Count the objects matching any of the criteria by checking each of them."""
+    return sum(any(matches_criteria(o, c) for c in criteria) for o in objects)
+
+
+def search(
+    index: pyarrow.Table, inverted: catalog_index.TagIndex, criteria: list[dict]
+) -> int:
+    """Count the series items returned for the criteria using the inverted index."""
+    selected = inverted.matching(criteria)
+    return len(
+        catalog_index.catalog_items(
+            index, datasets=False, series=True, selected=selected
+        )
+    )
+
+
+def main() -> None:
+    """Build a catalog index and compare linear and inverted index tag searches."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=200)
+    parser.add_argument("--series", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    index = catalog(args.datasets, args.series)
+    objects = [json.loads(t) for t in index["tags"].to_pylist()]
+    started = time.perf_counter()
+    inverted = catalog_index.TagIndex(index)
+    build = time.perf_counter() - started
+    print(
+        f"{args.datasets} datasets x {args.series} series, "
+        f"inverted index built in {build * 1000:.0f} ms"
+    )
+
+    queries = {
+        "code": [{"code": "code_42"}],
+        "region+unit": [{"region": "region_7", "unit": "NOK"}],
+        "or of dicts": [{"region": "region_7"}, {"code": ["code_1", "code_2"]}],
+        "unit": [{"unit": "EUR"}],
+    }
+    print(
+        f"{'criteria':<14}{'matches':>10}{'linear ms':>12}{'inverted ms':>14}{'search ms':>12}"
+    )
+    for label, criteria in queries.items():
+        matches = int(inverted.matching(criteria).sum())
+        assert matches == linear(objects, criteria)
+        scan = best_of(args.repeat, linear, objects, criteria)
+        lookup = best_of(args.repeat, inverted.matching, criteria)
+        items = best_of(args.repeat, search, index, inverted, criteria)
+        print(
+            f"{label:<14}{matches:>10}{scan * 1000:>12.1f}"
+            f"{lookup * 1000:>14.2f}{items * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compare reopening datasets with and without the in-process :py:mod:`~ssb_timeseries.io.data_cache`.
+
+Datasets are written to a repository in a temporary directory, configured through a temporary configuration file.
+To mimic object storage, a latency is injected in every :py:func:`~ssb_timeseries.io.fs.parquet_file` call.
+The script reports the time (best of N) to open every dataset a number of times, as a notebook session would.
+
+Usage::
+
+    python benchmarks/data_cache.py [--datasets 20] [--opens 10] [--latency-ms 20] [--repeat 3]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from _common import best_of
+from _common import configure
+
+from ssb_timeseries import config
+from ssb_timeseries import io
+from ssb_timeseries.dataset import Dataset
+from ssb_timeseries.io import data_cache
+from ssb_timeseries.io import fs
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+_parquet_file = fs.parquet_file
+_latency = 0.0
+
+
+def slow_parquet_file(path: str, *args: Any, **kwargs: Any) -> Any:
+    """Open a Parquet file after sleeping for the injected latency."""
+    time.sleep(_latency)
+    return _parquet_file(path, *args, **kwargs)
+
+
+def save_datasets(datasets: int) -> list[str]:
+    """Save datasets of 100 monthly series over 20 years, and return their names."""
+    names = []
+    for d in range(datasets):
+        name = f"set_{d:05d}"
+        df = create_df(
+            [f"{name}_{s:03d}" for s in range(100)],
+            start_date="2005-01-01",
+            end_date="2024-12-01",
+            freq="MS",
+        )
+        Dataset(name, data_type=SeriesType.simple(), data=df).save()
+        names.append(name)
+    return names
+
+
+def reopen(names: list[str], opens: int) -> None:
+    """Open every dataset a number of times."""
+    for _ in range(opens):
+        for name in names:
+            Dataset(name)
+
+
+def main() -> None:
+    """Save datasets and time reopening them with and without the data cache."""
+    global _latency
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=20)
+    parser.add_argument("--opens", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    previous_config = os.environ.get(config.ENV_VAR_NAME, "")
+    with tempfile.TemporaryDirectory() as root:
+        configure(Path(root))
+        names = save_datasets(args.datasets)
+        io.search()  # builds the catalog index
+
+        _latency = args.latency_ms / 1000
+        fs.parquet_file = slow_parquet_file
+        print(
+            f"{args.datasets} datasets opened {args.opens} times, "
+            f"{args.latency_ms:.0f} ms latency per read"
+        )
+        print(f"{'method':>16}{'seconds':>10}{'speedup':>10}")
+        baseline = best_of(args.repeat, reopen, names, args.opens)
+        print(f"{'no cache':>16}{baseline:>10.2f}{1:>10.1f}")
+        with data_cache.enabled():
+            seconds = best_of(args.repeat, reopen, names, args.opens)
+            print(f"{'data cache':>16}{seconds:>10.2f}{baseline / seconds:>10.1f}")
+            print(f"cache: {data_cache.stats()}")
+
+    if previous_config:
+        config.active_file(previous_config)
+    else:
+        config.unset_env_var()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare write amplification of 'merge' and 'append' write modes for the simple Parquet handler.
+
+A 20 year daily dataset is written to a temporary directory.
+Then one new day is written N times, once with the default 'merge' write mode
+and once with ``write_mode: append``.
+For each mode the script reports the bytes written and the latency (mean) per write,
+as well as the latency (best of 3) of a full read after the last write.
+
+Usage::
+
+    python benchmarks/delta_writes.py [--series 50] [--years 20] [--writes 10]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from datetime import timedelta
+from typing import Any
+
+from ssb_timeseries.dates import date_utc
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import pyarrow_simple
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+_write_parquet = fs.write_parquet
+
+
+class ByteCounter:
+    """Counts the bytes of the Parquet files written through :py:func:`fs.write_parquet`."""
+
+    bytes_written = 0
+
+    @classmethod
+    def write_parquet(cls, data, path, schema=None, **kwargs) -> None:  # noqa: ANN001
+        """Write and count bytes."""
+        _write_parquet(data, path, schema, **kwargs)
+        cls.bytes_written += os.path.getsize(path)
+
+
+def measure(
+    root: str, mode: str, data: Any, updates: list, tags: dict
+) -> tuple[float, int, float]:
+    """Return mean write latency, mean bytes written per write and read latency for a write mode."""
+    handler = pyarrow_simple.FileSystem(
+        repository={"directory": {"options": {"path": root, "write_mode": mode}}},
+        set_name=f"benchmark_{mode}",
+        set_type=SeriesType.simple(),
+    )
+    handler.write(data=data, tags=tags)
+
+    ByteCounter.bytes_written = 0
+    started = time.perf_counter()
+    for update in updates:
+        handler.write(data=update, tags=tags)
+    write_seconds = (time.perf_counter() - started) / len(updates)
+    bytes_written = ByteCounter.bytes_written // len(updates)
+
+    read_timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        handler.read()
+        read_timings.append(time.perf_counter() - started)
+    return write_seconds, bytes_written, min(read_timings)
+
+
+def main() -> None:
+    """Write a sample dataset and compare appending days in both write modes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=50)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--writes", type=int, default=10)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    end = date_utc("2024-12-31")
+    start = end - timedelta(days=365 * args.years)
+    names = [f"s{i}" for i in range(args.series)]
+    data = create_df(names, start_date=start, end_date=end, freq="D")
+    updates = [
+        create_df(
+            names,
+            start_date=end + timedelta(days=i + 1),
+            end_date=end + timedelta(days=i + 1),
+            freq="D",
+        )
+        for i in range(args.writes)
+    ]
+    tags = {
+        "name": "benchmark",
+        "versioning": "NONE",
+        "temporality": "AT",
+        "series": {n: {} for n in names},
+    }
+
+    fs.write_parquet = ByteCounter.write_parquet
+    with tempfile.TemporaryDirectory() as root:
+        results = {
+            mode: measure(root, mode, data, updates, tags)
+            for mode in ("merge", "append")
+        }
+
+    print(f"{len(data)} rows x {args.series} series, {args.writes} single day writes")
+    print(f"{'mode':<8}{'write ms':>10}{'bytes/write':>14}{'read ms':>10}")
+    for mode, (write_seconds, bytes_written, read_seconds) in results.items():
+        print(
+            f"{mode:<8}{write_seconds * 1000:>10.1f}{bytes_written:>14}"
+            f"{read_seconds * 1000:>10.1f}"
+        )
+    merge, append = results["merge"], results["append"]
+    print(
+        f"append mode: {append[1] / merge[1]:.1%} of bytes, "
+        f"{append[0] / merge[0]:.1%} of write latency"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Compare reading remote Parquet and JSON files directly and through the local :py:mod:`~ssb_timeseries.io.disk_cache`.
+
+The in-memory filesystem stands in for GCS.
+To mimic object storage, every request for file info or contents is delayed by a latency,
+and contents are read at a limited bandwidth.
+The script reports the time to read every file once:
+directly from the remote, with a cold (empty) cache directory, and with a warm one,
+as in a second run of the same job.
+
+Usage::
+
+    python benchmarks/disk_cache.py [--files 10] [--rows 500000] [--latency-ms 20] [--mb-per-second 100] [--repeat 3]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+import uuid
+from typing import Any
+
+import numpy as np
+import pyarrow
+from _common import best_of
+from fsspec.implementations.memory import MemoryFileSystem
+
+from ssb_timeseries.io import disk_cache
+from ssb_timeseries.io import fs
+
+_latency = 0.0
+_bandwidth = float("inf")
+
+
+class SlowMemoryFileSystem(MemoryFileSystem):
+    """An in-memory filesystem with the latency and bandwidth of object storage."""
+
+    def info(self, path: str, **kwargs: Any) -> dict[str, Any]:
+        """Return the file info after sleeping for the injected latency."""
+        time.sleep(_latency)
+        return super().info(path, **kwargs)
+
+    def _open(self, path: str, mode: str = "rb", **kwargs: Any) -> Any:
+        """Open a file after sleeping for the injected latency; reads are limited to the bandwidth."""
+        file = super()._open(path, mode, **kwargs)
+        if "r" not in mode:
+            return file
+        time.sleep(_latency)
+        return SlowFile(file)
+
+
+class SlowFile:
+    """A file whose reads are limited to the injected bandwidth.
+
+    The in-memory filesystem returns the same file object every time a file is opened, so it is wrapped rather than patched.
+    """
+
+    def __init__(self, file: Any) -> None:
+        """Wrap a file."""
+        self._file = file
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the file at the injected bandwidth."""
+        data = self._file.read(size)
+        time.sleep(len(data) / _bandwidth)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the file."""
+        return getattr(self._file, name)
+
+    def __enter__(self) -> "SlowFile":
+        """Enter the context of the file."""
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the context of the file."""
+        self._file.__exit__(*args)
+
+
+def write_files(root: str, files: int, rows: int) -> list[tuple[str, str]]:
+    """Write a Parquet data file and a JSON metadata file per dataset, and return their paths."""
+    rng = np.random.default_rng(1)
+    paths = []
+    for f in range(files):
+        data = f"{root}/data/set_{f:03d}.parquet"
+        meta = f"{root}/meta/set_{f:03d}-metadata.json"
+        table = pyarrow.table({f"s{s:02d}": rng.normal(size=rows) for s in range(10)})
+        fs.write_parquet(path=data, data=table)
+        fs.write_json(meta, {"name": f"set_{f:03d}", "series": table.column_names})
+        paths.append((data, meta))
+    return paths
+
+
+def read_all(paths: list[tuple[str, str]]) -> None:
+    """Read every data and metadata file once."""
+    for data, meta in paths:
+        fs.read_parquet(data)
+        fs.read_json(meta)
+
+
+def cold_read(paths: list[tuple[str, str]], max_bytes: int) -> None:
+    """Read every file once through an empty cache directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        with disk_cache.enabled(directory, max_bytes=max_bytes):
+            read_all(paths)
+
+
+def main() -> None:
+    """Write remote files and time reading them with and without the disk cache."""
+    global _latency, _bandwidth
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--mb-per-second", type=float, default=100.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    root = f"memory://benchmark-{uuid.uuid4().hex[:8]}"
+    paths = write_files(root, args.files, args.rows)
+    nbytes = sum(fs.file_signature(p)[1] for pair in paths for p in pair)
+    max_bytes = 2 * nbytes
+
+    _latency = args.latency_ms / 1000
+    _bandwidth = args.mb_per_second * 1e6
+    fs.clear_filesystems()
+    fs._filesystems[("memory", "")] = SlowMemoryFileSystem()
+    print(
+        f"{args.files} Parquet and JSON files, {nbytes / 1e6:.0f} MB in total, "
+        f"{args.latency_ms:.0f} ms latency, {args.mb_per_second:.0f} MB/s"
+    )
+    print(f"{'method':>16}{'seconds':>10}{'speedup':>10}")
+    baseline = best_of(args.repeat, read_all, paths)
+    print(f"{'no cache':>16}{baseline:>10.2f}{1:>10.1f}")
+    seconds = best_of(args.repeat, cold_read, paths, max_bytes)
+    print(f"{'cold cache':>16}{seconds:>10.2f}{baseline / seconds:>10.1f}")
+    with tempfile.TemporaryDirectory() as directory:
+        with disk_cache.enabled(directory, max_bytes=max_bytes):
+            read_all(paths)
+            disk_cache.reset_stats()
+            seconds = best_of(args.repeat, read_all, paths)
+            print(f"{'warm cache':>16}{seconds:>10.2f}{baseline / seconds:>10.1f}")
+            print(f"cache: {disk_cache.stats()}")
+
+    fs.clear_filesystems()
+    fs.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
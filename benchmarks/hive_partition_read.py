@@ -0,0 +1,86 @@
+"""Compare one-version reads from the Hive handler with reads that discover all partitions.
+
+An 'as of' dataset with many versions is written to a temporary directory.
+A single version is then read in two ways:
+by opening the whole dataset directory and filtering on the 'as_of' partition,
+and through the handler, which opens only the partition directory of its version.
+The script reports the latency (best of N) for increasing numbers of versions.
+
+Usage::
+
+    python benchmarks/hive_partition_read.py [--versions 100 500 2000] [--series 10] [--repeat 5]
+"""
+
+import argparse
+import logging
+import tempfile
+from datetime import timedelta
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset
+from _common import best_of
+
+from ssb_timeseries.dates import date_utc
+from ssb_timeseries.io import pyarrow_hive
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+
+def read_all_partitions(handler: pyarrow_hive.HiveFileSystem) -> pa.Table:
+    """Read the version of the handler by discovering all partitions and filtering on 'as_of'."""
+    dataset = pa.dataset.dataset(
+        handler.directory,
+        format="parquet",
+        partitioning=handler.partitioning,
+    )
+    as_of = pa.scalar(handler.as_of_utc, pyarrow_hive._TIMESTAMP)
+    return dataset.to_table(filter=pc.field("as_of") == as_of)
+
+
+def main() -> None:
+    """Write datasets with increasing numbers of versions and compare one-version reads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--versions", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--series", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    data = create_df(
+        [f"s{i}" for i in range(args.series)],
+        start_date="2020-01-01",
+        end_date="2024-12-01",
+        freq="MS",
+    )
+    tags = {
+        "name": "benchmark",
+        "versioning": "AS_OF",
+        "temporality": "AT",
+        "series": {c: {} for c in data.columns if c != "valid_at"},
+    }
+    first = date_utc("2000-01-01")
+
+    print(f"{'versions':>10}{'all partitions ms':>20}{'one partition ms':>20}")
+    for count in args.versions:
+        with tempfile.TemporaryDirectory() as root:
+            handler = pyarrow_hive.HiveFileSystem(
+                repository={"directory": {"options": {"path": root}}},
+                set_name="benchmark",
+                set_type=SeriesType.estimate(),
+                as_of_utc=first,
+            )
+            for i in range(count):
+                handler.as_of_utc = first + timedelta(days=i)
+                handler.write(data=data, tags=tags)
+            handler.as_of_utc = first + timedelta(days=count // 2)
+
+            all_partitions = best_of(args.repeat, read_all_partitions, handler)
+            one_partition = best_of(
+                args.repeat, pyarrow_hive.HiveFileSystem.read, handler
+            )
+        print(f"{count:>10}{all_partitions * 1000:>20.1f}{one_partition * 1000:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
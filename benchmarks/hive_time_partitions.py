@@ -0,0 +1,74 @@
+"""Compare the Hive handler with and without secondary time partitioning for high frequency data.
+
+An unversioned hourly dataset is written to a temporary directory for each layout:
+a single partition (the default), partitions by year, and partitions by year and month.
+For each layout the script reports the latency (best of N) of merging one day of new data into the dataset,
+of reading the last month with an interval, and of a full read.
+
+Usage::
+
+    python benchmarks/hive_time_partitions.py [--series 20] [--years 5] [--repeat 3]
+"""
+
+import argparse
+import logging
+import tempfile
+from datetime import timedelta
+
+from _common import best_of
+
+from ssb_timeseries.dates import date_utc
+from ssb_timeseries.intervals import Interval
+from ssb_timeseries.io import pyarrow_hive
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+
+def main() -> None:
+    """Write an hourly dataset with each layout and compare merge writes and reads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=20)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    names = [f"s{i}" for i in range(args.series)]
+    end = date_utc("2024-12-31")
+    start = end - timedelta(days=365 * args.years)
+    data = create_df(names, start_date=start, end_date=end, freq="h")
+    update = create_df(
+        names, start_date=end - timedelta(days=1), end_date=end, freq="h"
+    )
+    tags = {
+        "name": "benchmark",
+        "versioning": "NONE",
+        "temporality": "AT",
+        "series": {name: {} for name in names},
+    }
+    last_month = Interval(start=end - timedelta(days=31), stop=end)
+    print(f"{len(data)} rows x {args.series} series")
+
+    print(f"{'layout':<10}{'merge day ms':>14}{'read month ms':>16}{'read all ms':>14}")
+    for layout in ("none", "year", "month"):
+        with tempfile.TemporaryDirectory() as root:
+            handler = pyarrow_hive.HiveFileSystem(
+                repository={
+                    "directory": {
+                        "options": {"path": root, "time_partitioning": layout}
+                    }
+                },
+                set_name="benchmark",
+                set_type=SeriesType.simple(),
+            )
+            handler.write(data=data, tags=tags)
+            merge = best_of(args.repeat, handler.write, data=update, tags=tags)
+            month = best_of(args.repeat, handler.read, interval=last_month)
+            full = best_of(args.repeat, handler.read)
+        print(
+            f"{layout:<10}{merge * 1000:>14.1f}{month * 1000:>16.1f}{full * 1000:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
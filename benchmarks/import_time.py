@@ -0,0 +1,85 @@
+"""Check import time and imported modules against a recorded budget.
+
+Each statement in ``import_budget.json`` is run in a fresh interpreter with
+``python -X importtime``. The cumulative import time of the top level
+package and the set of imported modules are compared to the budget.
+
+Usage::
+
+    python benchmarks/import_time.py [--repeat N] [--budget FILE]
+
+The script exits with a non-zero status if any budget is exceeded.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_BUDGET = Path(__file__).with_name("import_budget.json")
+
+
+def importtime(statement: str) -> tuple[int, set[str]]:
+    """Return package import time in microseconds and imported modules for *statement*.
+
+    The time is the sum of the cumulative times of the top level
+    ``ssb_timeseries`` entries, i.e. including everything they pull in.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        name = module.strip()
+        modules.add(name)
+        top_level = len(module) - len(module.lstrip()) == 1
+        if top_level and name.split(".")[0] == "ssb_timeseries":
+            total += int(cumulative)
+    return total, modules
+
+
+def check(statement: str, budget: dict, repeat: int = 5) -> list[str]:
+    """Run *statement* and return a list of budget violations."""
+    runs = [importtime(statement) for _ in range(repeat)]
+    best = min(total for total, _ in runs)
+    modules = runs[0][1]
+    packages = {name.split(".")[0] for name in modules}
+
+    print(f"{statement!r}: {best / 1000:.1f} ms, {len(modules)} modules")
+    problems = []
+    if best > budget["max_cumulative_us"]:
+        problems.append(
+            f"{statement!r} took {best} us, budget is {budget['max_cumulative_us']} us"
+        )
+    forbidden = sorted(packages & set(budget.get("forbidden_modules", [])))
+    if forbidden:
+        problems.append(f"{statement!r} imported {', '.join(forbidden)}")
+    return problems
+
+
+def main() -> int:
+    """Check all statements in the budget file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET)
+    args = parser.parse_args()
+
+    budgets = json.loads(args.budget.read_text())
+    problems = []
+    for statement, budget in budgets.items():
+        problems.extend(check(statement, budget, repeat=args.repeat))
+    for problem in problems:
+        print(f"BUDGET EXCEEDED: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Compare interval reads with full reads for the simple Parquet handler.
+
+A 40 year daily dataset is written to a temporary directory.
+It is then read in full, and for the last few years only.
+For each read the script reports the latency (best of N) and the number of bytes read from the file.
+
+Usage::
+
+    python benchmarks/interval_read.py [--series 50] [--years 40] [--last 3] [--row-group-size 1024] [--repeat 5]
+"""
+
+import argparse
+import io
+import logging
+import tempfile
+import time
+from datetime import timedelta
+
+import pyarrow.parquet as pq
+
+from ssb_timeseries.dates import date_utc
+from ssb_timeseries.intervals import Interval
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import pyarrow_simple
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+
+class CountingFile(io.FileIO):
+    """A file object that counts the bytes read through it."""
+
+    bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read and count bytes."""
+        data = super().read(size)
+        CountingFile.bytes_read += len(data)
+        return data
+
+
+def counting_parquet_file(path: str) -> pq.ParquetFile:
+    """Open a local Parquet file through a byte counting file object."""
+    return pq.ParquetFile(CountingFile(path, "rb"))
+
+
+def measure(
+    handler: pyarrow_simple.FileSystem, interval: Interval | None, repeat: int
+) -> tuple[float, int, int]:
+    """Return best latency in seconds, bytes read and row count for a read."""
+    timings = []
+    for _ in range(repeat):
+        CountingFile.bytes_read = 0
+        started = time.perf_counter()
+        table = handler.read(interval=interval)
+        timings.append(time.perf_counter() - started)
+    return min(timings), CountingFile.bytes_read, table.num_rows
+
+
+def main() -> None:
+    """Write a sample dataset and compare full and interval reads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=50)
+    parser.add_argument("--years", type=int, default=40)
+    parser.add_argument("--last", type=int, default=3)
+    parser.add_argument("--row-group-size", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    end = date_utc("2024-12-31")
+    start = end - timedelta(days=365 * args.years)
+    data = create_df(
+        [f"s{i}" for i in range(args.series)],
+        start_date=start,
+        end_date=end,
+        freq="D",
+    )
+    tags = {
+        "name": "benchmark",
+        "versioning": "NONE",
+        "temporality": "AT",
+        "series": {c: {} for c in data.columns if c != "valid_at"},
+    }
+
+    with tempfile.TemporaryDirectory() as root:
+        handler = pyarrow_simple.FileSystem(
+            repository={
+                "directory": {
+                    "options": {"path": root, "row_group_size": args.row_group_size}
+                }
+            },
+            set_name="benchmark",
+            set_type=SeriesType.simple(),
+        )
+        handler.write(data=data, tags=tags)
+        metadata = pq.read_metadata(handler.fullpath)
+        print(
+            f"{metadata.num_rows} rows x {args.series} series, "
+            f"{metadata.num_row_groups} row groups, "
+            f"{fs.file_signature(handler.fullpath)[1]} bytes on disk"
+        )
+
+        fs.parquet_file = counting_parquet_file
+        interval = Interval(start=end - timedelta(days=365 * args.last))
+        full = measure(handler, None, args.repeat)
+        last = measure(handler, interval, args.repeat)
+
+    print(f"{'read':<12}{'latency ms':>12}{'bytes read':>14}{'rows':>10}")
+    for label, (seconds, bytes_read, rows) in [
+        ("full", full),
+        (f"last {args.last} y", last),
+    ]:
+        print(f"{label:<12}{seconds * 1000:>12.1f}{bytes_read:>14}{rows:>10}")
+    print(
+        f"interval read: {last[1] / full[1]:.1%} of bytes, "
+        f"{last[0] / full[0]:.1%} of latency"
+    )
+
+
+if __name__ == "__main__":
+    main()
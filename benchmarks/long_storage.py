@@ -0,0 +1,95 @@
+"""Compare long and wide storage of a sparse, very wide dataset.
+
+A monthly dataset with many series, most of them missing most of the time, is written with
+the simple (wide) Parquet handler and with the long Parquet handler.
+The script reports the file size, the time to parse the footer,
+and the latency (best of N) of a full read and of a read of a few series.
+
+Usage::
+
+    python benchmarks/long_storage.py [--series 20000] [--months 120] [--density 0.02] [--select 10] [--repeat 3]
+"""
+
+import argparse
+import logging
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from _common import best_of
+
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import pyarrow_long
+from ssb_timeseries.io import pyarrow_simple
+from ssb_timeseries.types import SeriesType
+
+
+def sparse_data(series: int, months: int, density: float) -> pd.DataFrame:
+    """Return a monthly frame where each value is present with the given probability."""
+    rng = np.random.default_rng(42)
+    values = rng.normal(100, 10, size=(months, series))
+    values[rng.random(size=values.shape) > density] = np.nan
+    frame = pd.DataFrame(values, columns=[f"series_{i:06d}" for i in range(series)])
+    frame.insert(
+        0,
+        "valid_at",
+        pd.date_range("2015-01-01", periods=months, freq="MS", tz="UTC"),
+    )
+    return frame
+
+
+def main() -> None:
+    """Write a sparse dataset with both handlers and compare size, footer parsing and reads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=20000)
+    parser.add_argument("--months", type=int, default=120)
+    parser.add_argument("--density", type=float, default=0.02)
+    parser.add_argument("--select", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    data = sparse_data(args.series, args.months, args.density)
+    names = [c for c in data.columns if c != "valid_at"]
+    tags = {
+        "name": "benchmark",
+        "versioning": "NONE",
+        "temporality": "AT",
+        "series": {
+            name: {"name": name, "unit": "NOK", "source": "benchmark"} for name in names
+        },
+    }
+    selected = names[:: max(1, len(names) // args.select)][: args.select]
+    print(
+        f"{args.months} months x {args.series} series, "
+        f"{int(data[names].notna().sum().sum())} values"
+    )
+
+    print(
+        f"{'handler':<10}{'file bytes':>14}{'footer ms':>12}"
+        f"{'read all ms':>14}{'read ' + str(len(selected)) + ' ms':>12}"
+    )
+    for label, handler_class in [
+        ("wide", pyarrow_simple.FileSystem),
+        ("long", pyarrow_long.LongFileSystem),
+    ]:
+        with tempfile.TemporaryDirectory() as root:
+            handler = handler_class(
+                repository={"directory": {"options": {"path": root}}},
+                set_name="benchmark",
+                set_type=SeriesType.simple(),
+            )
+            handler.write(data=data, tags=tags)
+            size = fs.file_signature(handler.fullpath)[1]
+            footer = best_of(args.repeat, pq.read_metadata, handler.fullpath)
+            full = best_of(args.repeat, handler.read)
+            subset = best_of(args.repeat, handler.read, columns=selected)
+        print(
+            f"{label:<10}{size:>14}{footer * 1000:>12.1f}"
+            f"{full * 1000:>14.1f}{subset * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Measure peak memory for reading a local dataset and summing its numeric matrix.
+
+An hourly dataset of roughly the requested size is written to a temporary directory.
+Each read method then runs in a fresh process that reads the file,
+builds the numeric matrix and sums it, and reports its peak resident set size (RSS):
+
+* 'narwhals': ``narwhals.read_parquet`` followed by ``select(...).to_numpy()``.
+* 'table': a (memory mapped) read with the simple Parquet handler followed by ``numeric_matrix(..., read_only=True)``.
+* 'stream': ``read_numeric()`` of the simple Parquet handler, which fills the matrix one row group at a time.
+  This is what ``Dataset.numeric_array(read_only=True)`` does for a dataset opened with ``Dataset.open()``.
+
+Usage::
+
+    python benchmarks/memory_read.py [--megabytes 200] [--series 200]
+"""
+
+import argparse
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from datetime import timedelta
+
+import numpy as np
+
+from ssb_timeseries.dates import date_utc
+from ssb_timeseries.io import pyarrow_simple
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+METHODS = ("narwhals", "table", "stream")
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of this process in bytes.
+
+    On Linux this is read from /proc, since ``ru_maxrss`` is inherited from the parent process across exec.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run_child(method: str, root: str) -> None:
+    """Read the dataset with one method, sum it and print the peak RSS increase."""
+    logging.disable(logging.INFO)
+    handler = pyarrow_simple.FileSystem(
+        repository={"directory": {"options": {"path": root}}},
+        set_name="benchmark",
+        set_type=SeriesType.simple(),
+    )
+    baseline = peak_rss_bytes()
+    if method == "narwhals":
+        import narwhals as nw
+        import narwhals.selectors as ncs
+
+        frame = nw.read_parquet(handler.fullpath, backend="pyarrow")
+        total = frame.select(ncs.numeric()).to_numpy().sum()
+    elif method == "table":
+        from ssb_timeseries.dataframes import numeric_matrix
+
+        total = numeric_matrix(handler.read(), read_only=True).sum()
+    else:
+        total = handler.read_numeric().sum()
+    print(peak_rss_bytes() - baseline, float(total))
+
+
+def main() -> None:
+    """Write a sample dataset and compare the peak memory of the read methods."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=200)
+    parser.add_argument("--series", type=int, default=200)
+    parser.add_argument("--child", choices=METHODS)
+    parser.add_argument("--root")
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.child, args.root)
+        return
+    logging.disable(logging.INFO)
+
+    rows = args.megabytes * 1024 * 1024 // (8 * args.series)
+    end = date_utc("2024-12-31")
+    names = [f"s{i}" for i in range(args.series)]
+    data = create_df(
+        names, start_date=end - timedelta(hours=rows - 1), end_date=end, freq="h"
+    )
+    data[names] = np.random.default_rng(0).random((len(data), len(names)))
+    tags = {
+        "name": "benchmark",
+        "versioning": "NONE",
+        "temporality": "AT",
+        "series": {n: {} for n in names},
+    }
+
+    with tempfile.TemporaryDirectory() as root:
+        handler = pyarrow_simple.FileSystem(
+            repository={"directory": {"options": {"path": root}}},
+            set_name="benchmark",
+            set_type=SeriesType.simple(),
+        )
+        handler.write(data=data, tags=tags)
+        file_size = os.path.getsize(handler.fullpath)
+        del data
+        print(f"{rows} rows x {args.series} series, {file_size} bytes on disk")
+        print(f"{'method':<10}{'peak RSS MB':>14}{'x file size':>14}")
+        for method in METHODS:
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", method, "--root", root],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+            rss = int(output[0])
+            print(f"{method:<10}{rss / 2**20:>14.1f}{rss / file_size:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
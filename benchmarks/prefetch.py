@@ -0,0 +1,124 @@
+"""Compare processing catalog search results with and without reading ahead in :py:meth:`~ssb_timeseries.catalog.Catalog.iter_datasets`.
+
+Datasets are written to a repository in a temporary directory, configured through a temporary configuration file.
+To mimic object storage, a latency is injected in every :py:func:`~ssb_timeseries.io.fs.parquet_file` call,
+and processing each dataset is mimicked by sleeping for a fixed time.
+The script reports the time (best of N) to process all the datasets:
+
+* 'get each': :py:meth:`~ssb_timeseries.catalog.CatalogItem.get` for each item of the search result, in turn.
+* 'prefetch/k': :py:meth:`~ssb_timeseries.catalog.Catalog.iter_datasets` reading k datasets ahead.
+
+Usage::
+
+    python benchmarks/prefetch.py [--datasets 50] [--latency-ms 50] [--compute-ms 50] [--repeat 3]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from _common import best_of
+from _common import configure
+
+import ssb_timeseries as ts
+from ssb_timeseries import config
+from ssb_timeseries import io
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import json_metadata
+from ssb_timeseries.io import pyarrow_simple
+from ssb_timeseries.sample_data import create_df
+from ssb_timeseries.types import SeriesType
+
+_parquet_file = fs.parquet_file
+_latency = 0.0
+_compute = 0.0
+
+
+def slow_parquet_file(path: str, *args: Any, **kwargs: Any) -> Any:
+    """Open a Parquet file after sleeping for the injected latency."""
+    time.sleep(_latency)
+    return _parquet_file(path, *args, **kwargs)
+
+
+def write_datasets(repository: dict, datasets: int) -> list[str]:
+    """Write small datasets with metadata, and return their names."""
+    names = []
+    for d in range(datasets):
+        name = f"set_{d:05d}"
+        df = create_df(
+            [f"{name}_x", f"{name}_y", f"{name}_z"],
+            start_date="2020-01-01",
+            end_date="2024-12-01",
+            freq="MS",
+        )
+        tags = {
+            "name": name,
+            "versioning": "NONE",
+            "temporality": "AT",
+            "series": {c: {"name": c, "dataset": name} for c in df.columns[1:]},
+        }
+        pyarrow_simple.FileSystem(
+            repository=repository, set_name=name, set_type=SeriesType.simple()
+        ).write(data=df, tags=tags)
+        json_metadata.JsonMetaIO(repository=repository).write(tags=tags, set_name=name)
+        names.append(name)
+    return names
+
+
+def get_each() -> None:
+    """Get and process each dataset of the search result in turn."""
+    for item in ts.get_catalog().datasets():
+        item.get()
+        time.sleep(_compute)
+
+
+def iter_datasets(prefetch: int) -> None:
+    """Process the datasets of the search result, reading ahead."""
+    for _ in ts.get_catalog().iter_datasets(prefetch=prefetch):
+        time.sleep(_compute)
+
+
+def main() -> None:
+    """Write datasets and time processing them with and without reading ahead."""
+    global _latency, _compute
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--compute-ms", type=float, default=50.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    previous_config = os.environ.get(config.ENV_VAR_NAME, "")
+    with tempfile.TemporaryDirectory() as root:
+        repository = configure(Path(root))
+        write_datasets(repository, args.datasets)
+        io.search()  # builds the catalog index
+
+        _latency = args.latency_ms / 1000
+        _compute = args.compute_ms / 1000
+        fs.parquet_file = slow_parquet_file
+        print(
+            f"{args.datasets} datasets, {args.latency_ms:.0f} ms latency per read, "
+            f"{args.compute_ms:.0f} ms processing per dataset"
+        )
+        print(f"{'method':>16}{'seconds':>10}{'speedup':>10}")
+        baseline = best_of(args.repeat, get_each)
+        print(f"{'get each':>16}{baseline:>10.2f}{1:>10.1f}")
+        for prefetch in (1, 2, 4):
+            seconds = best_of(args.repeat, iter_datasets, prefetch)
+            label = f"prefetch/{prefetch}"
+            print(f"{label:>16}{seconds:>10.2f}{baseline / seconds:>10.1f}")
+
+    if previous_config:
+        config.active_file(previous_config)
+    else:
+        config.unset_env_var()
+
+
+if __name__ == "__main__":
+    main()
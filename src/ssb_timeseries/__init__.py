@@ -33,14 +33,83 @@ The :py:mod:`ssb_timeseries.io` seeks to make the storage agnostic of whether da
 
 from __future__ import annotations
 
-from ssb_timeseries.catalog import get_catalog
-from ssb_timeseries.config import Config
-from ssb_timeseries.logging import set_up_logging_according_to_config
+import importlib
+from logging import getLogger
+from typing import TYPE_CHECKING
+from typing import Any
 
-get_configuration = Config.active
-"""Return the active configuration."""
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from logging import Logger
 
-logger = set_up_logging_according_to_config(__name__, get_configuration().logging)
+    from ssb_timeseries.catalog import get_catalog
+    from ssb_timeseries.config import Config
+    from ssb_timeseries.dataset import Dataset
+    from ssb_timeseries.io import SaveResult
+
+    logger: Logger
+
+# Note that the submodule ssb_timeseries.logging shadows the standard library
+# module name here once imported, hence getLogger is imported directly.
+# Submodules and heavy dependencies are imported on first access,
+# so that importing the package stays cheap for short lived processes.
+_SUBMODULES = {
+    "catalog",
+    "config",
+    "dataframes",
+    "dataset",
+    "dates",
+    "intervals",
+    "io",
+    "meta",
+    "sample_data",
+    "sample_metadata",
+    "types",
+}
+
+
+def get_configuration() -> Config:
+    """Return the active configuration."""
+    from ssb_timeseries.config import Config
+
+    return Config.active()
+
+
+def save_all(datasets: Iterable[Dataset], **kwargs: Any) -> SaveResult:
+    """Save several datasets at once, with concurrent writes and one metadata batch per repository.
+
+    This is much faster than calling :py:meth:`~ssb_timeseries.dataset.Dataset.save` for each dataset.
+    An error saving one dataset does not stop the others from being saved;
+    the errors are returned by dataset name. See :py:func:`ssb_timeseries.io.save_many`.
+
+    Examples:
+        >>> import ssb_timeseries as ts
+        >>> result = ts.save_all([x, y, z])  # doctest: +SKIP
+        >>> result.errors  # doctest: +SKIP
+        {}
+    """
+    from ssb_timeseries.io import save_many
+
+    return save_many(datasets, **kwargs)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve submodules, :py:func:`get_catalog` and the package logger on first access.
+
+    Configuration and logging are set up the first time the active configuration is loaded.
+    """
+    value: Any
+    if name == "logger":
+        get_configuration()
+        value = getLogger(__name__)
+    elif name == "get_catalog":
+        from ssb_timeseries.catalog import get_catalog as value
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -52,5 +121,6 @@ __all__ = [
     "io",
     "logger",
     "sample_data",
+    "save_all",
     "types",
 ]
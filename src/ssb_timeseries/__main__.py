@@ -13,15 +13,30 @@ import click
 from ssb_timeseries.config import Config
 
 
-@click.command()
-def main() -> None:
+@click.group(invoke_without_command=True)
+@click.pass_context
+def main(ctx: click.Context) -> None:
     """Validate and print the active configuration."""
+    if ctx.invoked_subcommand is not None:
+        return
     active_config = Config.active()
     print(active_config)
     # perform set up steps:
     # os.environ["TIMESERIES_CONFIG"] = DEFAULT_CONFIG_LOCATION
 
 
+@main.command("rebuild-manifests")
+@click.option(
+    "--repository", default="", help="Repository name. Defaults to all repositories."
+)
+def rebuild_manifests(repository: str) -> None:
+    """Rebuild the version manifests of the datasets in the configured repositories."""
+    from ssb_timeseries import io
+
+    count = io.rebuild_manifests(repository)
+    print(f"Rebuilt version manifests for {count} datasets.")
+
+
 if __name__ == "__main__":
     """Running `python timeseries` or `python -m timeseries` should run or validate setup."""
     main()
@@ -16,9 +16,11 @@ A returned py:class:`CatalogItem` instance is identified by name and descriptive
 from __future__ import annotations
 
 import importlib.resources as pkg_resources  # noqa: F401
+from collections.abc import Iterator
 from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from typing import Any
 from typing import Protocol
 from typing import runtime_checkable
@@ -26,6 +28,9 @@ from typing import runtime_checkable
 from ssb_timeseries.config import Config
 from ssb_timeseries.config import FileBasedRepository
 from ssb_timeseries.io import MetaIO
+from ssb_timeseries.io import gather_limited
+from ssb_timeseries.io import prefetched
+from ssb_timeseries.io import run_async
 from ssb_timeseries.logging import logger
 from ssb_timeseries.meta import TagDict
 from ssb_timeseries.meta import matches_criteria
@@ -99,17 +104,52 @@ class CatalogItem:
             other.object_name,
         )
 
-    def get(self) -> Any:  # NOSONAR
-        """Return the dataset."""
+    def get(
+        self,
+        lazy: bool = False,
+        columns: str | list[str] | None = None,
+        **kwargs: Any,
+    ) -> Any:  # NOSONAR
+        """Return the dataset, or for a series, its dataset with only that series.
+
+        Args:
+            lazy: If True, read the metadata only, and defer reading data until it is first accessed.
+                See :py:meth:`~ssb_timeseries.dataset.Dataset.open`.
+            columns: Read only these series of a dataset (and the date columns).
+            **kwargs: Passed to :py:class:`~ssb_timeseries.dataset.Dataset`, eg ``interval`` or ``as_of_tz``.
+        """
         from ssb_timeseries.dataset import Dataset
 
         if self.object_type == "dataset":
-            return Dataset(self.object_name)
+            return Dataset(
+                self.object_name,
+                repository=self.repository_name or "",
+                lazy=lazy,
+                columns=columns,
+                **kwargs,
+            )
         elif self.object_type == "series":
-            return Dataset(self.parent.object_name).select(pattern=self.object_name)  # type: ignore[no-untyped-call]
+            parent = getattr(self.parent, "object_name", self.parent)
+            return Dataset(
+                parent,
+                repository=self.repository_name or "",
+                lazy=lazy,
+                columns=[self.object_name],
+                **kwargs,
+            ).select(pattern=self.object_name)  # type: ignore[no-untyped-call]
         else:
             raise TypeError(f"Can not retrieve object of type '{self.object_type}'.")
 
+    def _get_noted(self, **kwargs: Any) -> Any:
+        """Return the object like :py:meth:`get`, noting its name on errors."""
+        try:
+            return self.get(**kwargs)
+        except Exception as e:
+            e.add_note(
+                f"Reading {self.object_type} '{self.object_name}' from repository {self.repository_name}."
+            )
+            raise
+
     def has_tags(self, tags: Any) -> bool:
         """Check if the catalog item has all tags provided in criteria."""
         if tags is None:
@@ -171,6 +211,46 @@ class _CatalogProtocol(Protocol):
         """
         ...
 
+    async def adatasets(self, **kwargs) -> list[CatalogItem]:
+        """Asynchronous variant of :py:meth:`datasets`, with the same search criteria."""
+        return await run_async(self.datasets, **kwargs)
+
+    def iter_datasets(
+        self,
+        *,
+        prefetch: int = 2,
+        lazy: bool = False,
+        columns: str | list[str] | None = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Search for datasets like :py:meth:`datasets`, and yield them one at a time, reading the next ones in the background.
+
+        While the caller processes one dataset, the next ``prefetch`` are read in background threads,
+        so I/O and computation overlap. At most ``prefetch`` datasets are held besides the one being processed,
+        and a dataset is released as soon as the caller drops it.
+        See :py:func:`~ssb_timeseries.io.prefetched`.
+
+        Args:
+            prefetch: The number of datasets to read ahead. With 0, each dataset is read when it is requested.
+            lazy: Passed to :py:meth:`CatalogItem.get`.
+            columns: Passed to :py:meth:`CatalogItem.get`.
+            **kwargs: Search criteria, as for :py:meth:`datasets`.
+
+        Examples:
+            >>> import ssb_timeseries as ts
+            >>> for ds in ts.get_catalog().iter_datasets(tags={'A': 'a1'}, prefetch=4):  # doctest: +SKIP
+            ...     process(ds)
+        """
+        items = self.datasets(**kwargs)
+        return prefetched(
+            (partial(i._get_noted, lazy=lazy, columns=columns) for i in items),
+            prefetch=prefetch,
+        )
+
+    async def aseries(self, **kwargs) -> list[CatalogItem]:
+        """Asynchronous variant of :py:meth:`series`, with the same search criteria."""
+        return await run_async(self.series, **kwargs)
+
     def series(
         self,
         *,
@@ -305,6 +385,26 @@ class Catalog(_CatalogProtocol):
 
         return result
 
+    async def adatasets(self, **kwargs) -> list[CatalogItem]:
+        # Inherit docs from protocol.
+        # Repositories are searched concurrently, results are kept in repository order.
+        repository = kwargs.pop("repository", "")
+        if repository:
+            repos_to_search = [r for r in self.repositories if r.name == repository]
+        else:
+            repos_to_search = self.repositories
+        found = await gather_limited(
+            partial(r.adatasets, **kwargs) for r in repos_to_search
+        )
+        return [item for items in found for item in items]
+
+    async def aseries(self, **kwargs) -> list[CatalogItem]:
+        # Inherit docs from protocol.
+        found = await gather_limited(
+            partial(r.aseries, **kwargs) for r in self.repositories
+        )
+        return [item for items in found for item in items]
+
     def series(
         self,
         **kwargs,
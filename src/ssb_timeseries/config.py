@@ -1,7 +1,7 @@
 """Configurations for the SSB timeseries library.
 
 An environment variable TIMESERIES_CONFIG is expected to point to a JSON file with configurations.
-If these exist, they will be loaded and put into a Config object CONFIG when the configuration module is loaded.
+If these exist, they will be loaded and put into a Config object CONFIG the first time it is accessed.
 
 In most cases, this would happen behind the scene when :py:mod:`ssb_timeseries.dataset` or :py:mod:`ssb_timeseries.catalog` are imported.
 
@@ -32,8 +32,10 @@ import json
 import logging
 import os
 import sys
+import threading
 import warnings
 from pathlib import Path
+from typing import NamedTuple
 
 try:
     from typing import NotRequired
@@ -470,6 +472,7 @@ class Config:
             fs.touch(self.log_file)
 
         active_file(str(path))
+        _CONFIG_CACHE.clear()
 
     def __getitem__(self, item: str) -> Any | None:
         """Get the value of a configuration."""
@@ -488,8 +491,95 @@ class Config:
 
     @classmethod
     def active(cls) -> Self:
-        """Force reload the file identified by :py:const:`ENV_VAR_NAME` and return the configuration."""
-        return cls(configuration_file=active_file())
+        """Return the configuration in the file identified by :py:const:`ENV_VAR_NAME`.
+
+        The parsed configuration is cached for the process, keyed on the environment variable value and the path, modification time and size of the file.
+        The file is only read again when one of these change, or after :py:meth:`refresh`.
+        Each call returns an independent copy, so changes to the returned object do not leak into the cache.
+        """
+        return _CONFIG_CACHE.get(cls)
+
+    @classmethod
+    def refresh(cls) -> Self:
+        """Discard the cached configuration, reload the file identified by :py:const:`ENV_VAR_NAME` and return the configuration."""
+        _CONFIG_CACHE.clear()
+        return cls.active()
+
+    @staticmethod
+    def cache_info() -> ConfigCacheInfo:
+        """Return hit and reload counters for the configuration cache used by :py:meth:`active`."""
+        return _CONFIG_CACHE.info()
+
+
+class ConfigCacheInfo(NamedTuple):
+    """Counters for the configuration cache."""
+
+    hits: int
+    reloads: int
+
+
+class _ConfigCache:
+    """Process wide cache for the active configuration."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._key: tuple | None = None
+        self._config: Config | None = None
+        self._initialized = False
+        self.hits = 0
+        self.reloads = 0
+
+    @staticmethod
+    def _key_for(path: str) -> tuple | None:
+        """Identify the current state of the configuration file; None if it can not be identified."""
+        from .io import fs
+
+        signature = fs.file_signature(path) if path else ()
+        if signature is None:
+            return None
+        return (os.environ.get(ENV_VAR_NAME, ""), path, signature)
+
+    def get(self, cls: type[Config]) -> Config:
+        path = active_file()
+        key = self._key_for(path)
+        with self._lock:
+            if key is not None and key == self._key and self._config is not None:
+                self.hits += 1
+                return copy.deepcopy(self._config)
+
+        configuration = cls(configuration_file=path)
+        with self._lock:
+            self.reloads += 1
+            first_load = not self._initialized
+            self._initialized = True
+            if key is not None:
+                self._key = key
+                self._config = copy.deepcopy(configuration)
+        if first_load:
+            _set_up_package_logging(configuration)
+        return configuration
+
+    def clear(self) -> None:
+        with self._lock:
+            self._key = None
+            self._config = None
+
+    def info(self) -> ConfigCacheInfo:
+        with self._lock:
+            return ConfigCacheInfo(hits=self.hits, reloads=self.reloads)
+
+
+_CONFIG_CACHE = _ConfigCache()
+
+
+def _set_up_package_logging(configuration: Config) -> None:
+    """Ensure the log file exists and set up package logging; done on the first load of the active configuration."""
+    from .io import fs
+    from .logging import set_up_logging_according_to_config
+
+    if configuration.log_file:
+        fs.touch(configuration.log_file)
+    set_up_logging_according_to_config(PACKAGE_NAME, configuration.logging)
 
 
 class MissingEnvironmentVariableError(Exception):
@@ -587,6 +677,34 @@ def path_str(*args) -> str:
     return str(Path(*args))
 
 
+def _initial_config() -> Config:
+    """Load the active configuration the first time :py:data:`CONFIG` is accessed."""
+    from .io import fs
+
+    configuration_file = active_file()
+    if configuration_file and not fs.exists(configuration_file):
+        if DAPLA_TEAM_CONTEXT:
+            raise MissingEnvironmentVariableError(
+                f"Environment variable {ENV_VAR_NAME} must be defined and point to a configuration file."
+            )
+        _config_logger.warning(
+            f"No configuration file was found at {configuration_file}.\nOther locations may be tried. Files found will be copied to the default location and the first candidate will be set to active, ie copied once more to {DEFAULTS['configuration_file']}"
+        )
+        raise FileNotFoundError(
+            f"No configuration file was found at {configuration_file}."
+        )
+    return Config.active()
+
+
+def __getattr__(name: str) -> Any:
+    """Load :py:data:`CONFIG` on first access rather than when the module is imported."""
+    if name == "CONFIG":
+        value = _initial_config()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
     """Execute when called directly, ie not via import statements."""
     # ??? `poetry run timeseries-config <option>` does not appear to go this route.
@@ -594,30 +712,3 @@ if __name__ == "__main__":
     print(f"Name of the script      : {sys.argv[0]=}")
     print(f"Arguments of the script : {sys.argv[1:]=}")
     main(sys.argv[1])
-else:
-    from .io import fs
-
-    if active_file():
-        if fs.exists(active_file()):
-            CONFIGFILE = active_file()
-        elif DAPLA_TEAM_CONTEXT:
-            raise MissingEnvironmentVariableError(
-                f"Environment variable {ENV_VAR_NAME} must be defined and point to a configuration file."
-            )
-        else:
-            _config_logger.warning(
-                f"No configuration file was found at {active_file()}.\nOther locations may be tried. Files found will be copied to the default location and the first candidate will be set to active, ie copied once more to {DEFAULTS['configuration_file']}"
-            )
-            if not fs.exists(CONFIGFILE):
-                raise FileNotFoundError(
-                    f"No configuration file was found at {active_file()}."
-                )
-    else:
-        CONFIGFILE = ""  # PRESETS["defaults"]["configuration_file"]
-
-    active_file(CONFIGFILE)
-    CONFIG = Config(configuration_file=CONFIGFILE)
-    """A Config object."""
-    fs.touch(CONFIG.log_file)
-    # do not save
-    # CONFIG.save()
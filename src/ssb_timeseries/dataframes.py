@@ -8,7 +8,7 @@ from typing import Literal
 from typing import cast
 
 import narwhals as nw
-import polars as pl
+import narwhals.selectors as ncs
 import pyarrow
 from narwhals.typing import Frame
 from narwhals.typing import FrameT
@@ -230,6 +230,72 @@ def to_numpy(
         )
 
 
+def numeric_matrix(
+    df: IntoFrame,
+    series: str | list[str] | None = None,
+    read_only: bool = False,
+) -> NDArray:
+    """Return the numeric and boolean columns of a dataframe as a 2D NumPy array.
+
+    Optionally, series names can be provided to get a subset of columns.
+
+    For PyArrow tables where all selected columns are float64, the array is filled column by column
+    directly from the Arrow buffers into a column-major (Fortran ordered) matrix, without intermediate copies.
+    If ``read_only`` is True, the array is flagged as not writeable,
+    and a single column without nulls in a single chunk is returned as a zero-copy view of the Arrow buffer.
+    Other frames are converted via Narwhals.
+    """
+    import numpy as np
+
+    if isinstance(series, str):
+        series = [series] if series else None
+
+    if isinstance(df, pyarrow.Table):
+        fields = [
+            f
+            for f in df.schema
+            if pyarrow.types.is_integer(f.type)
+            or pyarrow.types.is_floating(f.type)
+            or pyarrow.types.is_boolean(f.type)
+        ]
+        if series:
+            fields = [f for f in fields if f.name in series]
+        if all(f.type == pyarrow.float64() for f in fields):
+            columns = [df.column(f.name) for f in fields]
+            if read_only and len(columns) == 1 and columns[0].num_chunks == 1:
+                chunk = columns[0].chunk(0)
+                if chunk.null_count == 0:
+                    return chunk.to_numpy(zero_copy_only=True).reshape(-1, 1)
+            matrix = np.empty((df.num_rows, len(columns)), dtype="float64", order="F")
+            fill_matrix(matrix, columns)
+            if read_only:
+                matrix.flags.writeable = False
+            return matrix
+
+    nw_df = nw.from_native(df)
+    numeric_columns = nw_df.select(ncs.numeric() | ncs.boolean()).columns
+    if series:
+        numeric_columns = [c for c in numeric_columns if c in series]
+    matrix = nw_df.select(numeric_columns).to_numpy()
+    if read_only:
+        matrix.flags.writeable = False
+    return cast(NDArray, matrix)
+
+
+def fill_matrix(
+    matrix: NDArray,
+    columns: list[pyarrow.ChunkedArray],
+    row_offset: int = 0,
+) -> None:
+    """Copy Arrow columns into the columns of a preallocated matrix, starting at a row offset."""
+    for i, column in enumerate(columns):
+        offset = row_offset
+        for chunk in column.chunks:
+            length = len(chunk)
+            matrix[offset : offset + length, i] = chunk.to_numpy(zero_copy_only=False)
+            offset += length
+
+
 def merge_data(
     old: IntoFrameT,
     new: IntoFrameT,
@@ -242,6 +308,8 @@ def merge_data(
     For `FROM_TO` temporality, it uses an anti-join to replace rows with matching
     `valid_from` and `valid_to` pairs.
     """
+    import polars as pl
+
     new_utc = standardize_dates(new)
     old_utc = standardize_dates(old)
     new_pl = cast(nw.DataFrame, nw.from_native(new_utc)).to_polars()
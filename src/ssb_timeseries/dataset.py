@@ -38,7 +38,6 @@ try:
 except ImportError:
     from typing_extensions import Self  # noqa: UP035 #backport to 3.10
 
-import matplotlib.pyplot as plt  # noqa: F401
 import narwhals as nw
 import narwhals.selectors as ncs
 import numpy as np
@@ -61,6 +60,7 @@ from .dataframes import empty_frame
 from .dataframes import infer_datatype
 from .dataframes import is_df_like
 from .dataframes import is_empty
+from .dataframes import numeric_matrix
 from .dataframes import rename_columns
 from .dates import date_local
 from .dates import date_utc
@@ -76,6 +76,9 @@ if TYPE_CHECKING:
     import pandas as pd
     import polars as pl
 
+    from .intervals import Interval
+    from .meta import TagDict
+
 # mypy: disable-error-code="assignment,attr-defined,union-attr,arg-type,call-overload,no-untyped-call,dict-item,no-untyped-def,no-any-return"
 # ruff: noqa: RUF013
 
@@ -166,11 +169,13 @@ class Dataset:
     name: str
     as_of_utc: datetime | None
     data_type: SeriesType
-    data: Any
     tags: dict
     repository: str
     sharing: dict | None
     lineage: str | None
+    _data: Any = None
+    _pending_read: dict[str, Any] | None = None
+    _pending_tags: dict[str, Any] | None = None
 
     def __init__(
         self,
@@ -208,6 +213,10 @@ class Dataset:
         :keyword list[str] attributes: Attribute names for use with :py:class:`~Dataset.series_names_to_tags` in combination with either ``separator`` or ``regex``.
         :keyword str separator: Character(s) separating ``attributes`` for use with :py:class:`~Dataset.series_names_to_tags`.
         :keyword str regex: Regular expression with capture groups corresponding to ``attributes``. Used instead of the separator to match more complicated name patterns in :py:class:`~Dataset.series_names_to_tags`.
+        :keyword Interval interval: When loading an existing set, read only data within this :py:class:`~ssb_timeseries.intervals.Interval`. Row groups outside the interval are not read from storage.
+        :keyword list[str] series: When loading an existing set, read only these series (and the date columns) from storage. ``columns`` is accepted as an alias.
+        :keyword dict tags: When loading an existing set, read only series with matching tags. The criteria are resolved against the stored metadata before reading, and combined with ``series`` by OR. The tags of all series in the set are retained.
+        :keyword bool lazy: When loading an existing set, read metadata only and defer reading data until :py:attr:`data` is first accessed. See :py:meth:`open`.
 
         .. admonition:: Maintaining tags
            :class: more dropdown
@@ -316,8 +325,22 @@ class Dataset:
         kwarg_data = kwargs.get("data", None)
         if is_df_like(kwarg_data) and not is_empty(kwarg_data):
             self.data = kwarg_data
+        elif find_existing and kwargs.get("lazy", False):
+            self.data = empty_frame()
+            self._pending_read = {
+                "interval": kwargs.get("interval"),
+                "series": io.select_series(
+                    self.tags,
+                    series=kwargs.get("series", kwargs.get("columns")),
+                    tags=kwargs.get("tags"),
+                ),
+            }
         elif find_existing:  # and self.data_type.versioning == types.Versioning.AS_OF:
-            self.data = io.DataIO(self).dh.read()
+            self.data = io.DataIO(self).read(
+                interval=kwargs.get("interval"),
+                series=kwargs.get("series", kwargs.get("columns")),
+                tags=kwargs.get("tags"),
+            )
         else:
             self.data = empty_frame()
 
@@ -339,16 +362,142 @@ class Dataset:
             "separator": separator,
             "regex": regex,
         }
-        if not is_empty(self.data):
+        if self.data_is_loaded and not is_empty(self.data):
             self.tag_series(tags=apply_to_all)
             if ready_to_auto_tag:
                 self.series_names_to_tags()
+        elif not self.data_is_loaded and (apply_to_all or ready_to_auto_tag):
+            # applied by the deferred read, see `data`
+            self._pending_tags = {
+                "series_tags": apply_to_all,
+                "auto_tag": ready_to_auto_tag,
+            }
 
         # "owner" / sharing / access
         self.product: str = kwargs.get("product", "")
         self.process_stage: str = kwargs.get("process_stage", "")
         self.sharing: dict[str, str] = kwargs.get("sharing", {})
 
+    @classmethod
+    def open(
+        cls,
+        name: str,
+        as_of_tz: datetime | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Open an existing dataset without reading its data.
+
+        Metadata is read immediately, so that :py:attr:`tags`, :py:attr:`series`, :py:attr:`data_type` and :py:meth:`versions` are available without touching the data files.
+        Data is read on first access to :py:attr:`data`, directly or through any operation that uses it (eg :py:attr:`np`, :py:attr:`pa`, :py:meth:`select` or math operations).
+
+        Keyword arguments are passed to :py:class:`Dataset`, so that ``repository``, ``interval``, ``series`` and ``tags`` apply to the deferred read.
+
+        Examples:
+            >>> from ssb_timeseries.dataset import Dataset
+            >>> x = Dataset.open('mydataset')  # doctest: +SKIP
+            >>> x.series  # answered from metadata # doctest: +SKIP
+            >>> x.data  # read from storage now # doctest: +SKIP
+        """
+        return cls(name, as_of_tz, lazy=True, **kwargs)
+
+    @classmethod
+    def load_many(
+        cls,
+        names: Iterable[str],
+        as_of_tz: datetime | None = None,
+        *,
+        repository: str = "",
+        max_workers: int = io.fs.MAX_CONCURRENT_READS,
+        **kwargs: Any,
+    ) -> dict[str, Self]:
+        """Read several existing datasets at once, and return them by name.
+
+        This is much faster than creating each :py:class:`Dataset` in turn:
+        metadata for all the sets is resolved with one catalog search per repository,
+        and the data is read concurrently on up to ``max_workers`` threads.
+        See :py:func:`ssb_timeseries.io.read_many`, which can also return the data as one combined table.
+
+        Keyword arguments ``interval``, ``series`` (or ``columns``) and ``tags`` limit what is read, as for :py:class:`Dataset`.
+
+        Examples:
+            >>> from ssb_timeseries.dataset import Dataset
+            >>> sets = Dataset.load_many(['x', 'y', 'z'], series=['a', 'b'])  # doctest: +SKIP
+            >>> sets['x'].data  # doctest: +SKIP
+        """
+        stored = io.read_many(
+            names,
+            repository=repository,
+            as_of_tz=as_of_tz,
+            max_workers=max_workers,
+            **kwargs,
+        )
+        return {name: cls._from_stored(s) for name, s in stored.items()}
+
+    @classmethod
+    def _from_stored(cls, stored: io.StoredDataset) -> Self:
+        """Create a dataset from data and metadata that are already read, without looking it up again."""
+        out = cls(
+            stored.name,
+            stored.as_of_utc,
+            data_type=SeriesType(stored.tags["versioning"], stored.tags["temporality"]),
+            repository=stored.repository,
+            find_existing=False,
+            data=stored.data,
+        )
+        out.tags = out.default_tags()
+        out.tags.update(stored.tags)
+        return out
+
+    @classmethod
+    async def aopen(
+        cls,
+        name: str,
+        as_of_tz: datetime | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Asynchronously retrieve an existing dataset.
+
+        Metadata and data are read in the I/O thread pool of :py:func:`ssb_timeseries.io.run_async`, so the event loop is not blocked.
+        Unlike :py:meth:`open`, the data is read before the dataset is returned, since a deferred read would block on first access to :py:attr:`data`.
+        Pass ``lazy=True`` to defer it anyway.
+
+        Keyword arguments are passed to :py:class:`Dataset`.
+
+        Examples:
+            >>> from ssb_timeseries.dataset import Dataset
+            >>> x = await Dataset.aopen('mydataset')  # doctest: +SKIP
+        """
+        return await io.run_async(cls, name, as_of_tz, **kwargs)
+
+    @property
+    def data(self) -> Any:
+        """A dataframe with one or more datetime columns and a column per series in the set.
+
+        For datasets opened in lazy mode, the data is read from storage on first access,
+        and the ``series_tags`` and auto tag arguments given when the dataset was opened are applied then.
+        """
+        if self._pending_read is not None:
+            read_args, self._pending_read = self._pending_read, None
+            logger.debug("DATASET %s: reading deferred data.", self.name)
+            self._data = io.DataIO(self).read(**read_args)
+            pending_tags, self._pending_tags = self._pending_tags, None
+            if pending_tags is not None and not is_empty(self._data):
+                self.tag_series(tags=pending_tags["series_tags"])
+                if pending_tags["auto_tag"]:
+                    self.series_names_to_tags()
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._pending_read = None
+        self._pending_tags = None
+        self._data = value
+
+    @property
+    def data_is_loaded(self) -> bool:
+        """False if the dataset was opened in lazy mode and the data is not yet read."""
+        return self._pending_read is None
+
     def copy(
         self,
         new_name: str = "",
@@ -453,6 +602,17 @@ class Dataset:
 
         io.save(self)
 
+    async def asave(self, as_of_tz: datetime = None) -> None:
+        """Asynchronously persist the Dataset, without blocking the event loop.
+
+        Args:
+            as_of_tz (datetime): See :py:meth:`save`.
+        """
+        if as_of_tz is not None:
+            self.as_of_utc = date_utc(as_of_tz)
+
+        await io.asave(self)
+
     def snapshot(self) -> None:
         """Copy data snapshot to immutable processing stage bucket and shared buckets.
 
@@ -463,6 +623,34 @@ class Dataset:
         """
         io.persist(self)  # is 'archive' a better name than 'persist' or 'snapshot'?
 
+    def read_versions(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        interval: Interval | None = None,
+        series: str | list[str] | None = None,
+        tags: TagDict | list[TagDict] | None = None,
+    ) -> pa.Table:
+        """Read all versions with 'as of' dates from ``from_`` to ``to`` (inclusive) into one table.
+
+        The table has an 'as_of' column in addition to the date and series columns, and is sorted by 'as_of' and date.
+        This is convenient for revision analysis, and much faster than opening each version as a separate Dataset.
+        The data of the Dataset itself is not changed.
+
+        Args:
+            from_: The first 'as of' date to include. If None, starts at the first version.
+            to: The last 'as of' date to include. If None, ends with the last version.
+            interval: If provided, only data within the interval is read.
+            series: Names of series to read.
+            tags: Tag criteria identifying series to read. A list of criteria is combined by OR.
+
+        Raises:
+            ValueError: If the dataset is not of Versioning.AS_OF.
+        """
+        return io.DataIO(self).read_versions(
+            from_=from_, to=to, interval=interval, series=series, tags=tags
+        )
+
     def versions(self, **kwargs: Any) -> list[datetime | str]:
         """Get list of all series version markers (`as_of` dates or version names).
 
@@ -501,6 +689,8 @@ class Dataset:
         it is likely to remain a requirement that datasets remain a single type.
         Ie that `series` yields the same result as one of the specialized functions `numeric_columns` or `boolean_columns`.
         """
+        if not self.data_is_loaded:
+            return self._pending_series()
         if not is_empty(self.data):
             dt_expr = ~ncs.by_dtype(nw.Datetime, nw.Date)
             non_datetime_cols = self.nw.select(dt_expr).columns
@@ -509,6 +699,15 @@ class Dataset:
             return sorted(self.tags["series"].keys())
         return []
 
+    def _pending_series(self) -> list[str]:
+        """Return series names without reading data: from the selection, the catalog tags or the stored schema."""
+        selected = self._pending_read["series"]
+        if selected is not None:
+            return sorted(selected)
+        if self.tags and self.tags.get("series"):
+            return sorted(self.tags["series"].keys())
+        return sorted(io.DataIO(self).series())
+
     @property
     def series_tags(self) -> meta.SeriesTagDict:
         """Get series tags."""
@@ -1231,17 +1430,30 @@ class Dataset:
         """Get names of all numeric series columns (ie columns that are not datetime)."""
         return sorted(nw.from_native(self.data).select(ncs.numeric()).columns)
 
-    def numeric_array(self, series: str | list[str] = "") -> NDArray:
+    def numeric_array(
+        self, series: str | list[str] = "", read_only: bool = False
+    ) -> NDArray:
         """Get the data of numeric series columns in matrix format as a Numpy NDArray.
 
         This will omit datetime columns, hence is convenient for linear algebra operations.
         Optionally, series names can be provided to get a subset of columns.
+
+        With ``read_only=True``, the matrix is stacked straight from the Arrow buffers
+        into a column-major matrix that is not writeable, avoiding intermediate copies.
+        If the data of a lazy dataset is not yet loaded, the matrix is filled directly from storage
+        and the data is not kept. See :py:func:`~ssb_timeseries.dataframes.numeric_matrix`.
         """
-        expr = [ncs.numeric() | ncs.boolean()]
-        if series:
-            expr.append(nw.col(series))
-        np_array = nw.from_native(self.data).select(expr).to_numpy()
-        return cast("NDArray", np_array)
+        if read_only and not self.data_is_loaded:
+            selected = self._pending_read["series"]
+            if series:
+                requested = [series] if isinstance(series, str) else series
+                if selected is None:
+                    selected = requested
+                selected = [s for s in selected if s in requested]
+            return io.DataIO(self).numeric_array(
+                interval=self._pending_read["interval"], series=selected
+            )
+        return numeric_matrix(self.data, series=series, read_only=read_only)
 
     @property
     def np(self) -> NDArray:
@@ -12,6 +12,7 @@ from typing import Any, Iterable
 from typing import Literal
 from typing import TypeAlias
 from typing import cast
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 from multipledispatch import dispatch
 
@@ -19,10 +20,12 @@ from dateutil import parser
 from narwhals.typing import IntoFrameT, FrameT, IntoSeriesT
 import narwhals as nw
 import narwhals.selectors as ncs
-from pandas import PeriodIndex
 import pyarrow as pa
 from .logging import logger
 
+if TYPE_CHECKING:
+    from pandas import PeriodIndex
+
 
 # TODO: align these / control by configuration
 MAX_TIME_PRECISION: str = "second"
@@ -357,6 +360,13 @@ def datetime_to_utc(
 
 def datelike_to_utc(df: IntoFrameT, unlocalized_tz: TimeZone = "") -> IntoFrameT:
     """Convert all datelike columns of a dataframe to UTC."""
+    if isinstance(df, pa.Table) and all(
+        not pa.types.is_temporal(f.type)
+        or (pa.types.is_timestamp(f.type) and f.type.tz == "UTC")
+        for f in df.schema
+    ):
+        # nothing to convert; avoids inspecting every column of very wide tables
+        return df
     df_localized = datelike_localize(df, target_tz=unlocalized_tz)
     return datetime_to_utc(df_localized)
 
@@ -427,5 +437,7 @@ def standardize_dates(
 
 def period_index(col: IntoSeriesT, freq: str) -> PeriodIndex:
     """Returns a period index for a date or datetime series."""
+    from pandas import PeriodIndex
+
     dates = nw.from_native(col, series_only=True).to_pandas()
     return PeriodIndex(dates, freq=freq)
@@ -28,26 +28,54 @@ They should not be imported or used directly by other parts of the application.
 
 from __future__ import annotations
 
+import asyncio
 import importlib
+import json
 import os
+import threading
 import warnings
+from collections import OrderedDict
+from collections import deque
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timezone
 from functools import cache
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import NamedTuple
 
+import narwhals as nw
 from narwhals.typing import IntoFrame
 
 from ..config import FileBasedRepository
-from ..dataset import Dataset
+from ..dataframes import numeric_matrix
 from ..dates import date_utc
 from ..dates import datelike_to_utc
+from ..dates import now_utc
 from ..logging import logger
 from ..meta import TagDict
+from ..meta import search_by_tags
 from ..types import SeriesType
+from ..types import Versioning
+from . import data_cache
+from . import fs
 from . import protocols
 from . import snapshot
 
+if TYPE_CHECKING:
+    import pyarrow
+    from numpy.typing import NDArray
+
+    from ..config import Config
+    from ..dataset import Dataset
+    from ..intervals import Interval
+
 # mypy: disable-error-code="no-any-return,no-untyped-def,return-value,assignment,attr-defined"
 DEFAULT_PROCESS_STAGE = "Statistikk"  # TODO: control from config?
 
@@ -61,6 +89,7 @@ def _all_repos() -> list:
 
 def _repo_config(
     target: Any,  # str | dict[str, FileBasedRepository],
+    config: Config | None = None,
 ) -> FileBasedRepository:
     """Get a repository configuration dictionary by name.
 
@@ -69,7 +98,8 @@ def _repo_config(
     from ..config import Config
 
     if isinstance(target, str):
-        config = Config.active()  #  _ACTIVE_CONFIG #TODO: add Config.refresh() first
+        if config is None:
+            config = Config.active()
         repo = config.repositories[target]
         repo.setdefault("name", target)
     elif isinstance(target, dict):
@@ -83,12 +113,75 @@ def _repo_config(
     return repo
 
 
+HANDLER_CACHE_SIZE = 256
+"""The maximum number of bound I/O handler instances kept for reuse by :py:func:`_io_handler`."""
+
+
+class _HandlerCache:
+    """A bounded, thread safe LRU cache for bound I/O handler instances."""
+
+    def __init__(self, maxsize: int = HANDLER_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._items: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Any | None:
+        with self._lock:
+            instance = self._items.get(key)
+            if instance is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._items.move_to_end(key)
+            return instance
+
+    def put(self, key: tuple, instance: Any) -> None:
+        with self._lock:
+            self._items[key] = instance
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_HANDLERS = _HandlerCache()
+
+_LISTING_AS_OF = date_utc("1970-01-01T00:00:00+00:00")
+"""The version that handlers for AS_OF sets are bound to when they only list or scan versions.
+
+Listing does not depend on the bound version, so a fixed value lets one cached handler serve every such call.
+"""
+
+
+def _cache_key(value: Any) -> Any:
+    """Return a hashable representation of a handler parameter."""
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True, default=str)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
 def _io_handler(**kwargs) -> protocols.DataReadWrite | protocols.MetadataReadWrite:
-    """Dynamically import and instantiate an IO handler.
+    """Return an IO handler instance, importing and instantiating it if necessary.
 
     The handler is determined by the 'repository' and 'handler_type' arguments.
+    Instances are bound to a repository and dataset, and are reused from a bounded LRU cache for identical arguments.
     """
-    repo_cfg = _repo_config(kwargs.pop("repository"))
+    from ..config import Config
+
+    config = Config.active()
+    repo_cfg = _repo_config(kwargs.pop("repository"), config=config)
     handler_type = kwargs.pop("handler_type")
     match handler_type.lower():
         case "data":
@@ -99,20 +192,32 @@ def _io_handler(**kwargs) -> protocols.DataReadWrite | protocols.MetadataReadWri
             handler_config = repo_cfg["directory"]
         case _:
             raise ValueError("Unhandlked handler type.")
-    handler = _handler_class(handler_config["handler"])
-    handler_options = handler_config.get("options", {})
-    if kwargs:
-        handler_options.update(kwargs)
-        logger.warning("_IO_HANDLER() ... kwargs: %s", kwargs)
-    instance = handler(repository=repo_cfg, **kwargs)
+
+    handler_name = handler_config["handler"]
+    key = (
+        handler_type.lower(),
+        _cache_key(config.io_handlers.get(handler_name, handler_name)),
+        _cache_key(repo_cfg),
+        *sorted((k, _cache_key(v)) for k, v in kwargs.items()),
+    )
+    instance = _HANDLERS.get(key)
+    if instance is None:
+        handler = _handler_class(handler_name, config=config)
+        handler_options = handler_config.get("options", {})
+        if kwargs:
+            handler_options.update(kwargs)
+            logger.warning("_IO_HANDLER() ... kwargs: %s", kwargs)
+        instance = handler(repository=repo_cfg, **kwargs)
+        _HANDLERS.put(key, instance)
     return instance
 
 
-def _handler_class(handler_name: str) -> type:
-    """Dynamically import and return a handler class from the config."""
+def _handler_class(handler_name: str, config: Config | None = None) -> type:
+    """Return a handler class from the config, importing it on first use."""
     from ..config import Config
 
-    config = Config.active()  #  _ACTIVE_CONFIG  #TODO: add Config.refresh() first
+    if config is None:
+        config = Config.active()
     handler_conf = config.io_handlers[handler_name]
     handler_path = handler_conf["handler"]
 
@@ -125,6 +230,12 @@ def _handler_class(handler_name: str) -> type:
         )
         handler_path = "ssb_timeseries.io.pyarrow_simple.FileSystem"
 
+    return _import_handler(handler_path)
+
+
+@cache
+def _import_handler(handler_path: str) -> type:
+    """Import and return the class identified by a fully qualified name."""
     module_path, class_name = handler_path.rsplit(".", 1)
     module = importlib.import_module(module_path)
     handler_class = getattr(module, class_name)
@@ -153,6 +264,69 @@ class DataIO:
             as_of_utc=date_utc(self.ds.as_of_utc),
         )
 
+    def read(
+        self,
+        interval: Interval | None = None,
+        series: str | list[str] | None = None,
+        tags: TagDict | list[TagDict] | None = None,
+    ) -> IntoFrame:
+        """Read the dataset's data, optionally limited to an interval and a selection of series.
+
+        Tag criteria are resolved against the dataset's tags.
+        """
+        columns = select_series(self.ds.tags, series=series, tags=tags)
+        return _read(self.dh, interval=interval, columns=columns)
+
+    def numeric_array(
+        self,
+        interval: Interval | None = None,
+        series: str | list[str] | None = None,
+        tags: TagDict | list[TagDict] | None = None,
+    ) -> NDArray:
+        """Read the series of the dataset into a read-only numeric matrix, without the date columns.
+
+        Handlers that provide a ``read_numeric`` method fill the matrix straight from storage.
+        For other handlers, the data is read and converted with :py:func:`~ssb_timeseries.dataframes.numeric_matrix`.
+        """
+        columns = select_series(self.ds.tags, series=series, tags=tags)
+        handler = self.dh
+        if hasattr(handler, "read_numeric"):
+            kwargs = {"interval": interval, "columns": columns}
+            return handler.read_numeric(
+                **{k: v for k, v in kwargs.items() if v is not None}
+            )
+        return numeric_matrix(
+            _read(handler, interval=interval, columns=columns), read_only=True
+        )
+
+    def read_versions(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        interval: Interval | None = None,
+        series: str | list[str] | None = None,
+        tags: TagDict | list[TagDict] | None = None,
+    ) -> IntoFrame:
+        """Read all versions of the dataset within a window of 'as of' dates into one table with an 'as_of' column."""
+        columns = select_series(self.ds.tags, series=series, tags=tags)
+        return _read_versions(
+            self.dh, from_=from_, to=to, interval=interval, columns=columns
+        )
+
+    def series(self) -> list[str]:
+        """List the stored series of the dataset.
+
+        Handlers that provide a ``series`` method answer from the stored schema (eg the Parquet footer) without reading data.
+        For other handlers, the data is read.
+        """
+        handler = self.dh
+        if hasattr(handler, "series"):
+            return handler.series()
+        date_columns = {"as_of", *self.ds.data_type.date_columns}
+        return [
+            c for c in nw.from_native(handler.read()).columns if c not in date_columns
+        ]
+
 
 class MetaIO:
     """Provides a generic IO interface for the metadata of a specific dataset."""
@@ -166,6 +340,8 @@ class MetaIO:
 
         The handler can be bound to a Dataset instance or a repository name.
         """
+        from ..dataset import Dataset
+
         # dirty: either for Dataset or for repo --> target is repo only
         if isinstance(ds, Dataset):
             self.ds = ds
@@ -219,14 +395,106 @@ class MetaIO:
 def save(ds: Dataset) -> None:
     """Write a dataset's data and metadata to storage.
 
+    If the data cache is enabled, it is refilled with the stored data, see :py:mod:`~ssb_timeseries.io.data_cache`.
+
     Args:
         ds: The Dataset object to save.
     """
     utc_data = datelike_to_utc(ds.data)
-    DataIO(ds).dh.write(data=utc_data, tags=ds.tags)
+    data_io = DataIO(ds).dh
+    data_io.write(data=utc_data, tags=ds.tags)
+    _refill_data_cache(data_io)
     MetaIO(ds).dh.write(set_name=ds.name, tags=ds.tags)
 
 
+class SaveResult(NamedTuple):
+    """The outcome of :py:func:`save_many`: the names of the saved datasets, and the errors of the others."""
+
+    saved: list[str]
+    errors: dict[str, Exception]
+
+
+def save_many(
+    datasets: Iterable[Dataset],
+    max_workers: int = fs.MAX_CONCURRENT_READS,
+) -> SaveResult:
+    """Write the data and metadata of several datasets, with concurrent writes and one metadata batch per repository.
+
+    Dates are normalized and data is written as by :py:func:`save`, for up to ``max_workers`` datasets at the same time.
+    The metadata of the datasets whose data was written is then written as one batch per repository:
+    handlers that provide a ``write_many`` method write all the files before updating their catalog index once.
+    For other handlers, the metadata of each dataset is written in turn.
+
+    An error saving one dataset does not stop the others from being saved.
+
+    Args:
+        datasets: The Dataset objects to save.
+        max_workers: The maximum number of datasets written at the same time.
+
+    Returns:
+        A :py:class:`SaveResult` with the names of the saved datasets in the order they were given,
+        and the errors of those that were not saved, by name.
+
+    Raises:
+        ValueError: If two of the datasets have the same name.
+    """
+    datasets = list(datasets)
+    names = [ds.name for ds in datasets]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Datasets can only be saved once per call: {duplicates}.")
+
+    def write_data(ds: Dataset) -> Exception | None:
+        try:
+            utc_data = datelike_to_utc(ds.data)
+            data_io = DataIO(ds).dh
+            data_io.write(data=utc_data, tags=ds.tags)
+            _refill_data_cache(data_io)
+        except Exception as e:
+            e.add_note(f"Saving the data of Dataset('{ds.name}').")
+            logger.exception("IO.save_many: saving the data of %s failed.", ds.name)
+            return e
+        return None
+
+    if max_workers <= 1 or len(datasets) <= 1:
+        data_errors = [write_data(ds) for ds in datasets]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(datasets))
+        ) as executor:
+            data_errors = list(executor.map(write_data, datasets))
+    errors = {
+        ds.name: e for ds, e in zip(datasets, data_errors, strict=True) if e is not None
+    }
+
+    by_repository: dict[Any, tuple[Any, dict[str, dict]]] = {}
+    for ds in datasets:
+        if ds.name not in errors:
+            key = _cache_key(ds.repository)
+            by_repository.setdefault(key, (ds.repository, {}))[1][ds.name] = ds.tags
+    for repository, tags_by_name in by_repository.values():
+        handler = _io_handler(handler_type="metadata", repository=repository)
+        if hasattr(handler, "write_many"):
+            meta_errors = handler.write_many(tags_by_name, max_workers=max_workers)
+        else:
+            meta_errors = {}
+            for set_name, tags in tags_by_name.items():
+                try:
+                    handler.write(set_name=set_name, tags=tags)
+                except Exception as e:
+                    meta_errors[set_name] = e
+        for set_name, e in meta_errors.items():
+            e.add_note(f"Saving the metadata of Dataset('{set_name}').")
+            errors[set_name] = e
+
+    logger.info(
+        "IO.save_many: saved %s of %s datasets.",
+        len(datasets) - len(errors),
+        len(datasets),
+    )
+    return SaveResult([n for n in names if n not in errors], errors)
+
+
 def search(
     **kwargs,
 ) -> list[dict]:
@@ -283,20 +551,31 @@ def read_data(
     repository: str | dict,
     set_name: str,
     as_of_tz: datetime | None = None,
+    interval: Interval | None = None,
+    series: str | list[str] | None = None,
+    tags: TagDict | list[TagDict] | None = None,
+    columns: str | list[str] | None = None,
 ) -> IntoFrame:
     """Read the data for a single dataset into a dataframe.
 
+    If ``series`` or ``tags`` are provided, only the matching series are read from storage,
+    along with the date columns. Tag criteria are resolved against the stored metadata of the dataset.
+
     Args:
         repository: The repository name or configuration dictionary.
         set_name: The name of the dataset.
         as_of_tz: The version timestamp if the dataset is versioned.
+        interval: If provided, only data within the interval is read.
+        series: Names of series to read.
+        tags: Tag criteria identifying series to read. A list of criteria is combined by OR.
+        columns: Alias for ``series``.
 
     Returns:
         A dataframe containing the dataset's data.
     """
-    tags = read_metadata(repository, set_name)
-    if tags:
-        set_type = SeriesType(tags["versioning"], tags["temporality"])
+    metadata = read_metadata(repository, set_name)
+    if metadata:
+        set_type = SeriesType(metadata["versioning"], metadata["temporality"])
         data_io = _io_handler(
             handler_type="data",
             repository=repository,
@@ -304,13 +583,391 @@ def read_data(
             set_type=set_type,
             as_of_utc=date_utc(as_of_tz),
         )
-        data = data_io.read()
+        selected = select_series(metadata, series=series or columns, tags=tags)
+        data = _read(data_io, interval=interval, columns=selected)
     else:
         raise LookupError(f"Could not find Dataset('{set_name}') in {repository=}.")
 
     return data
 
 
+def read_versions(
+    repository: str | dict,
+    set_name: str,
+    from_: datetime | None = None,
+    to: datetime | None = None,
+    interval: Interval | None = None,
+    series: str | list[str] | None = None,
+    tags: TagDict | list[TagDict] | None = None,
+) -> IntoFrame:
+    """Read all versions of an AS_OF dataset within a window of 'as of' dates into one table.
+
+    This is much faster than opening each version separately:
+    the metadata is read once, and the data files are read in a single dataset scan.
+
+    Args:
+        repository: The repository name or configuration dictionary.
+        set_name: The name of the dataset.
+        from_: The first 'as of' date to include. If None, starts at the first version.
+        to: The last 'as of' date to include. If None, ends with the last version.
+        interval: If provided, only data within the interval is read.
+        series: Names of series to read.
+        tags: Tag criteria identifying series to read. A list of criteria is combined by OR.
+
+    Returns:
+        A table with an 'as_of' column in addition to the date and series columns,
+        sorted by 'as_of' and the date columns.
+    """
+    metadata = read_metadata(repository, set_name)
+    if not metadata:
+        raise LookupError(f"Could not find Dataset('{set_name}') in {repository=}.")
+    data_io = _io_handler(
+        handler_type="data",
+        repository=repository,
+        set_name=set_name,
+        set_type=SeriesType(metadata["versioning"], metadata["temporality"]),
+        # handlers for AS_OF sets are bound to a version, even if this read is not
+        as_of_utc=_LISTING_AS_OF,
+    )
+    columns = select_series(metadata, series=series, tags=tags)
+    return _read_versions(
+        data_io, from_=from_, to=to, interval=interval, columns=columns
+    )
+
+
+class StoredDataset(NamedTuple):
+    """A dataset read by :py:func:`read_many`: its data and the metadata that was used to read it."""
+
+    name: str
+    repository: str
+    tags: dict
+    as_of_utc: datetime | None
+    data: IntoFrame
+
+
+def read_many(
+    set_names: Iterable[str],
+    repository: str | dict = "",
+    as_of_tz: datetime | None = None,
+    interval: Interval | None = None,
+    series: str | list[str] | None = None,
+    tags: TagDict | list[TagDict] | None = None,
+    columns: str | list[str] | None = None,
+    combine: bool = False,
+    max_workers: int = fs.MAX_CONCURRENT_READS,
+) -> dict[str, StoredDataset] | pyarrow.Table:
+    """Read several datasets with one catalog pass and concurrent data reads.
+
+    The metadata of all the datasets is resolved with a single search per repository,
+    rather than a :py:func:`find` per dataset.
+    The data reads, including finding the latest version of AS_OF datasets, run on up to ``max_workers`` threads,
+    so the time taken is closer to that of the slowest read than to the sum of them.
+
+    Args:
+        set_names: The names of the datasets.
+        repository: The repository to read from. If empty, all repositories with a catalog are searched.
+        as_of_tz: The version to read of AS_OF datasets. If None, the latest version of each is read.
+        interval: If provided, only data within the interval is read.
+        series: Names of series to read, for datasets that have them.
+        tags: Tag criteria identifying series to read. A list of criteria is combined by OR.
+        columns: Alias for ``series``.
+        combine: If True, return one Arrow table with a 'dataset' column
+            and the union of the date and series columns of all the datasets.
+        max_workers: The maximum number of datasets read at the same time.
+
+    Returns:
+        A dictionary of :py:class:`StoredDataset` in the order of ``set_names``, or one combined table.
+
+    Raises:
+        LookupError: If any dataset is not found, or found in more than one repository.
+    """
+    names = list(dict.fromkeys(set_names))
+    plans = _plan_reads(names, repository)
+    read = partial(
+        _read_planned,
+        as_of_tz=as_of_tz,
+        interval=interval,
+        series=series or columns,
+        tags=tags,
+    )
+    if max_workers <= 1 or len(plans) <= 1:
+        results = [read(p) for p in plans]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(plans))) as executor:
+            results = list(executor.map(read, plans))
+
+    if combine:
+        return _combine(results)
+    return {r.name: r for r in results}
+
+
+def _plan_reads(set_names: list[str], repository: str | dict = "") -> list[tuple]:
+    """Resolve the repository and stored metadata of datasets, with one catalog search per repository.
+
+    Returns:
+        A list of (set name, repository, metadata) in the order of the names.
+    """
+    from ..config import Config
+
+    config = Config.active()
+    if repository:
+        repositories = [_repo_config(repository, config=config)]
+    else:
+        repositories = [
+            _repo_config(k, config=config)
+            for k, v in config.repositories.items()
+            if "catalog" in v
+        ]
+
+    def datasets_in(repo: dict) -> dict[str, dict]:
+        items = _io_handler(handler_type="metadata", repository=repo).search(
+            datasets=True, series=False
+        )
+        return {i["object_name"]: i["object_tags"] for i in items}
+
+    if len(repositories) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(repositories), fs.MAX_CONCURRENT_READS)
+        ) as executor:
+            catalogs = list(executor.map(datasets_in, repositories))
+    else:
+        catalogs = [datasets_in(r) for r in repositories]
+
+    plans = []
+    missing = []
+    for name in set_names:
+        found = [
+            (repo, catalog[name])
+            for repo, catalog in zip(repositories, catalogs, strict=True)
+            if name in catalog
+        ]
+        if not found:
+            missing.append(name)
+        elif len(found) > 1:
+            raise LookupError(
+                f"Dataset('{name}') was found in several repositories: {[r.get('name') for r, _ in found]}."
+            )
+        else:
+            plans.append((name, *found[0]))
+    if missing:
+        raise LookupError(f"Could not find datasets {missing} in {repository=}.")
+    logger.debug("IO.read_many: planned %s reads.", len(plans))
+    return plans
+
+
+def _read_planned(
+    plan: tuple,
+    as_of_tz: datetime | None = None,
+    **kwargs,
+) -> StoredDataset:
+    """Read the data of a dataset planned by :py:func:`_plan_reads`."""
+    set_name, repo, metadata = plan
+    try:
+        set_type = SeriesType(metadata["versioning"], metadata["temporality"])
+        as_of_utc = date_utc(as_of_tz) if as_of_tz else None
+        if set_type.versioning != Versioning.AS_OF:
+            as_of_utc = None
+        elif as_of_utc is None:
+            latest = _io_handler(
+                handler_type="data",
+                repository=repo,
+                set_name=set_name,
+                set_type=set_type,
+                # handlers for AS_OF sets are bound to a version, even to list versions
+                as_of_utc=_LISTING_AS_OF,
+            ).versions(file_pattern="*.parquet", pattern=set_type.versioning)[-1]
+            as_of_utc = date_utc(latest) if isinstance(latest, datetime) else None
+        data_io = _io_handler(
+            handler_type="data",
+            repository=repo,
+            set_name=set_name,
+            set_type=set_type,
+            as_of_utc=as_of_utc,
+        )
+        selected = select_series(
+            metadata, series=kwargs.get("series"), tags=kwargs.get("tags")
+        )
+        data = _read(data_io, interval=kwargs.get("interval"), columns=selected)
+    except Exception as e:
+        e.add_note(f"Reading Dataset('{set_name}') from repository {repo.get('name')}.")
+        raise
+    return StoredDataset(set_name, repo.get("name", ""), metadata, as_of_utc, data)
+
+
+def _combine(results: list[StoredDataset]) -> pyarrow.Table:
+    """Stack the data of several datasets into one table with a leading 'dataset' column.
+
+    Columns that are missing from a dataset are filled with nulls.
+    """
+    import pyarrow
+
+    from ..dataframes import to_arrow
+
+    tables = []
+    for r in results:
+        table = to_arrow(r.data)
+        tables.append(
+            table.add_column(
+                0, "dataset", pyarrow.array([r.name] * table.num_rows, pyarrow.string())
+            )
+        )
+    if not tables:
+        return pyarrow.table({"dataset": pyarrow.array([], pyarrow.string())})
+    return pyarrow.concat_tables(tables, promote_options="default")
+
+
+def prefetched(
+    calls: Iterable[Callable[[], Any]],
+    prefetch: int = 2,
+) -> Iterator[Any]:
+    """Yield the results of calls in order, making the next ``prefetch`` calls in background threads.
+
+    While the caller processes one result, the next ones are read, so I/O and computation overlap.
+    At most ``prefetch`` results are held besides the one that was last yielded,
+    and the generator keeps no reference to a result once it is yielded.
+    With ``prefetch=0`` each call is made when its result is requested.
+
+    If a call fails, its error is raised when its result is due. Closing the generator cancels the calls that have not started.
+
+    Raises:
+        ValueError: If ``prefetch`` is negative.
+    """
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be at least 0, got {prefetch}.")
+    calls = iter(calls)
+    if prefetch == 0:
+        for call in calls:
+            yield call()
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=prefetch, thread_name_prefix="ssb-timeseries-prefetch"
+    )
+    try:
+        pending = deque(executor.submit(c) for c in islice(calls, prefetch))
+        while pending:
+            future = pending.popleft()
+            call = next(calls, None)
+            if call is not None:
+                pending.append(executor.submit(call))
+            result = future.result()
+            del future
+            yield result
+            del result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _read_versions(data_io: protocols.DataReadWrite, **kwargs) -> IntoFrame:
+    """Read versions through a handler, passing only the arguments that are provided."""
+    if not hasattr(data_io, "read_versions"):
+        raise NotImplementedError(
+            f"The data handler {type(data_io).__name__} can not read multiple versions."
+        )
+    return data_io.read_versions(**{k: v for k, v in kwargs.items() if v is not None})
+
+
+def select_series(
+    stored: dict,
+    series: str | list[str] | None = None,
+    tags: TagDict | list[TagDict] | None = None,
+) -> list[str] | None:
+    """Resolve series names and tag criteria to the names of the series to read.
+
+    Tag criteria are matched against the series tags of the stored metadata.
+    A list of tag criteria is combined by OR, and the result is combined with ``series`` by OR.
+
+    Returns:
+        A list of series names, or None if neither names nor tags are provided (ie all series).
+    """
+    if series is None and not tags:
+        return None
+
+    if isinstance(series, str):
+        selected = [series]
+    else:
+        selected = list(series or [])
+
+    if tags:
+        series_tags = stored.get("series", {}) if stored else {}
+        for criteria in tags if isinstance(tags, list) else [tags]:
+            selected.extend(search_by_tags(series_tags, criteria))
+
+    logger.debug("IO.select_series: %s series selected.", len(selected))
+    return list(dict.fromkeys(selected))
+
+
+def _read(data_io: protocols.DataReadWrite, **kwargs) -> IntoFrame:
+    """Read data through a handler, passing only the arguments that are provided.
+
+    This keeps handlers that do not support intervals or column selection working for full reads.
+    If the data cache is enabled and the handler provides a ``signature``, the read goes through the cache,
+    see :py:mod:`~ssb_timeseries.io.data_cache`.
+    """
+    kwargs = {k: v for k, v in kwargs.items() if v is not None}
+    if data_cache.is_enabled() and hasattr(data_io, "signature"):
+        return _read_cached(data_io, **kwargs)
+    return data_io.read(**kwargs)
+
+
+def _data_cache_key(data_io: protocols.DataReadWrite) -> data_cache.CacheKey:
+    """Return the data cache key of the dataset and version a handler is bound to.
+
+    Handlers for unversioned sets may be bound to any date, so the date is only part of the key for AS_OF sets.
+    """
+    repository = data_io.repository
+    versioned = data_io.data_type.versioning == Versioning.AS_OF
+    return (
+        str(repository.get("name") or _cache_key(repository)),
+        data_io.set_name,
+        data_io.as_of_utc if versioned else None,
+    )
+
+
+def _read_cached(
+    data_io: protocols.DataReadWrite,
+    interval: Interval | None = None,
+    columns: list[str] | None = None,
+) -> IntoFrame:
+    """Read data through the data cache.
+
+    A selection of series or an interval is taken from the cached full table if there is one,
+    otherwise it is read from storage and not cached.
+    """
+    from .predicates import filter_interval
+    from .predicates import projected_columns
+
+    selection = {"interval": interval, "columns": columns}
+    selection = {k: v for k, v in selection.items() if v is not None}
+    signature = data_io.signature()
+    key = _data_cache_key(data_io)
+    table = None if signature is None else data_cache.get(key, signature)
+    if table is None:
+        if signature is None or selection:
+            return data_io.read(**selection)
+        table = data_io.read()
+        data_cache.put(key, signature, table)
+        return table
+
+    date_columns = data_io.data_type.date_columns
+    if columns is not None:
+        table = table.select(
+            projected_columns(table.column_names, date_columns, columns)
+        )
+    return filter_interval(table, date_columns, interval)
+
+
+def _refill_data_cache(data_io: protocols.DataReadWrite) -> None:
+    """Replace the cached table of a dataset after it was written, so that the next read is served from memory.
+
+    Handlers merge written data with stored data and normalize the schema,
+    so the stored table is read back once rather than taken from the written dataframe.
+    """
+    if data_cache.is_enabled() and hasattr(data_io, "signature"):
+        data_cache.invalidate(_data_cache_key(data_io))
+        _read_cached(data_io)
+
+
 def find(
     set_name: str = "",
     repository: str | dict = "",
@@ -320,6 +977,9 @@ def find(
 ) -> list[dict] | dict:
     """Find dataset metadata by name in specified or all repositories.
 
+    When searching several repositories, they are queried concurrently.
+    Results are returned in the order of the repositories.
+
     Args:
         set_name: The name of the dataset to find.
         repository: The specific repository to search in. If empty, searches all.
@@ -343,16 +1003,19 @@ def find(
             v for k, v in Config.active().repositories.items() if "catalog" in v
         ]
 
-    result = []
-    for repo in repositories:
-        meta_io = _io_handler(
-            handler_type="metadata",
-            repository=repo,
-            set_name=set_name,
-        )
-        if meta_io.exists:
-            tags = meta_io.read(set_name=set_name)
-            result.append(dict(tags))
+    handlers = [
+        _io_handler(handler_type="metadata", repository=repo, set_name=set_name)
+        for repo in repositories
+    ]
+    if len(handlers) > 1:
+        # repositories are queried concurrently, results are kept in repository order
+        with ThreadPoolExecutor(
+            max_workers=min(len(handlers), fs.MAX_CONCURRENT_READS)
+        ) as executor:
+            found = list(executor.map(partial(_read_if_exists, set_name), handlers))
+    else:
+        found = [_read_if_exists(set_name, h) for h in handlers]
+    result = [tags for tags in found if tags is not None]
 
     match (len(result), require_one, require_unique):
         case (0, False, _):
@@ -394,6 +1057,41 @@ def versions(
     return versions
 
 
+def rebuild_manifests(repository: str | dict = "") -> int:
+    """Rebuild the version manifests of all datasets in one or all repositories.
+
+    Repositories written before version manifests were introduced, or modified by other tools, should be rebuilt once.
+    Data handlers without manifests are skipped.
+
+    Args:
+        repository: The repository to rebuild, by name or configuration. If empty, all repositories are rebuilt.
+
+    Returns:
+        The number of datasets with rebuilt manifests.
+    """
+    from ..config import Config
+
+    config = Config.active()
+    if repository:
+        repositories = [_repo_config(repository, config=config)]
+    else:
+        repositories = [v for v in config.repositories.values() if "directory" in v]
+
+    count = 0
+    for repo in repositories:
+        handler = _handler_class(repo["directory"]["handler"], config=config)
+        if hasattr(handler, "rebuild_manifests"):
+            count += handler.rebuild_manifests(repo)
+    return count
+
+
+def _read_if_exists(set_name: str, meta_io: Any) -> dict | None:
+    """Return the tags read by a metadata handler, or None if its dataset does not exist."""
+    if meta_io.exists:
+        return dict(meta_io.read(set_name=set_name))
+    return None
+
+
 def persist(
     ds: Dataset,
 ) -> None:
@@ -431,6 +1129,14 @@ def persist(
         set_name=ds.name,
         sharing=ds.sharing,
     )
+    data_handler = DataIO(ds).dh
+    if not hasattr(data_handler, "fullpath"):
+        raise NotImplementedError(
+            f"Snapshots copy data files, which {type(data_handler).__name__} does not have."
+        )
+    if hasattr(data_handler, "compact"):
+        # snapshots copy the base file, so any delta files must be folded into it first
+        data_handler.compact()
     date_from = ds.data[ds.datetime_columns].min().min()
     date_to = ds.data[ds.datetime_columns].max().max()
     snap_io.write(
@@ -438,6 +1144,152 @@ def persist(
         as_of_tz=ds.as_of_utc,
         period_from=date_from,
         period_to=date_to,
-        data_path=DataIO(ds).dh.fullpath,  # type: ignore[attr-defined]
+        data_path=data_handler.fullpath,  # type: ignore[attr-defined]
         # meta_path=MetaIO(ds).dh.fullpath,
     )
+
+
+# --- Asynchronous API ---
+#
+# The storage handlers are synchronous, so the coroutines below run them in a
+# dedicated, bounded thread pool rather than in the event loop. This keeps an
+# async service responsive, and caps the number of threads regardless of how
+# many coroutines are waiting.
+
+MAX_ASYNC_WORKERS = 32
+"""The number of threads that run blocking I/O for the asynchronous API, see :py:func:`run_async`."""
+
+_async_executor: ThreadPoolExecutor | None = None
+_async_executor_lock = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    """Return the thread pool of the asynchronous API, creating it on first use."""
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(
+                max_workers=MAX_ASYNC_WORKERS,
+                thread_name_prefix="ssb-timeseries-io",
+            )
+        return _async_executor
+
+
+def shutdown_async_executor(wait: bool = True) -> None:
+    """Shut down the thread pool of the asynchronous API; a new one is created when it is next used.
+
+    Change :py:data:`MAX_ASYNC_WORKERS` before the first call, or shut down the pool for a new size to take effect.
+    """
+    global _async_executor
+    with _async_executor_lock:
+        executor, _async_executor = _async_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run_async(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking function in the I/O thread pool and await the result.
+
+    If the awaiting task is cancelled before the call has started, the call is not made.
+    A call that has already started runs to completion in its thread, but its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor(), partial(func, *args, **kwargs))
+
+
+async def gather_limited(
+    calls: Iterable[Callable[[], Awaitable[Any]]],
+    max_concurrency: int | None = None,
+) -> list[Any]:
+    """Await calls with at most ``max_concurrency`` running at the same time, and return the results in order.
+
+    If ``max_concurrency`` is None, the current value of :py:data:`MAX_ASYNC_WORKERS` is used.
+    If a call fails, the remaining calls are cancelled and the error is raised.
+
+    Raises:
+        ValueError: If ``max_concurrency`` is less than 1.
+    """
+    if max_concurrency is None:
+        max_concurrency = MAX_ASYNC_WORKERS
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def limited(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+
+    tasks = [asyncio.ensure_future(limited(c)) for c in calls]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def asave(ds: Dataset) -> None:
+    """Asynchronous variant of :py:func:`save`."""
+    await run_async(save, ds)
+
+
+async def aread_metadata(repository: str | dict, set_name: str) -> dict:
+    """Asynchronous variant of :py:func:`read_metadata`."""
+    return await run_async(read_metadata, repository, set_name)
+
+
+async def aread_data(repository: str | dict, set_name: str, **kwargs: Any) -> IntoFrame:
+    """Asynchronous variant of :py:func:`read_data`."""
+    return await run_async(read_data, repository, set_name, **kwargs)
+
+
+async def afind(
+    set_name: str = "", repository: str | dict = "", **kwargs: Any
+) -> list[dict] | dict:
+    """Asynchronous variant of :py:func:`find`."""
+    return await run_async(find, set_name, repository, **kwargs)
+
+
+async def asearch(**kwargs: Any) -> list[dict]:
+    """Asynchronous variant of :py:func:`search`; repositories are searched concurrently."""
+    repositories = kwargs.pop("repositories", None)
+    if repositories is None:
+        repositories = await run_async(_all_repos)
+    elif isinstance(repositories, str):
+        repositories = [repositories]
+    elif isinstance(repositories, dict):
+        repositories = list(repositories.keys())
+    found = await gather_limited(
+        partial(run_async, search, repositories=r, **kwargs) for r in repositories
+    )
+    return [f for result in found for f in result]
+
+
+async def aread_many(
+    set_names: Iterable[str],
+    as_of_tz: datetime | None = None,
+    max_concurrency: int | None = None,
+    **kwargs: Any,
+) -> dict[str, Dataset]:
+    """Open several datasets concurrently and return them by name.
+
+    Each dataset is opened as by :py:meth:`Dataset.aopen <ssb_timeseries.dataset.Dataset.aopen>`,
+    with at most ``max_concurrency`` being read at the same time.
+    If one dataset can not be opened, the remaining reads are cancelled and the error is raised.
+
+    Args:
+        set_names: The names of the datasets.
+        as_of_tz: The version to read of AS_OF datasets. If None, the latest version of each is read.
+        max_concurrency: The maximum number of datasets read at the same time.
+            If None, the current value of :py:data:`MAX_ASYNC_WORKERS` is used.
+        **kwargs: Passed to :py:class:`~ssb_timeseries.dataset.Dataset`, like ``repository``, ``interval`` or ``series``.
+    """
+    from ..dataset import Dataset
+
+    names = list(dict.fromkeys(set_names))
+    datasets = await gather_limited(
+        (partial(Dataset.aopen, name, as_of_tz, **kwargs) for name in names),
+        max_concurrency=max_concurrency,
+    )
+    return dict(zip(names, datasets, strict=True))
@@ -0,0 +1,489 @@
+"""A consolidated index of the metadata files in a JSON catalog directory.
+
+Searching the catalog by opening and parsing every ``<set name>-metadata.json`` file gets slow with many datasets,
+in particular on GCS. Instead, :py:class:`~ssb_timeseries.io.json_metadata.JsonMetaIO` keeps a Parquet table
+next to the metadata files, with one row for each dataset and one for each series:
+
+.. code-block::
+
+    dataset: string             name of the dataset (from the file name)
+    series: string              name of the series, null for dataset rows
+    position: int32             order of the series in the dataset, -1 for dataset rows
+    repository: string          the 'repository' tag of the dataset
+    modified: string            modification marker and ...
+    size: int64                 ... size of the metadata file, see fs.file_signature
+    tags: string                tags of the object as JSON; the 'series' tags of datasets are left out
+    attributes: list<string>    tag names ...
+    values: list<string>        ... and values (as JSON, see tag_value) of the object, flattened for searching
+
+The index is updated by :py:meth:`JsonMetaIO.write <ssb_timeseries.io.json_metadata.JsonMetaIO.write>`,
+and validated against a single listing of the metadata files before it is used:
+files that were added or changed since are read into the index, and rows of files that were removed are dropped.
+If the index is missing or can not be read, it is rebuilt from all the metadata files.
+
+Like the version manifests, the index is replaced atomically: a temporary file is written and then moved into place.
+Within a process, the last read index is kept in memory for as long as the file is unchanged,
+together with an inverted index of the tags (:py:class:`TagIndex`) for searches by tags.
+Threads only wait for each other to read or update the index of the same catalog directory.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+import threading
+import uuid
+from contextlib import suppress
+from typing import Any
+
+import numpy as np
+import pyarrow
+import pyarrow.compute as pc
+
+from ..logging import logger
+from . import fs
+
+# mypy: disable-error-code="no-any-return, arg-type"
+
+INDEX_FILE = "_catalog_index.parquet"
+METADATA_SUFFIX = "-metadata.json"
+
+# separates attribute and value in the keys of the inverted tag index
+_SEPARATOR = "\x1f"
+
+SCHEMA = pyarrow.schema(
+    [
+        pyarrow.field("dataset", pyarrow.string(), nullable=False),
+        pyarrow.field("series", pyarrow.string()),
+        pyarrow.field("position", pyarrow.int32(), nullable=False),
+        pyarrow.field("repository", pyarrow.string()),
+        pyarrow.field("modified", pyarrow.string()),
+        pyarrow.field("size", pyarrow.int64()),
+        pyarrow.field("tags", pyarrow.string()),
+        pyarrow.field("attributes", pyarrow.list_(pyarrow.string())),
+        pyarrow.field("values", pyarrow.list_(pyarrow.string())),
+    ]
+)
+
+# guards the module level dicts; the indexes are read and updated under the lock of their directory
+_lock = threading.Lock()
+_directory_lock = fs.StripedLock()
+_loaded: dict[str, tuple[Any, pyarrow.Table]] = {}
+_unwritable: set[str] = set()
+
+
+def index_path(directory: str) -> str:
+    """Return the path of the index of a catalog directory."""
+    return os.path.join(directory, INDEX_FILE)
+
+
+def tag_value(value: Any) -> str:
+    """Serialize a tag value so that equal values give equal strings."""
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def set_name_from_path(path: str) -> str:
+    """Return the dataset name of a metadata file path."""
+    return os.path.basename(path)[: -len(METADATA_SUFFIX)]
+
+
+def object_rows(
+    set_name: str,
+    tags: dict[str, Any],
+    signature: tuple[int | str, int] | None,
+) -> pyarrow.Table:
+    """Return the index rows for the (sanitized) tags of a dataset: one for the dataset and one for each series."""
+    series_tags = tags.get("series") or {}
+    dataset_tags = {k: ({} if k == "series" else v) for k, v in tags.items()}
+    objects = [(None, -1, dataset_tags)] + [
+        (name, i, t) for i, (name, t) in enumerate(series_tags.items())
+    ]
+    modified, size = (str(signature[0]), signature[1]) if signature else (None, None)
+    n = len(objects)
+    return pyarrow.Table.from_pydict(
+        {
+            "dataset": [set_name] * n,
+            "series": [o[0] for o in objects],
+            "position": [o[1] for o in objects],
+            "repository": [tags.get("repository")] * n,
+            "modified": [modified] * n,
+            "size": [size] * n,
+            "tags": [json.dumps(o[2]) for o in objects],
+            "attributes": [
+                [k for k in o[2] if not (o[0] is None and k == "series")]
+                for o in objects
+            ],
+            "values": [
+                [
+                    tag_value(v)
+                    for k, v in o[2].items()
+                    if not (o[0] is None and k == "series")
+                ]
+                for o in objects
+            ],
+        },
+        schema=SCHEMA,
+    )
+
+
+def _rows_from_files(
+    files: dict[str, tuple[int | str, int]],
+    max_workers: int = fs.MAX_CONCURRENT_READS,
+) -> list[pyarrow.Table]:
+    """Read metadata files (concurrently) into index rows."""
+    tables = []
+    contents = fs.read_json_many(list(files), max_workers=max_workers)
+    for (path, signature), tags in zip(files.items(), contents, strict=True):
+        if not isinstance(tags, dict):
+            raise TypeError(f"Metadata file {path} did not contain a valid dictionary.")
+        tables.append(object_rows(set_name_from_path(path), tags, signature))
+    return tables
+
+
+def _sorted(tables: list[pyarrow.Table]) -> pyarrow.Table:
+    if not tables:
+        return SCHEMA.empty_table()
+    return pyarrow.concat_tables(tables).sort_by(
+        [("dataset", "ascending"), ("position", "ascending")]
+    )
+
+
+def _load(directory: str) -> pyarrow.Table | None:
+    """Return the stored index, or None if it is missing or can not be read."""
+    path = index_path(directory)
+    signature = fs.file_signature(path)
+    if signature is None:
+        return None
+    with _lock:
+        cached = _loaded.get(directory)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    try:
+        index = fs.parquet_file(path, memory_map=False).read().cast(SCHEMA)
+    except (OSError, ValueError, pyarrow.ArrowException):
+        logger.warning("Catalog index %s could not be read; rebuilding it.", path)
+        return None
+    with _lock:
+        _loaded[directory] = (signature, index)
+    return index
+
+
+def _store(directory: str, index: pyarrow.Table) -> None:
+    """Replace the stored index."""
+    path = index_path(directory)
+    temporary_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    fs.write_parquet(index, temporary_path)
+    try:
+        fs.mv(temporary_path, path)
+    except Exception:
+        with suppress(Exception):
+            fs.rm(temporary_path)
+        raise
+    signature = fs.file_signature(path)
+    with _lock:
+        _loaded[directory] = (signature, index)
+    logger.debug("CATALOG.index: wrote %s rows to %s.", index.num_rows, path)
+
+
+def _store_if_writable(directory: str, index: pyarrow.Table) -> None:
+    """Store the index, or only log a warning if the catalog directory can not be written to.
+
+    Searches only need to read the catalog, so read-only users of a shared catalog
+    get the index brought up to date in memory instead.
+    """
+    try:
+        _store(directory, index)
+    except Exception as e:
+        with _lock:
+            warned = directory in _unwritable
+            _unwritable.add(directory)
+        log = logger.debug if warned else logger.warning
+        log(
+            "Catalog index %s could not be stored (%s); it is rebuilt in memory for each search.",
+            index_path(directory),
+            e,
+        )
+
+
+def _file_signatures(index: pyarrow.Table) -> dict[str, tuple[str | None, int | None]]:
+    """Return the file signature recorded for each dataset of the index."""
+    datasets = index.filter(pc.is_null(index["series"]))
+    return dict(
+        zip(
+            datasets["dataset"].to_pylist(),
+            zip(
+                datasets["modified"].to_pylist(),
+                datasets["size"].to_pylist(),
+                strict=True,
+            ),
+            strict=True,
+        )
+    )
+
+
+def read_index(
+    directory: str, max_workers: int = fs.MAX_CONCURRENT_READS
+) -> pyarrow.Table:
+    """Return the index of a catalog directory, brought up to date with the metadata files.
+
+    The metadata files are listed once. Files that are new or have changed since they were indexed are read,
+    with up to ``max_workers`` threads, and datasets without files are removed.
+    The index is stored again only if anything changed,
+    and if it can not be stored, the index is still returned.
+    """
+    with _directory_lock(directory):
+        listed = {
+            set_name_from_path(p): (p, s)
+            for p, s in fs.signatures(directory, f"*{METADATA_SUFFIX}").items()
+        }
+        index = _load(directory)
+        if index is None:
+            index = SCHEMA.empty_table()
+        indexed = _file_signatures(index)
+        changed = {
+            path: signature
+            for name, (path, signature) in listed.items()
+            if indexed.get(name) != (str(signature[0]), signature[1])
+        }
+        removed = set(indexed) - set(listed)
+        if not changed and not removed:
+            return index
+
+        logger.debug(
+            "CATALOG.index %s: reading %s changed files, removing %s datasets.",
+            directory,
+            len(changed),
+            len(removed),
+        )
+        outdated = pyarrow.array(
+            [set_name_from_path(p) for p in changed] + list(removed), pyarrow.string()
+        )
+        kept = index.filter(pc.invert(pc.is_in(index["dataset"], value_set=outdated)))
+        index = _sorted([kept, *_rows_from_files(changed, max_workers)])
+        _store_if_writable(directory, index)
+        return index
+
+
+def rebuild_index(
+    directory: str, max_workers: int = fs.MAX_CONCURRENT_READS
+) -> pyarrow.Table:
+    """Rebuild the index of a catalog directory from all the metadata files, read with up to ``max_workers`` threads."""
+    with _directory_lock(directory):
+        files = fs.signatures(directory, f"*{METADATA_SUFFIX}")
+        index = _sorted(_rows_from_files(files, max_workers))
+        _store_if_writable(directory, index)
+        logger.info(
+            "Rebuilt the catalog index of %s datasets in %s.", len(files), directory
+        )
+        return index
+
+
+def update_index(directory: str, set_name: str, tags: dict[str, Any]) -> None:
+    """Replace the rows of one dataset in the index, after its metadata file was written.
+
+    If there is no index yet, nothing is done: it is built by the next search.
+    """
+    update_index_many(directory, {set_name: tags})
+
+
+def update_index_many(directory: str, tags_by_name: dict[str, dict[str, Any]]) -> None:
+    """Replace the rows of several datasets in the index, after their metadata files were written.
+
+    The index is loaded and stored once, however many datasets there are.
+    If there is no index yet, nothing is done: it is built by the next search.
+    """
+    if not tags_by_name:
+        return
+    with _directory_lock(directory):
+        index = _load(directory)
+        if index is None:
+            return
+        new_rows = []
+        for set_name, tags in tags_by_name.items():
+            # index what a search would read back from the file
+            tags = json.loads(json.dumps(tags))
+            signature = fs.file_signature(
+                os.path.join(directory, f"{set_name}{METADATA_SUFFIX}")
+            )
+            new_rows.append(object_rows(set_name, tags, signature))
+        replaced = pyarrow.array(list(tags_by_name), pyarrow.string())
+        kept = index.filter(pc.invert(pc.is_in(index["dataset"], value_set=replaced)))
+        _store(directory, _sorted([kept, *new_rows]))
+
+
+class TagIndex:
+    """An inverted index of the tags in a catalog index.
+
+    Each (attribute, value) pair maps to the sorted row numbers of the objects (datasets and series) that have it.
+    The row numbers of all pairs are kept in one array, grouped by pair, so a lookup is a slice.
+    Tag criteria are answered by setting the rows of each value in a boolean mask (OR),
+    and combining the masks of the attributes (AND), instead of checking the tags of every object.
+    """
+
+    def __init__(self, index: pyarrow.Table) -> None:
+        """Build the inverted index from the flattened tags of a catalog index."""
+        self.num_rows = index.num_rows
+        attributes = pc.list_flatten(index["attributes"])
+        keys = pc.binary_join_element_wise(
+            attributes, pc.list_flatten(index["values"]), _SEPARATOR
+        )
+        encoded = keys.combine_chunks().dictionary_encode()
+        codes = encoded.indices.to_numpy(zero_copy_only=False)
+        rows = pc.list_parent_indices(index["attributes"]).to_numpy()
+        order = np.argsort(codes, kind="stable")
+        self._rows = rows[order]
+        self._bounds = np.concatenate(
+            [[0], np.cumsum(np.bincount(codes, minlength=len(encoded.dictionary)))]
+        )
+        self._codes = {k: i for i, k in enumerate(encoded.dictionary.to_pylist())}
+        self._attributes = attributes
+        self._all_rows = rows
+
+    def rows(self, attribute: str, value: Any) -> np.ndarray:
+        """Return the sorted row numbers of the objects with a tag value.
+
+        Values are compared by their JSON representation, see :py:func:`tag_value`.
+        """
+        code = self._codes.get(f"{attribute}{_SEPARATOR}{tag_value(value)}")
+        if code is None:
+            return self._rows[:0]
+        return self._rows[self._bounds[code] : self._bounds[code + 1]]
+
+    def _mask(self, attribute: str, values: list[Any]) -> np.ndarray:
+        """Return a boolean mask of the rows with any of the values for an attribute.
+
+        As in :py:func:`~ssb_timeseries.meta.tags.matches_criteria`, the value None also matches objects without the attribute.
+        """
+        mask = np.zeros(self.num_rows, dtype=bool)
+        for value in values:
+            mask[self.rows(attribute, value)] = True
+        if None in values:
+            with_attribute = np.zeros(self.num_rows, dtype=bool)
+            has = pc.equal(self._attributes, attribute).to_numpy(zero_copy_only=False)
+            with_attribute[self._all_rows[has]] = True
+            mask |= ~with_attribute
+        return mask
+
+    def matching(self, criteria: dict | list[dict] | None) -> np.ndarray | None:
+        """Return a boolean mask of the rows with tags matching the criteria, or None if all rows match.
+
+        All attributes of a dict must match (AND), a list value matches any of its items (OR),
+        and a list of dicts matches if any of the dicts does (OR).
+        """
+        if not criteria:
+            return None
+        if isinstance(criteria, dict):
+            criteria = [criteria]
+        elif not isinstance(criteria, list):
+            raise TypeError(f"Cannot check tags of type '{type(criteria)}'.")
+        if any(not c for c in criteria):
+            return None
+
+        selected = np.zeros(self.num_rows, dtype=bool)
+        for c in criteria:
+            matches = np.ones(self.num_rows, dtype=bool)
+            for attribute, value in c.items():
+                matches &= self._mask(
+                    attribute, value if isinstance(value, list) else [value]
+                )
+            selected |= matches
+        return selected
+
+
+_tag_indexes: dict[str, tuple[pyarrow.Table, TagIndex]] = {}
+
+
+def tag_index(directory: str, index: pyarrow.Table) -> TagIndex:
+    """Return the inverted tag index of a catalog index, reusing it for as long as the catalog index is unchanged."""
+    with _directory_lock(directory):
+        with _lock:
+            cached = _tag_indexes.get(directory)
+        if cached is not None and cached[0] is index:
+            return cached[1]
+        inverted = TagIndex(index)
+        with _lock:
+            _tag_indexes[directory] = (index, inverted)
+        return inverted
+
+
+def matching_names(index: pyarrow.Table, pattern: str) -> np.ndarray | None:
+    """Return a boolean mask of the rows of datasets with names matching a glob pattern, or None if all match."""
+    if pattern in ("", "*"):
+        return None
+    names = pc.unique(index["dataset"]).to_pylist()
+    selected = pyarrow.array(fnmatch.filter(names, pattern), pyarrow.string())
+    return pc.is_in(index["dataset"], value_set=selected).to_numpy(zero_copy_only=False)
+
+
+def catalog_items(
+    index: pyarrow.Table,
+    datasets: bool = True,
+    series: bool = False,
+    selected: np.ndarray | None = None,
+) -> list[dict[str, Any]]:
+    """Return catalog items for the selected rows of an index, each dataset followed by its series.
+
+    The items are the same as :py:class:`~ssb_timeseries.io.json_metadata.JsonMetaIO` builds from the metadata files:
+    the tags of a dataset item include the tags of its series.
+    Only the tags of the rows needed for the items are parsed.
+    """
+    is_dataset = index["series"].is_null().to_numpy(zero_copy_only=False)
+    if selected is None:
+        selected = np.ones(index.num_rows, dtype=bool)
+    dataset_items = selected & is_dataset if datasets else np.zeros_like(is_dataset)
+    series_items = selected & ~is_dataset if series else np.zeros_like(is_dataset)
+
+    # the series of selected datasets, and the datasets of selected series, are needed to build the items
+    names = index["dataset"]
+    with_dataset_item = pc.is_in(
+        names, value_set=names.filter(pyarrow.array(dataset_items))
+    ).to_numpy(zero_copy_only=False)
+    with_series_items = pc.is_in(
+        names, value_set=names.filter(pyarrow.array(series_items))
+    ).to_numpy(zero_copy_only=False)
+    needed = np.flatnonzero(
+        dataset_items
+        | series_items
+        | (with_dataset_item & ~is_dataset)
+        | (with_series_items & is_dataset)
+    )
+    rows = index.select(["dataset", "series", "repository", "tags"]).take(needed)
+
+    items: list[dict[str, Any]] = []
+    current: dict[str, Any] = {}
+    for i, name, set_name, repository, tags in zip(
+        needed,
+        rows["series"].to_pylist(),
+        rows["dataset"].to_pylist(),
+        rows["repository"].to_pylist(),
+        rows["tags"].to_pylist(),
+        strict=True,
+    ):
+        object_tags = json.loads(tags)
+        if name is None:
+            current = object_tags
+            if dataset_items[i]:
+                items.append(
+                    {
+                        "repository_name": repository,
+                        "object_name": object_tags["name"],
+                        "object_type": "dataset",
+                        "object_tags": object_tags,
+                        "parent": object_tags.get("parent", ""),
+                    }
+                )
+            continue
+        if "series" in current:
+            current["series"][name] = object_tags
+        if series_items[i]:
+            items.append(
+                {
+                    "repository_name": repository,
+                    "object_name": name,
+                    "object_type": "series",
+                    "object_tags": object_tags,
+                    "parent": current.get("name", set_name),
+                }
+            )
+    return items
@@ -0,0 +1,203 @@
+"""An opt-in, in-process cache of the data read from storage.
+
+Notebooks and report builders often open the same datasets many times in a session.
+With the cache enabled, the Arrow table of a full read is kept in memory, keyed by (repository, set name, 'as of' date),
+and later reads of the same dataset and version are served from it as long as the stored data has not changed.
+
+Freshness is checked on every read against a signature of the stored files that the data handler provides
+(see :py:meth:`~ssb_timeseries.io.pyarrow_simple.FileSystem.signature`):
+the modification time and size of local files, or the generation and size of GCS objects.
+Handlers without a ``signature`` method are not cached.
+
+Reads of selected series or intervals are served from a cached full table when there is one,
+but only full reads are added to the cache.
+Arrow tables are immutable, so the cached table is shared by all the datasets that read it, without copies.
+
+The total size of the cached tables, measured from their Arrow buffers, is kept within a byte budget
+by dropping the least recently used tables.
+
+.. code-block:: python
+
+    from ssb_timeseries.io import data_cache
+
+    with data_cache.enabled(max_bytes=2**30):
+        ...  # data_cache.stats() returns the hit and miss counters
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+from ..logging import logger
+
+if TYPE_CHECKING:
+    import pyarrow
+
+DEFAULT_MAX_BYTES = 512 * 2**20
+"""The default byte budget of the cache: 512 MiB."""
+
+CacheKey = tuple[str, str, datetime | None]
+"""The repository name, set name and 'as of' date (None for unversioned sets) of a cached table."""
+
+
+class DataCacheStats(NamedTuple):
+    """Counters for the data cache, see :py:func:`enable`."""
+
+    hits: int
+    misses: int
+    entries: int
+    nbytes: int
+
+
+class _Entry(NamedTuple):
+    signature: Any
+    table: pyarrow.Table
+    nbytes: int
+
+
+_entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+_lock = threading.Lock()
+_max_bytes: int | None = None
+_nbytes = 0
+_hits = 0
+_misses = 0
+
+
+def enable(max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+    """Cache full reads of dataset data in memory, within a budget of ``max_bytes``.
+
+    The cache is off by default.
+    Calling the function again sets a new budget and clears the cache.
+
+    Raises:
+        ValueError: If ``max_bytes`` is not positive.
+    """
+    global _max_bytes
+    if max_bytes <= 0:
+        raise ValueError(f"The data cache budget must be positive, got {max_bytes}.")
+    with _lock:
+        _max_bytes = max_bytes
+        _clear()
+
+
+def disable() -> None:
+    """Turn the data cache off and drop all cached tables."""
+    global _max_bytes
+    with _lock:
+        _max_bytes = None
+        _clear()
+
+
+def is_enabled() -> bool:
+    """Return True if the data cache is enabled."""
+    return _max_bytes is not None
+
+
+@contextmanager
+def enabled(max_bytes: int = DEFAULT_MAX_BYTES) -> Iterator[None]:
+    """Context manager that enables the data cache, and restores the previous setting on exit.
+
+    Example:
+        >>> # doctest: +SKIP
+        >>> with data_cache.enabled(max_bytes=2**30):
+        ...     build_report()
+        >>> # doctest: -SKIP
+    """
+    previous = _max_bytes
+    enable(max_bytes)
+    try:
+        yield
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
+
+
+def stats() -> DataCacheStats:
+    """Return the hit and miss counters, the number of entries and the total size of the data cache."""
+    with _lock:
+        return DataCacheStats(_hits, _misses, len(_entries), _nbytes)
+
+
+def reset_stats() -> None:
+    """Set the hit and miss counters of the data cache to zero."""
+    global _hits, _misses
+    with _lock:
+        _hits = 0
+        _misses = 0
+
+
+def clear() -> None:
+    """Drop all cached tables, and keep the cache enabled."""
+    with _lock:
+        _clear()
+
+
+def _clear() -> None:
+    global _nbytes
+    _entries.clear()
+    _nbytes = 0
+
+
+def get(key: CacheKey, signature: Any) -> pyarrow.Table | None:
+    """Return the cached table for a key if it was cached with the same signature, otherwise None.
+
+    A table cached with another signature is stale, and is dropped.
+    """
+    global _hits, _misses
+    if _max_bytes is None:
+        return None
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry.signature == signature:
+            _hits += 1
+            _entries.move_to_end(key)
+            return entry.table
+        _misses += 1
+        if entry is not None:
+            logger.debug("DATA_CACHE: %s changed in storage.", key)
+            _drop(key)
+        return None
+
+
+def put(key: CacheKey, signature: Any, table: pyarrow.Table) -> None:
+    """Cache a table read with a signature, dropping the least recently used tables to stay within the budget.
+
+    Tables larger than the budget are not cached.
+    """
+    global _nbytes
+    if _max_bytes is None:
+        return
+    nbytes = table.get_total_buffer_size()
+    with _lock:
+        if _max_bytes is None:
+            return
+        if key in _entries:
+            _drop(key)
+        if nbytes > _max_bytes:
+            logger.debug("DATA_CACHE: %s (%s bytes) exceeds the budget.", key, nbytes)
+            return
+        _entries[key] = _Entry(signature, table, nbytes)
+        _nbytes += nbytes
+        while _nbytes > _max_bytes:
+            _drop(next(iter(_entries)))
+
+
+def invalidate(key: CacheKey) -> None:
+    """Drop the cached table for a key, if any."""
+    with _lock:
+        if key in _entries:
+            _drop(key)
+
+
+def _drop(key: CacheKey) -> None:
+    global _nbytes
+    _nbytes -= _entries.pop(key).nbytes
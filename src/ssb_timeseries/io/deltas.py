@@ -0,0 +1,217 @@
+"""Append-only delta files for datasets with :py:attr:`~ssb_timeseries.types.Versioning.NONE`.
+
+In the default 'merge' write mode, writing to an unversioned dataset reads the existing data,
+merges the new data into it and rewrites everything.
+The cost of appending a single day to a long daily series is then proportional to the total size of the set.
+
+In 'append' mode, new data is instead written to a small delta file in a subdirectory next to the base file:
+
+.. code-block::
+
+    <dataset directory>/
+    ├── my_dataset-latest-data.parquet
+    └── _deltas/
+        ├── 01717171717171717171-1a2b3c4d.parquet
+        └── 01717171818181818181-5e6f7a8b.parquet
+
+Delta file names start with a zero padded nanosecond timestamp, so that sorting by name gives write order.
+Within a process, the timestamps are strictly increasing.
+Reads merge the base data and the deltas in that order with last-writer-wins semantics on the date columns,
+exactly as :py:func:`~ssb_timeseries.dataframes.merge_data` would have done at write time.
+
+Compaction folds the deltas back into the base file.
+It can be called explicitly and is triggered when the number or the total size of deltas exceeds a threshold.
+Only the deltas that were folded in are removed, and since re-applying a delta to data that already contains it
+gives the same result, concurrent reads see consistent data at any point during compaction.
+
+Write mode and thresholds are set per repository in the data handler options:
+
+.. code-block:: json
+
+    "directory": {
+        "handler": "simple-parquet",
+        "options": {
+            "path": "...",
+            "write_mode": "append",
+            "delta_max_files": 20,
+            "delta_max_bytes": 67108864
+        }
+    }
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+import narwhals as nw
+import pyarrow
+
+from ..dataframes import is_empty
+from ..dataframes import merge_data
+from ..logging import logger
+from . import fs
+from .predicates import filter_interval
+from .predicates import projected_columns
+
+if TYPE_CHECKING:
+    from .. import types
+    from ..intervals import Interval
+
+# mypy: disable-error-code="no-any-return, arg-type"
+
+DELTA_DIRECTORY = "_deltas"
+WRITE_MODES = ("merge", "append")
+DEFAULT_WRITE_MODE = "merge"
+DELTA_MAX_FILES = 20
+DELTA_MAX_BYTES = 64 * 1024 * 1024
+
+_sequence_lock = threading.Lock()
+_last_sequence = 0
+
+
+class DeltaOptions(NamedTuple):
+    """Write mode and compaction thresholds for a repository."""
+
+    write_mode: str
+    max_files: int
+    max_bytes: int
+
+
+def options(repository: dict[str, Any]) -> DeltaOptions:
+    """Return the delta options from the data handler options of a repository configuration."""
+    handler_options = repository.get("directory", {}).get("options", {})
+    write_mode = handler_options.get("write_mode", DEFAULT_WRITE_MODE)
+    if write_mode not in WRITE_MODES:
+        raise ValueError(
+            f"Unknown write_mode '{write_mode}'. Expected one of {WRITE_MODES}."
+        )
+    return DeltaOptions(
+        write_mode=write_mode,
+        max_files=int(handler_options.get("delta_max_files", DELTA_MAX_FILES)),
+        max_bytes=int(handler_options.get("delta_max_bytes", DELTA_MAX_BYTES)),
+    )
+
+
+def delta_directory(directory: str) -> str:
+    """Return the delta directory for a dataset directory."""
+    return os.path.join(directory, DELTA_DIRECTORY)
+
+
+def delta_files(directory: str) -> list[str]:
+    """Return the delta files of a dataset directory in write order."""
+    return sorted(fs.ls(delta_directory(directory), pattern="*.parquet"))
+
+
+def write_delta(
+    directory: str,
+    data: Any,
+    schema: pyarrow.Schema | None = None,
+) -> str:
+    """Write a delta file and return its path."""
+    name = f"{_next_sequence():020d}-{uuid.uuid4().hex[:8]}.parquet"
+    path = os.path.join(delta_directory(directory), name)
+    fs.write_parquet(data=data, path=path, schema=schema)
+    logger.debug("DATASET.write.delta: wrote %s.", path)
+    return path
+
+
+def _next_sequence() -> int:
+    """Return a nanosecond timestamp that is strictly increasing within the process."""
+    global _last_sequence
+    with _sequence_lock:
+        _last_sequence = max(time.time_ns(), _last_sequence + 1)
+        return _last_sequence
+
+
+def read_deltas(
+    paths: list[str],
+    date_columns: list[str],
+    interval: Interval | None = None,
+    columns: list[str] | None = None,
+) -> list[pyarrow.Table]:
+    """Read delta files, applying the same interval and column selection as for the base data."""
+    tables = []
+    for path in paths:
+        parquet_file = fs.parquet_file(path)
+        # deltas only exist for unversioned sets, so the 'as_of' column is never needed
+        names = [n for n in parquet_file.schema_arrow.names if n != "as_of"]
+        selected = projected_columns(names, date_columns, columns) or names
+        table = parquet_file.read(columns=selected)
+        tables.append(filter_interval(table, date_columns, interval))
+    return tables
+
+
+def apply_deltas(
+    base: Any,
+    deltas: list[pyarrow.Table],
+    data_type: types.SeriesType,
+) -> Any:
+    """Merge deltas into base data in write order, the last writer wins.
+
+    The deltas are combined first, keeping the last row for each combination of date columns,
+    so that the base data is merged only once.
+    """
+    non_empty = [nw.from_native(d) for d in deltas if d.num_rows > 0]
+    if not non_empty:
+        return base
+    date_columns = [c for c in data_type.date_columns if c in non_empty[0].columns]
+    combined = (
+        nw.concat(non_empty, how="diagonal")
+        .unique(subset=date_columns, keep="last", maintain_order=True)
+        .to_arrow()
+    )
+    if is_empty(base):
+        return combined
+    return merge_data(
+        old=base,
+        new=combined,
+        date_cols=data_type.date_columns,
+        temporality=data_type.temporality,
+    )
+
+
+def tagged_schema(
+    table: pyarrow.Table, schemas: list[pyarrow.Schema]
+) -> pyarrow.Schema:
+    """Return the schema of a merged table with the tags embedded in the latest of the schemas it was merged from.
+
+    The schemas are given in write order: the base file first, then the deltas.
+    Each field, and the schema itself, takes the metadata of the last schema that has metadata for it,
+    so that the tags of series added by later writes are kept.
+    """
+
+    def latest(metadata: list[dict | None]) -> dict | None:
+        return next((m for m in reversed(metadata) if m), None)
+
+    fields = [
+        field.with_metadata(
+            latest(
+                [s.field(field.name).metadata for s in schemas if field.name in s.names]
+            )
+        )
+        for field in table.schema
+    ]
+    return pyarrow.schema(fields, metadata=latest([s.metadata for s in schemas]))
+
+
+def needs_compaction(paths: list[str], opts: DeltaOptions) -> bool:
+    """Check if the deltas exceed the configured number of files or total size."""
+    if len(paths) >= opts.max_files:
+        return True
+    total_size = 0
+    for path in paths:
+        signature = fs.file_signature(path)
+        total_size += signature[1] if signature else 0
+    return total_size >= opts.max_bytes
+
+
+def remove_deltas(paths: list[str]) -> None:
+    """Remove delta files that have been folded into the base data."""
+    for path in paths:
+        fs.rm(path)
@@ -0,0 +1,305 @@
+"""An opt-in, persistent local disk cache for files read from object storage.
+
+Jobs that read the same large reference datasets from GCS in every run spend most of their time downloading them.
+With the cache enabled, the Parquet and JSON readers of :py:mod:`~ssb_timeseries.io.fs`
+read remote files (``gs://``, ``memory://``, ...) through local copies in a cache directory.
+Local paths are never cached.
+
+Every read checks the signature of the remote file (see :py:func:`~ssb_timeseries.io.fs.file_signature`):
+the object generation and size on GCS, or the modification time and size for other filesystems.
+The signature is part of the name of the local copy, so a changed file is downloaded again,
+and older copies of it are removed.
+
+The cache directory can be shared by concurrent processes, and is kept between them:
+
+* A file is downloaded to a temporary file in the cache directory, which is then renamed into place.
+  The rename is atomic, so a copy is either complete or not there.
+* File locks keep processes from downloading the same file at the same time,
+  and a lock on the directory serialises the eviction of old copies.
+  Remote files share a fixed number of lock files by the hash of their path,
+  so lock files do not accumulate in the directory.
+  File locks are only used where :py:mod:`fcntl` is available;
+  elsewhere, a file may occasionally be downloaded twice, but copies are still never partial.
+
+The total size of the copies is kept within a byte budget by removing the least recently used files,
+as recorded by their modification times, which are updated on every hit.
+Files larger than the budget are read directly from the remote filesystem.
+
+.. code-block:: python
+
+    from ssb_timeseries.io import disk_cache
+
+    with disk_cache.enabled("/home/jovyan/.cache/ssb-timeseries", max_bytes=10 * 2**30):
+        ...  # disk_cache.stats() returns the hit and miss counters
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from typing import NamedTuple
+
+from ..logging import logger
+from ..types import PathStr
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not on Windows
+    fcntl = None  # type: ignore[assignment]
+
+# mypy: disable-error-code="no-untyped-def"
+
+DEFAULT_MAX_BYTES = 10 * 2**30
+"""The default byte budget of the cache: 10 GiB."""
+
+DEFAULT_DIRECTORY = Path.home() / ".cache" / "ssb-timeseries"
+"""The default cache directory."""
+
+_LOCK_SUFFIX = ".lock"
+_LOCK_STRIPES = 64
+"""The number of lock files shared by the remote files for downloads."""
+_PART_SUFFIX = ".part"
+_PART_MAX_AGE = 3600.0
+"""Seconds after which temporary files left by interrupted downloads are removed."""
+
+
+class DiskCacheStats(NamedTuple):
+    """Counters for the disk cache, see :py:func:`enable`.
+
+    The hits and misses are counted in this process,
+    the number of entries and their total size are those of the cache directory.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    nbytes: int
+
+
+_lock = threading.Lock()
+_directory: str | None = None
+_max_bytes = DEFAULT_MAX_BYTES
+_hits = 0
+_misses = 0
+
+
+def enable(
+    directory: PathStr = DEFAULT_DIRECTORY, max_bytes: int = DEFAULT_MAX_BYTES
+) -> None:
+    """Read remote files through local copies in ``directory``, within a budget of ``max_bytes``.
+
+    The cache is off by default.
+    Copies already in the directory, for instance from earlier runs, are used if they are still current.
+
+    Raises:
+        ValueError: If ``max_bytes`` is not positive.
+    """
+    global _directory, _max_bytes
+    if max_bytes <= 0:
+        raise ValueError(f"The disk cache budget must be positive, got {max_bytes}.")
+    os.makedirs(directory, exist_ok=True)
+    with _lock:
+        _directory = str(directory)
+        _max_bytes = max_bytes
+    _evict(_directory, max_bytes)
+
+
+def disable() -> None:
+    """Turn the disk cache off. The cache directory is left as it is."""
+    global _directory
+    with _lock:
+        _directory = None
+
+
+def is_enabled() -> bool:
+    """Return True if the disk cache is enabled."""
+    return _directory is not None
+
+
+@contextmanager
+def enabled(
+    directory: PathStr = DEFAULT_DIRECTORY, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Iterator[None]:
+    """Context manager that enables the disk cache, and restores the previous setting on exit.
+
+    Example:
+        >>> # doctest: +SKIP
+        >>> with disk_cache.enabled("/tmp/cache", max_bytes=2**30):
+        ...     run_job()
+        >>> # doctest: -SKIP
+    """
+    previous = (_directory, _max_bytes)
+    enable(directory, max_bytes)
+    try:
+        yield
+    finally:
+        if previous[0] is None:
+            disable()
+        else:
+            enable(*previous)
+
+
+def stats() -> DiskCacheStats:
+    """Return the hit and miss counters, and the number of entries and total size of the cache directory."""
+    directory = _directory
+    files = _entries(directory) if directory else []
+    with _lock:
+        return DiskCacheStats(_hits, _misses, len(files), sum(f[2] for f in files))
+
+
+def reset_stats() -> None:
+    """Set the hit and miss counters of the disk cache to zero."""
+    global _hits, _misses
+    with _lock:
+        _hits = 0
+        _misses = 0
+
+
+def clear() -> None:
+    """Remove all cached copies from the cache directory, and keep the cache enabled."""
+    directory = _directory
+    if directory is None:
+        return
+    with _locked(os.path.join(directory, _LOCK_SUFFIX)):
+        for path, _, _ in _entries(directory):
+            _remove(path)
+
+
+def local_copy(
+    key: str,
+    signature: tuple[int | str, int],
+    download: Callable[[str], None],
+    suffix: str = "",
+) -> str | None:
+    """Return the path of an up to date local copy of a remote file, downloading it on a miss.
+
+    Args:
+        key: A normalised path of the remote file.
+        signature: The (modification marker, size) of the remote file.
+        download: A function that writes the remote file to a given local path.
+        suffix: The file name suffix of the copy, like '.parquet'.
+
+    Returns:
+        The path of the copy, or None if the cache is disabled, the file exceeds the budget,
+        or the downloaded size did not match the signature (the remote file changed while it was read).
+    """
+    global _hits, _misses
+    directory, max_bytes = _directory, _max_bytes
+    if directory is None:
+        return None
+    if signature[1] > max_bytes:
+        logger.debug("DISK_CACHE: %s (%s bytes) exceeds the budget.", key, signature[1])
+        return None
+    prefix = hashlib.sha256(key.encode()).hexdigest()[:40]
+    version = hashlib.sha256(repr(signature).encode()).hexdigest()[:16]
+    target = os.path.join(directory, f"{prefix}-{version}{suffix}")
+    if _touch(target):
+        with _lock:
+            _hits += 1
+        return target
+    stripe = int(prefix, 16) % _LOCK_STRIPES
+    with _locked(os.path.join(directory, f"download-{stripe:02d}{_LOCK_SUFFIX}")):
+        # another process may have downloaded the file while this one waited for the lock
+        if _touch(target):
+            with _lock:
+                _hits += 1
+            return target
+        with _lock:
+            _misses += 1
+        fd, part = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=_PART_SUFFIX)
+        os.close(fd)
+        try:
+            download(part)
+            size = os.path.getsize(part)
+            if size != signature[1]:
+                logger.debug(
+                    "DISK_CACHE: %s changed while it was downloaded (%s bytes, expected %s).",
+                    key,
+                    size,
+                    signature[1],
+                )
+                return None
+            os.replace(part, target)
+        finally:
+            _remove(part)
+        for stale in Path(directory).glob(f"{prefix}-*"):
+            if str(stale) != target and not stale.name.endswith(_PART_SUFFIX):
+                logger.debug("DISK_CACHE: %s changed in storage.", key)
+                _remove(str(stale))
+    _evict(directory, max_bytes, keep=target)
+    return target
+
+
+def _entries(directory: str) -> list[tuple[str, float, int]]:
+    """Return (path, modification time, size) of the cached copies in a directory."""
+    found = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith((_LOCK_SUFFIX, _PART_SUFFIX)):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            found.append((entry.path, stat.st_mtime, stat.st_size))
+    return found
+
+
+def _evict(directory: str, max_bytes: int, keep: str = "") -> None:
+    """Remove the least recently used copies until the cache is within its budget, and old temporary files."""
+    with _locked(os.path.join(directory, _LOCK_SUFFIX)):
+        expired = time.time() - _PART_MAX_AGE
+        for part in Path(directory).glob(f"*{_PART_SUFFIX}"):
+            try:
+                if part.stat().st_mtime < expired:
+                    _remove(str(part))
+            except FileNotFoundError:
+                continue
+        files = _entries(directory)
+        nbytes = sum(f[2] for f in files)
+        for path, _, size in sorted(files, key=lambda f: f[1]):
+            if nbytes <= max_bytes:
+                break
+            if path == keep:
+                continue
+            logger.debug("DISK_CACHE: evicting %s.", path)
+            _remove(path)
+            nbytes -= size
+
+
+def _touch(path: str) -> bool:
+    """Mark a copy as recently used; return False if there is no such copy."""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+@contextmanager
+def _locked(path: str) -> Iterator[Any]:
+    """Hold an exclusive lock on a lock file, where file locks are supported."""
+    if fcntl is None:
+        yield None
+        return
+    with open(path, "a") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            yield file
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
@@ -0,0 +1,684 @@
+"""Provides DuckDB-based handlers for both data and metadata, storing a whole repository in a single database file.
+
+Repositories with many small datasets spread them over thousands of small Parquet and JSON files,
+and pay the latency of opening a file for every read.
+These handlers instead keep all datasets and their metadata in one local DuckDB database:
+
+.. code-block::
+
+    <repository_root>/
+    └── timeseries.duckdb
+        ├── data."<VERSIONING>_<TEMPORALITY>/<set name>"   one wide table per dataset
+        ├── datasets                                         dataset tags (JSON)
+        ├── series                                           series tags (JSON)
+        └── tags                                             one row per (object, attribute, value), indexed
+
+Each dataset table has the date columns followed by one DOUBLE column per series,
+and for AS_OF versioning an 'as_of' column, so versions are stored as rows.
+The (as_of and) date columns are a unique key:
+writes to unversioned datasets are merged with ``INSERT OR REPLACE``,
+and a write to a version replaces all rows of that version.
+Interval and series selections are pushed down to SQL,
+and results are returned as Arrow tables.
+
+Tag searches are answered from the indexed ``tags`` table rather than by parsing every metadata document.
+
+The database is placed in the 'directory' path of the repository, or set explicitly with the 'database' option.
+It must be on a local filesystem, and can only be opened by one process at a time.
+Within a process, a connection is shared between handlers and each operation uses its own cursor.
+
+.. code-block:: json
+
+    "io_handlers": {
+        "duckdb-data": {"handler": "ssb_timeseries.io.duckdb_io.DuckDbDataIO"},
+        "duckdb-meta": {"handler": "ssb_timeseries.io.duckdb_io.DuckDbMetaIO"}
+    }
+
+Snapshots (:py:func:`ssb_timeseries.io.persist`) copy data files, and are not supported.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+import duckdb
+import pyarrow
+from narwhals.typing import FrameT
+
+from .. import types
+from ..config import Config
+from ..config import FileBasedRepository
+from ..dataframes import empty_frame
+from ..dataframes import to_arrow
+from ..dates import date_utc
+from ..dates import datelike_to_utc
+from ..dates import standardize_dates
+from ..logging import logger
+from . import fs
+from .json_helpers import sanitize_for_json
+from .json_metadata import _build_dataset_item
+from .predicates import interval_sql
+from .predicates import projected_columns
+
+# mypy: disable-error-code="arg-type, return-value, attr-defined, union-attr, no-any-return"
+
+DATABASE_FILE = "timeseries.duckdb"
+DATA_SCHEMA = "data"
+
+_TIMESTAMP = pyarrow.timestamp(unit="ns", tz="UTC")
+
+_CATALOG_TABLES = f"""
+CREATE SCHEMA IF NOT EXISTS {DATA_SCHEMA};
+CREATE TABLE IF NOT EXISTS datasets (
+    name VARCHAR PRIMARY KEY,
+    repository VARCHAR,
+    tags VARCHAR
+);
+CREATE TABLE IF NOT EXISTS series (
+    dataset VARCHAR,
+    name VARCHAR,
+    position INTEGER,
+    tags VARCHAR,
+    PRIMARY KEY (dataset, name)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    dataset VARCHAR,
+    series VARCHAR,
+    attribute VARCHAR,
+    value VARCHAR
+);
+CREATE INDEX IF NOT EXISTS tags_by_value ON tags (attribute, value);
+"""
+
+_connections: dict[str, duckdb.DuckDBPyConnection] = {}
+_connections_lock = threading.Lock()
+
+
+def database_path(repository: dict[str, Any]) -> str:
+    """Return the path of the database file of a repository.
+
+    The 'database' option of the 'directory' or 'catalog' section takes precedence.
+    Otherwise the database is ``timeseries.duckdb`` in the 'directory' (or 'catalog') path.
+    """
+    sections = [
+        repository[s].get("options", {})
+        for s in ("directory", "catalog")
+        if s in repository
+    ]
+    for options in sections:
+        if "database" in options:
+            path = str(options["database"])
+            break
+    else:
+        path = os.path.join(str(sections[0]["path"]), DATABASE_FILE)
+    if fs.is_gcs(path):
+        raise ValueError(f"DuckDB databases must be on a local filesystem, not {path}.")
+    return path
+
+
+def connect(path: str) -> duckdb.DuckDBPyConnection:
+    """Return a new cursor on the shared connection to a database file.
+
+    The database and the catalog tables are created on first use.
+    Use the cursor as a context manager to close it after use.
+    """
+    with _connections_lock:
+        connection = _connections.get(path)
+        if connection is None:
+            fs.mk_parent_dir(path)
+            connection = duckdb.connect(path)
+            connection.execute(_CATALOG_TABLES)
+            _connections[path] = connection
+            logger.debug("DuckDB connected to %s.", path)
+    return connection.cursor()
+
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _as_json(value: Any) -> str:
+    """Serialize a tag value so that equal values give equal strings."""
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class DuckDbDataIO:
+    """Reads and writes dataset data to a table in the DuckDB database of the repository."""
+
+    def __init__(
+        self,
+        repository: Any,
+        set_name: str,
+        set_type: types.SeriesType,
+        as_of_utc: datetime | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the handler for a given dataset.
+
+        Args:
+            repository: The repository configuration dictionary, or the name of a configured repository.
+            set_name: The name of the dataset.
+            set_type: The type of the dataset.
+            as_of_utc: The version of the dataset; required for AS_OF versioning.
+            **kwargs: Ignored, for compatibility with the file based handlers.
+        """
+        if isinstance(repository, dict):
+            self.repository = repository
+        else:
+            self.repository = Config.active().repositories.get(repository)
+        self.set_name = set_name
+        self.data_type = set_type
+        if as_of_utc is None and set_type.versioning == types.Versioning.AS_OF:
+            raise ValueError(
+                "An 'as of' datetime must be specified when the type has versioning of type Versioning.AS_OF."
+            )
+        self.as_of_utc = as_of_utc
+
+    @cached_property
+    def database(self) -> str:
+        """Return the path of the database file."""
+        return database_path(self.repository)
+
+    @cached_property
+    def table_name(self) -> str:
+        """Return the name of the dataset table, without the schema."""
+        return f"{self.data_type!s}/{self.set_name}"
+
+    @cached_property
+    def table(self) -> str:
+        """Return the quoted, schema qualified name of the dataset table."""
+        return f"{DATA_SCHEMA}.{_quote(self.table_name)}"
+
+    @property
+    def _is_versioned(self) -> bool:
+        return self.data_type.versioning == types.Versioning.AS_OF
+
+    def _stored_columns(self, cursor: duckdb.DuckDBPyConnection) -> list[str]:
+        """Return the columns of the dataset table, or an empty list if there is no table."""
+        rows = cursor.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = ? AND table_name = ? ORDER BY ordinal_position",
+            [DATA_SCHEMA, self.table_name],
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    @property
+    def exists(self) -> bool:
+        """Check if the dataset (version) has been written."""
+        with connect(self.database) as cursor:
+            if not self._stored_columns(cursor):
+                return False
+            if not self._is_versioned:
+                return True
+            row = cursor.execute(
+                f"SELECT 1 FROM {self.table} WHERE as_of = ? LIMIT 1",
+                [self.as_of_utc],
+            ).fetchone()
+            return row is not None
+
+    def _select(
+        self,
+        conditions: list[str],
+        parameters: list[Any],
+        interval: Any,
+        columns: list[str] | None,
+        with_as_of: bool,
+    ) -> pyarrow.Table:
+        """Select the date columns and series within the interval, with any extra conditions."""
+        date_columns = self.data_type.temporality.date_columns
+        with connect(self.database) as cursor:
+            stored = self._stored_columns(cursor)
+            selected = projected_columns(
+                stored, self.data_type.date_columns, columns
+            ) or list(stored)
+            if not with_as_of:
+                selected = [c for c in selected if c != "as_of"]
+            interval_condition = interval_sql(date_columns, interval)
+            if interval_condition is not None:
+                conditions = [*conditions, interval_condition[0]]
+                parameters = [*parameters, *interval_condition[1]]
+            order = ["as_of", *date_columns] if with_as_of else date_columns
+            query = (
+                f"SELECT {', '.join(_quote(c) for c in selected)} FROM {self.table}"
+                + (f" WHERE {' AND '.join(conditions)}" if conditions else "")
+                + f" ORDER BY {', '.join(_quote(c) for c in order)}"
+            )
+            logger.debug("DATASET.read %s: %s %s", self.set_name, query, parameters)
+            table = cursor.execute(query, parameters).to_arrow_table()
+        # DuckDB timestamps have microsecond precision; only the date columns are converted
+        for i, name in enumerate(table.column_names):
+            if name in date_columns or name == "as_of":
+                table = table.set_column(i, name, table[name].cast(_TIMESTAMP))
+        return table
+
+    def read(
+        self,
+        interval: Any = None,
+        columns: list[str] | None = None,
+    ) -> pyarrow.Table:
+        """Read the data of the dataset (version) from the database.
+
+        If an interval is provided, only rows within it are read.
+        If a list of columns (series names) is provided, only those columns and the date columns are read.
+
+        Returns an empty dataframe if the dataset (version) does not exist.
+        """
+        if not self.exists:
+            logger.debug("No table %s - return empty frame instead.", self.table)
+            return empty_frame()
+        conditions, parameters = [], []
+        if self._is_versioned:
+            conditions, parameters = ["as_of = ?"], [self.as_of_utc]
+        return self._select(conditions, parameters, interval, columns, False)
+
+    def read_versions(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        interval: Any = None,
+        columns: list[str] | None = None,
+    ) -> pyarrow.Table:
+        """Read all versions with 'as of' dates from ``from_`` to ``to`` (inclusive) in a single query.
+
+        The result has an 'as_of' column, and is sorted by 'as_of' and the date columns.
+        """
+        if not self._is_versioned:
+            raise ValueError(
+                f"Reading versions requires Versioning.AS_OF, {self.set_name} has {self.data_type.versioning}."
+            )
+        with connect(self.database) as cursor:
+            if not self._stored_columns(cursor):
+                return empty_frame()
+        conditions, parameters = [], []
+        if from_ is not None:
+            conditions.append("as_of >= ?")
+            parameters.append(date_utc(from_))
+        if to is not None:
+            conditions.append("as_of <= ?")
+            parameters.append(date_utc(to))
+        table = self._select(conditions, parameters, interval, columns, True)
+        return table if table.num_rows else empty_frame()
+
+    def _to_table(self, data: FrameT) -> pyarrow.Table:
+        """Convert data to an Arrow table with UTC date columns and float64 series."""
+        table = datelike_to_utc(to_arrow(standardize_dates(data)))
+        if "as_of" in table.column_names:
+            table = table.drop(["as_of"])
+        date_columns = self.data_type.temporality.date_columns
+        series = [n for n in table.column_names if n not in date_columns]
+        schema = pyarrow.schema(
+            [pyarrow.field(d, _TIMESTAMP) for d in date_columns]
+            + [pyarrow.field(s, pyarrow.float64()) for s in series]
+        )
+        table = table.select(schema.names).cast(schema)
+        if self._is_versioned:
+            as_of = pyarrow.scalar(self.as_of_utc, type=_TIMESTAMP)
+            table = table.add_column(0, "as_of", pyarrow.repeat(as_of, table.num_rows))
+        return table
+
+    def _create_or_alter(
+        self, cursor: duckdb.DuckDBPyConnection, table: pyarrow.Table
+    ) -> list[str]:
+        """Create the dataset table, or add columns for new series, and return the stored columns."""
+        stored = self._stored_columns(cursor)
+        keys = [
+            *self.data_type.versioning.date_columns,
+            *self.data_type.temporality.date_columns,
+        ]
+        if not stored:
+            definitions = [
+                f"{_quote(n)} {'TIMESTAMPTZ' if n in keys else 'DOUBLE'}"
+                for n in table.column_names
+            ]
+            unique = f"UNIQUE ({', '.join(_quote(k) for k in keys)})" if keys else ""
+            cursor.execute(
+                f"CREATE TABLE {self.table} ({', '.join([*definitions, unique] if unique else definitions)})"
+            )
+            return list(table.column_names)
+        new_series = [n for n in table.column_names if n not in stored]
+        for name in new_series:
+            cursor.execute(f"ALTER TABLE {self.table} ADD COLUMN {_quote(name)} DOUBLE")
+        return [*stored, *new_series]
+
+    def write(self, data: FrameT, tags: dict | None = None) -> None:
+        """Write data to the dataset table.
+
+        If versioning is AS_OF, the rows of the version are replaced.
+        If versioning is NONE, rows with the same dates are replaced (``INSERT OR REPLACE``)
+        and other rows are kept, the same way :py:func:`~ssb_timeseries.dataframes.merge_data` merges files.
+        Series that are not in the new data are missing (null) in the replaced rows.
+        New series are added as columns.
+
+        The tags are not used; they are stored by the metadata handler.
+        """
+        table = self._to_table(data)
+        logger.info(
+            "DATASET.write.start %s: writing %s rows to %s in %s.",
+            self.set_name,
+            table.num_rows,
+            self.table,
+            self.database,
+        )
+        with connect(self.database) as cursor:
+            cursor.begin()
+            try:
+                stored = self._create_or_alter(cursor, table)
+                cursor.register("_new_data", table)
+                names = ", ".join(_quote(c) for c in stored)
+                if self._is_versioned:
+                    cursor.execute(
+                        f"DELETE FROM {self.table} WHERE as_of = ?", [self.as_of_utc]
+                    )
+                    insert = "INSERT INTO"
+                else:
+                    insert = "INSERT OR REPLACE INTO"
+                values = ", ".join(
+                    _quote(c) if c in table.column_names else "NULL" for c in stored
+                )
+                cursor.execute(
+                    f"{insert} {self.table} ({names}) SELECT {values} FROM _new_data"
+                )
+                cursor.unregister("_new_data")
+                cursor.commit()
+            except Exception:
+                cursor.rollback()
+                logger.exception(
+                    "DATASET.write.error %s: writing to %s failed.",
+                    self.set_name,
+                    self.table,
+                )
+                raise
+        logger.info("DATASET.write.success %s.", self.set_name)
+
+    def series(self) -> list[str]:
+        """List the series names of the dataset from the table columns.
+
+        For AS_OF versioning, series added in later versions are included (as missing values) in earlier versions.
+        """
+        with connect(self.database) as cursor:
+            stored = self._stored_columns(cursor)
+        return [n for n in stored if n not in {"as_of", *self.data_type.date_columns}]
+
+    def versions(self, *args: Any, **kwargs: Any) -> list[datetime | str]:
+        """List the version markers of the dataset.
+
+        For AS_OF versioning, the sorted 'as of' dates. Otherwise ``['latest']`` if the dataset exists.
+        """
+        with connect(self.database) as cursor:
+            if not self._stored_columns(cursor):
+                return []
+            if not self._is_versioned:
+                return ["latest"]
+            as_of = cursor.execute(
+                f"SELECT DISTINCT as_of FROM {self.table} ORDER BY as_of"
+            ).to_arrow_table()["as_of"]
+        return [date_utc(v) for v in as_of.cast(_TIMESTAMP).to_pylist()]
+
+
+class DuckDbMetaIO:
+    """Stores dataset and series tags in the DuckDB database of the repository, with an index for tag searches."""
+
+    def __init__(
+        self,
+        repository: FileBasedRepository,
+        set_name: str = "",
+    ) -> None:
+        """Initialize the handler for a given repository and dataset.
+
+        Args:
+            repository: The repository configuration dictionary.
+            set_name: The name of the dataset to operate on.
+        """
+        if isinstance(repository, dict | FileBasedRepository):
+            self.repository = repository
+        else:
+            raise TypeError("Repository must be a dict.")
+        self.repo_name = repository.get("name", "unnamed metadata repository")
+        self.set_name = set_name
+
+    @cached_property
+    def database(self) -> str:
+        """Return the path of the database file."""
+        return database_path(self.repository)
+
+    @property
+    def exists(self) -> bool:
+        """Check if there are tags for the dataset."""
+        with connect(self.database) as cursor:
+            row = cursor.execute(
+                "SELECT 1 FROM datasets WHERE name = ?", [self.set_name]
+            ).fetchone()
+        return row is not None
+
+    def read(self, **kwargs: Any) -> dict:
+        """Read and return the tags of a dataset.
+
+        Args:
+            **kwargs: May include 'set_name' to override the instance's default.
+        """
+        set_name = kwargs.get("set_name", self.set_name)
+        with connect(self.database) as cursor:
+            row = cursor.execute(
+                "SELECT tags FROM datasets WHERE name = ?", [set_name]
+            ).fetchone()
+        if row is None:
+            logger.info("DuckDbMetaIO.read: no tags for %s.", set_name)
+            return {"name": set_name}
+        return json.loads(row[0])
+
+    def write(
+        self,
+        tags: dict,
+        set_name: str,
+    ) -> None:
+        """Replace the tags of a dataset, its series and the tag index in one transaction.
+
+        Args:
+            tags: The dictionary of metadata to write.
+            set_name: The name of the dataset.
+        """
+        sanitized = sanitize_for_json(tags)
+        series_tags = sanitized.get("series", {}) or {}
+        series = pyarrow.table(
+            {
+                "dataset": pyarrow.array(
+                    [set_name] * len(series_tags), pyarrow.string()
+                ),
+                "name": pyarrow.array(list(series_tags), pyarrow.string()),
+                "position": pyarrow.array(range(len(series_tags)), pyarrow.int32()),
+                "tags": pyarrow.array(
+                    [json.dumps(t) for t in series_tags.values()], pyarrow.string()
+                ),
+            }
+        )
+        index_rows: list[tuple[str, str, str]] = [
+            ("", k, _as_json(v)) for k, v in sanitized.items() if k != "series"
+        ]
+        for name, attributes in series_tags.items():
+            index_rows.extend((name, k, _as_json(v)) for k, v in attributes.items())
+        index = pyarrow.table(
+            {
+                "dataset": pyarrow.array(
+                    [set_name] * len(index_rows), pyarrow.string()
+                ),
+                "series": pyarrow.array([r[0] for r in index_rows], pyarrow.string()),
+                "attribute": pyarrow.array(
+                    [r[1] for r in index_rows], pyarrow.string()
+                ),
+                "value": pyarrow.array([r[2] for r in index_rows], pyarrow.string()),
+            }
+        )
+        logger.info(
+            "DuckDbMetaIO.write.start %s: %s series.", set_name, len(series_tags)
+        )
+        with connect(self.database) as cursor:
+            cursor.begin()
+            try:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO datasets VALUES (?, ?, ?)",
+                    [set_name, sanitized.get("repository"), json.dumps(sanitized)],
+                )
+                cursor.execute("DELETE FROM series WHERE dataset = ?", [set_name])
+                cursor.execute("DELETE FROM tags WHERE dataset = ?", [set_name])
+                cursor.register("_new_series", series)
+                cursor.register("_new_tags", index)
+                cursor.execute("INSERT INTO series SELECT * FROM _new_series")
+                cursor.execute("INSERT INTO tags SELECT * FROM _new_tags")
+                cursor.unregister("_new_series")
+                cursor.unregister("_new_tags")
+                cursor.commit()
+            except Exception:
+                cursor.rollback()
+                logger.exception("DuckDbMetaIO.write.error %s.", set_name)
+                raise
+        logger.info("DuckDbMetaIO.write.success %s.", set_name)
+
+    def search(self, **kwargs: Any) -> list[dict]:
+        """Search the catalog for datasets and series matching given criteria.
+
+        Dataset names are matched with 'equals', 'contains' or a glob 'pattern',
+        the same way as :py:class:`~ssb_timeseries.io.json_metadata.JsonMetaIO`.
+        Tag criteria are resolved with the (attribute, value) index of the ``tags`` table.
+
+        Args:
+            **kwargs: Search criteria including 'equals', 'contains', 'pattern',
+                'tags', 'datasets' (bool), and 'series' (bool).
+
+        Returns:
+            A list of dictionaries, where each dictionary represents a
+            matching dataset or series.
+        """
+        name_pattern = _name_pattern(**kwargs)
+        matching = _matching_objects(kwargs.get("tags") or {})
+        parameters = [] if matching is None else matching[1]
+        results = []
+        with connect(self.database) as cursor:
+            if kwargs.get("datasets", True):
+                join = (
+                    ""
+                    if matching is None
+                    else f"JOIN ({matching[0]}) m ON m.dataset = d.name AND m.series = ''"
+                )
+                rows = cursor.execute(
+                    f"SELECT d.repository, d.tags FROM datasets d {join} "
+                    "WHERE d.name GLOB ? ORDER BY d.name",
+                    [*parameters, name_pattern],
+                ).fetchall()
+                results.extend(
+                    _build_dataset_item(json.loads(tags), repository)
+                    for repository, tags in rows
+                )
+            if kwargs.get("series", False):
+                join = (
+                    ""
+                    if matching is None
+                    else f"JOIN ({matching[0]}) m ON m.dataset = s.dataset AND m.series = s.name"
+                )
+                rows = cursor.execute(
+                    "SELECT d.repository, s.dataset, s.name, s.tags "
+                    f"FROM series s JOIN datasets d ON d.name = s.dataset {join} "
+                    "WHERE d.name GLOB ? ORDER BY s.dataset, s.position",
+                    [*parameters, name_pattern],
+                ).fetchall()
+                results.extend(
+                    {
+                        "repository_name": repository,
+                        "object_name": name,
+                        "object_type": "series",
+                        "object_tags": json.loads(tags),
+                        "parent": dataset,
+                    }
+                    for repository, dataset, name, tags in rows
+                )
+        return results
+
+
+def _name_pattern(
+    pattern: str = "", contains: str = "", equals: str = "", **kwargs: Any
+) -> str:
+    """Return a glob pattern for dataset names from the search arguments."""
+    if equals:
+        return equals
+    if contains:
+        return f"*{contains}*"
+    return pattern or "*"
+
+
+def _matching_objects(criteria: dict | list[dict]) -> tuple[str, list[str]] | None:
+    """Return a query for the (dataset, series) keys of objects with tags matching the criteria.
+
+    Dataset level tags have series ''. Within a dict all attributes must match, a list value matches any of its items.
+    A list of dicts matches if any of them does. Returns None if the criteria match everything.
+    As in :py:func:`~ssb_timeseries.meta.tags.matches_criteria`, the value None also matches objects without the attribute.
+    """
+    if isinstance(criteria, dict):
+        criteria = [criteria]
+    elif not isinstance(criteria, list):
+        raise TypeError(f"Cannot check tags of type '{type(criteria)}'.")
+    if not criteria or any(not c for c in criteria):
+        return None
+
+    queries, parameters = [], []
+    for c in criteria:
+        values_by_attribute = {
+            attribute: value if isinstance(value, list) else [value]
+            for attribute, value in c.items()
+        }
+        if any(None in values for values in values_by_attribute.values()):
+            query, query_parameters = _matching_with_missing(values_by_attribute)
+            queries.append(query)
+            parameters.extend(query_parameters)
+            continue
+        conditions = []
+        for attribute, values in values_by_attribute.items():
+            if not values:
+                conditions.append("FALSE")
+                continue
+            conditions.append(
+                f"(attribute = ? AND value IN ({', '.join('?' * len(values))}))"
+            )
+            parameters.extend([attribute, *(_as_json(v) for v in values)])
+        queries.append(
+            f"SELECT dataset, series FROM tags WHERE {' OR '.join(conditions)} "
+            f"GROUP BY dataset, series HAVING count(DISTINCT attribute) = {len(c)}"
+        )
+    return (" UNION ".join(queries), parameters)
+
+
+_ALL_OBJECTS = (
+    "SELECT name AS dataset, '' AS series FROM datasets "
+    "UNION ALL SELECT dataset, name AS series FROM series"
+)
+
+
+def _matching_with_missing(
+    values_by_attribute: dict[str, list[Any]],
+) -> tuple[str, list[str]]:
+    """Return a query for the objects matching all attributes, where a None value also matches objects without the attribute."""
+    queries, parameters = [], []
+    for attribute, values in values_by_attribute.items():
+        if not values:
+            queries.append("SELECT dataset, series FROM tags WHERE FALSE")
+            continue
+        query = (
+            "SELECT dataset, series FROM tags "
+            f"WHERE attribute = ? AND value IN ({', '.join('?' * len(values))})"
+        )
+        parameters.extend([attribute, *(_as_json(v) for v in values)])
+        if None in values:
+            query = (
+                f"{query} UNION SELECT * FROM ({_ALL_OBJECTS} "
+                "EXCEPT SELECT dataset, series FROM tags WHERE attribute = ?)"
+            )
+            parameters.append(attribute)
+        queries.append(query)
+    return (
+        " INTERSECT ".join(f"SELECT * FROM ({q})" for q in queries),
+        parameters,
+    )
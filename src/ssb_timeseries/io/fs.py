@@ -6,32 +6,130 @@ import functools
 import glob
 import json
 import os
+import re
 import shutil
+import threading
+import time
+import uuid
 from _collections_abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextlib import suppress
 from pathlib import Path
+from typing import Any
+from typing import NamedTuple
 
+import fsspec
 import narwhals
 import pyarrow
-import pyarrow.dataset
 import pyarrow.parquet as pq
 import tomli
 import tomli_w
-from gcsfs import GCSFileSystem
 from narwhals.typing import IntoFrame
 
 from ..dataframes import to_arrow
+from ..logging import logger
 from ..types import F
 from ..types import PathStr
+from . import disk_cache
 
 # mypy: disable-error-code="arg-type, type-arg, no-any-return, no-untyped-def, import-untyped, attr-defined, type-var, index, return-value"
 
 
+MAX_CONCURRENT_READS = 16
+"""The default number of threads for reading many small files, see :py:func:`read_json_many`."""
+
+LOCAL = "file"
+"""The protocol of local paths, with or without a ``file://`` prefix."""
+
+_PROTOCOL = re.compile(r"^([a-zA-Z][a-zA-Z0-9+.-]+):/+")
+_PROTOCOL_ALIASES = {"gcs": "gs", "local": LOCAL}
+_filesystems: dict[tuple[str, str], Any] = {}
+_filesystems_lock = threading.Lock()
+
+_listings: dict[tuple[str, str, str], tuple[float, Any]] = {}
+_listings_lock = threading.Lock()
+_listing_ttl: float | None = None
+_listing_hits = 0
+_listing_misses = 0
+_listing_generation = 0
+_clock = time.monotonic
+
+
+def _gcs_filesystem() -> Any:
+    """Return a GCS filesystem object; gcsfs is imported on first use."""
+    from gcsfs import GCSFileSystem
+
+    return GCSFileSystem()
+
+
+def protocol(path: PathStr) -> str:
+    """Return the protocol of a path: 'file' for local paths, otherwise the URL scheme, like 'gs' or 'memory'."""
+    match = _PROTOCOL.match(str(path))
+    if not match:
+        return LOCAL
+    name = match.group(1).lower()
+    return _PROTOCOL_ALIASES.get(name, name)
+
+
+def filesystem(path: PathStr = "") -> Any:
+    """Return the fsspec filesystem for the protocol of a path.
+
+    Filesystem objects are created on first use and cached per protocol (and per bucket for GCS),
+    so that clients and their connections are reused by all calls in the process.
+    """
+    name = protocol(path)
+    bucket = _strip(path).split("/", 1)[0] if name == "gs" else ""
+    with _filesystems_lock:
+        cached = _filesystems.get((name, bucket))
+        if cached is None:
+            if name == "gs":
+                cached = _gcs_filesystem()
+            else:
+                cached = fsspec.filesystem(name)
+            _filesystems[(name, bucket)] = cached
+        return cached
+
+
+def clear_filesystems() -> None:
+    """Drop the cached filesystem objects, for instance after configuring new credentials."""
+    with _filesystems_lock:
+        _filesystems.clear()
+
+
+def _strip(path: PathStr) -> str:
+    """Return a path without protocol, as expected by the methods of its filesystem object."""
+    match = _PROTOCOL.match(str(path))
+    if not match:
+        return str(path)
+    name = _PROTOCOL_ALIASES.get(match.group(1).lower(), match.group(1).lower())
+    rest = str(path)[match.end() :]
+    if name == LOCAL:
+        return "/" + rest
+    if name == "memory":
+        return "/" + rest.rstrip("/")
+    return rest.rstrip("/")
+
+
+def _with_protocol(name: str, path: str) -> str:
+    """Return a path from a filesystem object with its protocol prefix restored."""
+    if name == LOCAL:
+        return path
+    return f"{name}://{path.lstrip('/')}"
+
+
 def path_to_str(path: PathStr) -> PathStr:
     """Normalise as strings.
 
     This is a trick to make automated tests pass on Windows.
+    Protocol prefixes shortened by :py:class:`pathlib.Path` (like ``gs:/``) are restored,
+    and ``file://`` URLs are returned as plain local paths.
     """
-    return str(Path(path)).replace("gs:/", "gs://")
+    out = str(Path(path))
+    if _PROTOCOL.match(out):
+        return _with_protocol(protocol(out), _strip(out))
+    return out
 
 
 def wrap_return_as_str(func: F) -> F:
@@ -52,20 +150,139 @@ def remove_prefix(path: PathStr) -> str:
 
 def is_gcs(path: PathStr) -> bool:
     """Check if path is on GCS."""
-    return str(path).startswith("gs:/")
+    return protocol(path) == "gs"
 
 
 def is_local(path: PathStr) -> bool:
     """Check if path is local."""
-    return not str(path).startswith("gs:/")
+    return protocol(path) == LOCAL
 
 
 def fs_type(path: PathStr) -> str:
-    """Check filesystem type (local or GCS) for a given path."""
-    out = ""
-    types = {"gcs": is_gcs(path), "local": is_local(path)}
-    out = list(types.keys())[list(types.values()).index(True)]
-    return out
+    """Check filesystem type ('local', 'gcs' or the protocol, like 'memory') for a given path."""
+    name = protocol(path)
+    return {LOCAL: "local", "gs": "gcs"}.get(name, name)
+
+
+class ListingCacheStats(NamedTuple):
+    """Counters for the listing cache, see :py:func:`enable_listing_cache`."""
+
+    hits: int
+    misses: int
+    entries: int
+
+
+def enable_listing_cache(ttl: float = 60.0) -> None:
+    """Cache the results of :py:func:`ls`, :py:func:`find` and :py:func:`exists` for ``ttl`` seconds.
+
+    The cache is off by default.
+    Writes, moves and deletes made through this module invalidate the cached results for the affected paths,
+    but changes made by other processes are not seen until the cached results expire.
+    Calling the function again sets a new TTL and clears the cache.
+    """
+    global _listing_ttl
+    if ttl <= 0:
+        raise ValueError(f"The listing cache TTL must be positive, got {ttl}.")
+    with _listings_lock:
+        _listing_ttl = ttl
+        _listings.clear()
+
+
+def disable_listing_cache() -> None:
+    """Turn the listing cache off and drop all cached results."""
+    global _listing_ttl
+    with _listings_lock:
+        _listing_ttl = None
+        _listings.clear()
+
+
+@contextmanager
+def listing_cache(ttl: float = 60.0) -> Iterator[None]:
+    """Context manager that enables the listing cache, and restores the previous setting on exit.
+
+    Example:
+        >>> # doctest: +SKIP
+        >>> with fs.listing_cache(ttl=300):
+        ...     run_job()
+        >>> # doctest: -SKIP
+    """
+    previous = _listing_ttl
+    enable_listing_cache(ttl)
+    try:
+        yield
+    finally:
+        if previous is None:
+            disable_listing_cache()
+        else:
+            enable_listing_cache(previous)
+
+
+def listing_cache_stats() -> ListingCacheStats:
+    """Return the hit and miss counters and the number of entries of the listing cache."""
+    with _listings_lock:
+        return ListingCacheStats(_listing_hits, _listing_misses, len(_listings))
+
+
+def reset_listing_cache_stats() -> None:
+    """Set the hit and miss counters of the listing cache to zero."""
+    global _listing_hits, _listing_misses
+    with _listings_lock:
+        _listing_hits = 0
+        _listing_misses = 0
+
+
+def invalidate(path: PathStr) -> None:
+    """Drop cached listings for a path that was changed, its parent directories and anything below it.
+
+    This is called by the functions of this module that write, move or delete files.
+    Code that writes through other libraries, like :py:func:`pyarrow.dataset.write_dataset`,
+    should call it for the directory it writes to.
+    """
+    global _listing_generation
+    if _listing_ttl is None:
+        return
+    key = _cache_key(path)
+    with _listings_lock:
+        _listing_generation += 1
+        for cached in [k for k in _listings if _related(k[1], key)]:
+            del _listings[cached]
+
+
+def _cache_key(path: PathStr) -> str:
+    """Return a normalised path for listing cache keys: protocol prefixed, absolute for local paths."""
+    name = protocol(path)
+    stripped = _strip(path)
+    if name == LOCAL:
+        stripped = os.path.abspath(stripped)
+    return f"{name}://{stripped.strip('/')}"
+
+
+def _related(a: str, b: str) -> bool:
+    """Check if two cache keys are the same path, or one is below the other."""
+    return a == b or a.startswith(f"{b}/") or b.startswith(f"{a}/")
+
+
+def _cached(kind: str, path: PathStr, detail: str, compute: Callable[[], Any]) -> Any:
+    """Return a cached result while it is fresh, otherwise compute and cache it, if the listing cache is enabled."""
+    global _listing_hits, _listing_misses
+    ttl = _listing_ttl
+    if ttl is None:
+        return compute()
+    key = (kind, _cache_key(path), detail)
+    now = _clock()
+    with _listings_lock:
+        cached = _listings.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            _listing_hits += 1
+            return cached[1]
+        _listing_misses += 1
+        generation = _listing_generation
+    result = compute()
+    with _listings_lock:
+        # a result computed while a path was invalidated may be stale, so it is not kept
+        if _listing_ttl is not None and generation == _listing_generation:
+            _listings[key] = (now, result)
+    return result
 
 
 def exists(path: PathStr) -> bool:
@@ -77,37 +294,97 @@ def exists(path: PathStr) -> bool:
     p = Path(path)
     MAX_FILENAME_LENGTH = 254
     if len(p.name) > MAX_FILENAME_LENGTH:
-        path = p.parent / p.name[:MAX_FILENAME_LENGTH]
+        path = path_to_str(p.parent / p.name[:MAX_FILENAME_LENGTH])
 
     if not path:
         return False
-    elif is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        return fs.exists(path)  # pragma: no cover
+    return _cached("exists", path, "", lambda: _exists(path))
+
+
+def _exists(path: PathStr) -> bool:
+    if is_local(path):
+        return Path(_strip(path)).exists()
     else:
-        return Path(path).exists()
+        return filesystem(path).exists(_strip(path))
+
+
+def file_signature(path: PathStr) -> tuple[int | str, int] | None:
+    """Return (modification marker, size) for a file, or None if it does not exist.
+
+    For local files the modification marker is the modification time in nanoseconds,
+    for GCS it is the object generation.
+    """
+    if is_local(path):
+        try:
+            stat = os.stat(_strip(path))
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    try:
+        info = filesystem(path).info(_strip(path))
+    except FileNotFoundError:
+        return None
+    return _signature(info)
+
+
+def signatures(path: PathStr, pattern: str = "*") -> dict[str, tuple[int | str, int]]:
+    """Return the signatures (see :py:func:`file_signature`) of the files in a directory matching a pattern.
+
+    On GCS, the signatures are taken from a single listing rather than a request per file.
+    """
+    search = os.path.join(path, pattern)
+    if not is_local(path):
+        name = protocol(path)
+        return {
+            _with_protocol(name, p): _signature(info)
+            for p, info in filesystem(path).glob(_strip(search), detail=True).items()
+            if info.get("type") != "directory"
+        }
+    found = {}
+    for file in glob.glob(_strip(search)):
+        signature = file_signature(file)
+        if signature is not None:
+            found[file] = signature
+    return found
+
+
+def _signature(info: dict[str, Any]) -> tuple[int | str, int]:
+    """Return (modification marker, size) from the file info of a filesystem object.
+
+    The marker is the GCS object generation, or the modification (or creation) time for other filesystems.
+    """
+    marker = (
+        info.get("generation")
+        or info.get("updated")
+        or info.get("mtime")
+        or info.get("created")
+        or ""
+    )
+    if not isinstance(marker, int | str):
+        marker = str(marker)
+    return (marker, int(info.get("size") or 0))
 
 
 @wrap_return_as_str
 def existing_subpath(path: PathStr) -> PathStr:
     """Return the existing part of a path on local or GCS file system."""
-    if Path(path).exists():
+    if exists(path):
         return str(path)
     else:
         p = Path(path).parent
-        while not p.exists():
+        while not exists(path_to_str(p)):
             p = Path(p).parent
         return p
 
 
 def touch(path: PathStr) -> PathStr:
     """Touch file regardless of wether the filesystem is local or GCS; return path."""
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        fs.touch(path)  # pragma: no cover
-    else:
+    if is_local(path):
         mk_parent_dir(path)
-        Path(path).touch()
+        Path(_strip(path)).touch()
+    else:
+        filesystem(path).touch(_strip(path))
+    invalidate(path)
     return path
 
 
@@ -121,8 +398,10 @@ def path(*args: PathStr) -> str:
 def mkdir(path: PathStr) -> None:
     """Make directory regardless of filesystem is local or GCS."""
     # not good enough .. it is hard to distinguish between dirs and files that do not exist yet
+    # object stores have no directories, they are implied by the paths of the files
     if is_local(path):
-        Path(path).mkdir(parents=True, exist_ok=True)
+        Path(_strip(path)).mkdir(parents=True, exist_ok=True)
+        invalidate(path)
     else:
         ...
 
@@ -133,7 +412,8 @@ def mk_parent_dir(path: PathStr) -> None:
     # but it is hard to distinguish between dirs and files that do not exist yet
     # --> use this to create parent directory for files, mkdir() when the last part of path is a directory
     if is_local(path):
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(_strip(path)).parent.mkdir(parents=True, exist_ok=True)
+        invalidate(Path(_strip(path)).parent)
     else:
         ...
 
@@ -144,72 +424,73 @@ def file_count(path: PathStr, create: bool = False) -> int:
 
 
 def ls(path: str, pattern: str = "*", create: bool = False) -> list[str]:
-    """List files. Should work regardless of wether the filesystem is local or GCS."""
+    """List files. Should work regardless of wether the filesystem is local or GCS.
+
+    Local paths are listed with :py:func:`glob.glob`, which is considerably faster than the fsspec equivalent.
+    Listed paths on other filesystems keep their protocol prefix.
+    Listings are cached if the listing cache is enabled, see :py:func:`enable_listing_cache`.
+    """
+    if is_local(path) and create:
+        mkdir(path)
+    return list(_cached("ls", path, pattern, lambda: _ls(path, pattern)))
+
+
+def _ls(path: str, pattern: str) -> list[str]:
     search = os.path.join(path, pattern)
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        return fs.glob(search)  # pragma: no cover
-    else:
-        if create:
-            mkdir(path)
-        return glob.glob(search)
+    if is_local(path):
+        return glob.glob(_strip(search))
+    name = protocol(path)
+    return [_with_protocol(name, p) for p in filesystem(path).glob(_strip(search))]
 
 
 def cp(from_path: PathStr, to_path: PathStr) -> None:
     """Copy file from one location to another.
 
-    This function handles copying files between local and GCS paths,
+    This function handles copying files between local and GCS (or other) paths,
     automatically selecting the correct backend.
 
     Args:
         from_path: The path to the source file.
         to_path: The path to the destination file.
     """
-    from_type = fs_type(from_path)
-    to_type = fs_type(to_path)
-    if is_gcs(from_path) | is_gcs(to_path):
-        fs = GCSFileSystem()  # pragma: no cover
+    source, target = filesystem(from_path), filesystem(to_path)
     if is_local(to_path):
-        mk_parent_dir(to_path)  # pragma: no cover
+        mk_parent_dir(to_path)
 
-    match (from_type, to_type):
-        case ("local", "local"):
-            shutil.copy2(from_path, to_path)
-        case ("local", "gcs"):
-            fs.put(from_path, to_path)
-        case ("gcs", "local"):
-            fs.get(from_path, to_path)
-        case ("gcs", "gcs"):
-            fs.copy(from_path, to_path)
+    if source is target:
+        source.copy(_strip(from_path), _strip(to_path))
+    elif is_local(from_path):
+        target.put(_strip(from_path), _strip(to_path))
+    elif is_local(to_path):
+        source.get(_strip(from_path), _strip(to_path))
+    else:
+        target.pipe(_strip(to_path), source.cat(_strip(from_path)))
+    invalidate(to_path)
 
 
 def mv(from_path: PathStr, to_path: PathStr) -> None:
     """Move file from one location to another.
 
-    This function handles moving files between local and GCS paths,
+    This function handles moving files between local and GCS (or other) paths,
     automatically selecting the correct backend.
+    Moves within a local filesystem are renames, so a file written to a temporary path
+    can be moved into place atomically.
 
     Args:
         from_path: The path to the source file.
         to_path: The path to the destination file.
     """
-    from_type = fs_type(from_path)
-    to_type = fs_type(to_path)
-
-    if is_gcs(from_path) | is_gcs(to_path):
-        fs = GCSFileSystem()  # pragma: no cover
+    source = filesystem(from_path)
     if is_local(to_path):
         mk_parent_dir(to_path)
 
-    match (from_type, to_type):
-        case ("local", "local"):
-            shutil.move(from_path, to_path)
-        case ("local", "gcs"):
-            fs.put(from_path, to_path)
-        case ("gcs", "local"):
-            fs.get(from_path, to_path)
-        case ("gcs", "gcs"):
-            fs.move(from_path, to_path)
+    if source is filesystem(to_path):
+        source.mv(_strip(from_path), _strip(to_path))
+    else:
+        cp(from_path, to_path)
+        source.rm(_strip(from_path))
+    invalidate(from_path)
+    invalidate(to_path)
 
 
 def rm(path: PathStr) -> None:
@@ -220,24 +501,105 @@ def rm(path: PathStr) -> None:
     Args:
         path: The path to the file to be removed.
     """
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        fs.rm(path)  # pragma: no cover
+    if is_local(path):
+        os.remove(_strip(path))
     else:
-        os.remove(path)
+        filesystem(path).rm(_strip(path))
+    invalidate(path)
+
+
+@contextmanager
+def locked(
+    path: PathStr, timeout: float = 60.0, expires: float = 300.0
+) -> Iterator[None]:
+    """Context manager that holds a lock file, for read-modify-write updates by several processes.
+
+    The lock file is created in exclusive mode ('xb'), which fails if the file exists:
+    with ``O_EXCL`` on local filesystems and with an ``ifGenerationMatch=0`` precondition on GCS.
+    It holds a token that is unique to the holder, and is removed on exit if it still holds that token.
+    A lock file older than ``expires`` seconds is taken to be left behind by a crashed process,
+    and is removed if it still holds the token it was judged by,
+    so that a waiter does not remove a lock that another waiter has just taken.
+
+    Raises:
+        TimeoutError: If the lock is not acquired within ``timeout`` seconds.
+    """
+    token = uuid.uuid4().hex
+    deadline = _clock() + timeout
+    delay = 0.01
+    while True:
+        try:
+            with _open(path, "xb") as file:
+                file.write(
+                    json.dumps({"created": time.time(), "token": token}).encode()
+                )
+            break
+        except FileExistsError:
+            holder = _lock_holder(path)
+            if holder is not None and time.time() - holder[1] > expires:
+                if _remove_lock(path, holder[0]):
+                    logger.warning("Removed the expired lock file %s.", path)
+                continue
+            if _clock() > deadline:
+                raise TimeoutError(
+                    f"Timed out after {timeout} seconds waiting for the lock file {path}."
+                ) from None
+            time.sleep(delay)
+            delay = min(2 * delay, 0.5)
+    invalidate(path)
+    try:
+        yield
+    finally:
+        if not _remove_lock(path, token):
+            logger.warning(
+                "The lock file %s expired and was taken over by another process.", path
+            )
+
+
+def _lock_holder(path: PathStr) -> tuple[str, float] | None:
+    """Return the token and creation time of a lock file, or None if it can not be read."""
+    try:
+        # not through the disk cache, which would keep a copy of every lock file
+        opened = open if is_local(path) else filesystem(path).open
+        with opened(_strip(path), "rb") as file:
+            content = json.loads(file.read())
+        return str(content.get("token", "")), float(content["created"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _remove_lock(path: PathStr, token: str) -> bool:
+    """Remove a lock file if it still holds a token; return False if it does not."""
+    holder = _lock_holder(path)
+    if holder is None or holder[0] != token:
+        return False
+    with suppress(FileNotFoundError):
+        rm(path)
+    return True
+
+
+class StripedLock:
+    """A fixed number of thread locks, one of which is chosen by the hash of a key like a directory path.
+
+    Threads working on different keys rarely wait for each other,
+    without keeping a lock for every key there has been.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        """Create the locks."""
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __call__(self, key: str) -> threading.Lock:
+        """Return the lock of a key."""
+        return self._locks[hash(key) % len(self._locks)]
 
 
 def rmtree(
     path: str,
 ) -> None:
     """Recursively remove a directory and all its subdirectories and files regardless of local or GCS filesystem."""
-    if is_gcs(path):
-        ...
-        # TO DO: implement this (but recursive)
-        # fs = GCSFileSystem() # pragma: no cover
-        # fs.rm(path) # pragma: no cover
-    else:
-        shutil.rmtree(path)
+    filesystem(path).rm(_strip(path), recursive=True)
+    invalidate(path)
 
 
 @wrap_return_as_str
@@ -267,19 +629,13 @@ def find(
         pattern = "*"
 
     if search_sub_dirs:
-        search_str = path(search_path, "*", pattern)
-    else:
-        search_str = path(search_path, pattern)
-
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        found = fs.glob(search_str)  # pragma: no cover
+        found = ls(search_path, pattern=os.path.join("*", pattern))
     else:
-        found = glob.glob(search_str)
+        found = ls(search_path, pattern=pattern)
 
     if replace_root:
         # may be necessary if not returning full path? -> TODO: add tests
-        found = [f.replace(path, "root").split(os.path.sep) for f in found]
+        found = [f.replace(str(search_path), "root").split(os.path.sep) for f in found]
 
     if full_path:
         return found
@@ -287,18 +643,52 @@ def find(
         return [f[-1] for f in found]
 
 
+def _open(path: PathStr, mode: str = "r") -> Any:
+    """Open a file for reading or writing; the parent directory of a local file to write is created.
+
+    Remote files opened for reading are read through the disk cache, if it is enabled (see :py:mod:`~ssb_timeseries.io.disk_cache`).
+    """
+    if is_local(path):
+        if "w" in mode or "x" in mode:
+            mk_parent_dir(path)
+        return open(_strip(path), mode)
+    if not any(m in mode for m in "wax+"):
+        copy = _local_copy(path)
+        if copy is not None:
+            try:
+                return open(copy, mode)
+            except FileNotFoundError:
+                pass  # evicted by another process
+    return filesystem(path).open(_strip(path), mode)
+
+
+def _local_copy(path: PathStr) -> str | None:
+    """Return the path of a local copy of a remote file from the disk cache, or None if it is not cached."""
+    if not disk_cache.is_enabled() or is_local(path):
+        return None
+    signature = file_signature(path)
+    if signature is None:
+        return None
+
+    def download(target: str) -> None:
+        with (
+            filesystem(path).open(_strip(path), "rb") as source,
+            open(target, "wb") as copy,
+        ):
+            shutil.copyfileobj(source, copy, 2**20)
+
+    return disk_cache.local_copy(
+        _cache_key(path), signature, download, suffix=Path(_strip(path)).suffix
+    )
+
+
 def read_text(path: PathStr, file_format: str = "") -> dict:
     """Read a text file from specified path on either local fs or GCS."""
     if not file_format:
         file_format = Path(path).suffix
     read_func = _text_reader(file_format)
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        with fs.open(path, "r") as file:
-            return read_func(file)  # pragma: no cover
-    else:
-        with open(path) as file:
-            return read_func(file)
+    with _open(path) as file:
+        return read_func(file)
 
 
 def write_text(path: PathStr, content: str | dict, file_format: str) -> None:
@@ -306,15 +696,9 @@ def write_text(path: PathStr, content: str | dict, file_format: str) -> None:
     if not file_format:
         file_format = Path(path).suffix
     write = _text_writer(file_format)
-
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        with fs.open(path, "w") as file:
-            write(file, content)  # pragma: no cover
-    else:
-        mk_parent_dir(path)
-        with open(path, "w") as file:
-            write(file, content)
+    with _open(path, "w") as file:
+        write(file, content)
+    invalidate(path)
 
 
 def _text_reader(file_format: str) -> Callable:
@@ -365,27 +749,40 @@ def _text_writer(file_format: str) -> Callable[[PathStr, dict], None]:
 
 def read_json(path: PathStr) -> dict:
     """Read json file from path on either local fs or GCS."""
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        with fs.open(path, "r") as file:
-            return json.load(file)  # pragma: no cover
-    else:
-        with open(path) as file:
-            return json.load(file)
+    with _open(path) as file:
+        return json.load(file)
+
+
+def read_json_many(
+    paths: list[PathStr], max_workers: int = MAX_CONCURRENT_READS
+) -> list[dict]:
+    """Read json files with up to ``max_workers`` threads, and return the contents in the order of the paths.
+
+    Reading many small files is dominated by latency, in particular on GCS.
+    If any file can not be read, the error of the first such file (in path order) is raised,
+    with a note naming the file.
+    """
+    if max_workers <= 1 or len(paths) <= 1:
+        return [_read_json_noted(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(_read_json_noted, paths))
+
+
+def _read_json_noted(path: PathStr) -> dict:
+    try:
+        return read_json(path)
+    except Exception as e:
+        e.add_note(f"Reading json file {path}.")
+        raise
 
 
 def write_json(path: PathStr, content: str | dict) -> None:
     """Write json file to path on either local fs or GCS."""
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-        with fs.open(path, "w") as file:
-            if isinstance(content, str):
-                content = json.loads(content)
-            json.dump(content, file, indent=4, ensure_ascii=False)  # pragma: no cover
-    else:
-        mk_parent_dir(path)
-        with open(path, "w") as file:
-            json.dump(content, file, indent=4, ensure_ascii=False)
+    if isinstance(content, str):
+        content = json.loads(content)
+    with _open(path, "w") as file:
+        json.dump(content, file, indent=4, ensure_ascii=False)
+    invalidate(path)
 
 
 def read_parquet(
@@ -405,15 +802,65 @@ def read_parquet(
             Defaults to "pyarrow".
         **kwargs: Additional keyword arguments passed to the backend.
 
+    Local files read with the "pyarrow" backend are memory mapped,
+    so that the file is not first copied into a read buffer.
+    Eager reads of remote files go through the disk cache, if it is enabled (see :py:mod:`~ssb_timeseries.io.disk_cache`).
+
     Returns:
         A Narwhals dataframe.
     """
+    copy = None if lazy else _local_copy(path)
+    if copy is not None:
+        try:
+            return read_parquet(copy, implementation=implementation, **kwargs)
+        except FileNotFoundError:
+            pass  # evicted by another process
     if lazy:
         return narwhals.scan_parquet(path, backend=implementation, **kwargs)
+    elif implementation == "pyarrow" and is_local(path):
+        return narwhals.from_native(
+            pq.read_table(path_to_str(_strip(path)), memory_map=True, **kwargs)
+        )
+    elif implementation == "pyarrow":
+        return narwhals.from_native(
+            pq.read_table(_strip(path), filesystem=filesystem(path), **kwargs)
+        )
     else:
         return narwhals.read_parquet(path, backend=implementation, **kwargs)
 
 
+def parquet_file(path: PathStr, memory_map: bool = True) -> pq.ParquetFile:
+    """Open a (local or GCS) Parquet file for reading metadata and selected row groups.
+
+    Only the footer is read when the file is opened,
+    so row group statistics can be inspected before any data is read.
+    Local files are memory mapped unless ``memory_map`` is False.
+    Remote files are opened from the disk cache, if it is enabled (see :py:mod:`~ssb_timeseries.io.disk_cache`).
+    """
+    copy = _local_copy(path)
+    if copy is not None:
+        try:
+            return pq.ParquetFile(copy, memory_map=memory_map)
+        except FileNotFoundError:
+            pass  # evicted by another process
+    if is_local(path):
+        return pq.ParquetFile(path_to_str(_strip(path)), memory_map=memory_map)
+    else:
+        # pyarrow opens the file, and closes it with the ParquetFile
+        return pq.ParquetFile(_strip(path), filesystem=filesystem(path))
+
+
+def arrow_filesystem(path: PathStr) -> tuple[Any, str]:
+    """Return the filesystem and path to pass to :py:mod:`pyarrow.dataset` functions for a path.
+
+    Local paths are returned without a filesystem, so that pyarrow uses its native local filesystem.
+    Other paths use the cached filesystem object of :py:func:`filesystem`.
+    """
+    if is_local(path):
+        return None, _strip(path)
+    return filesystem(path), _strip(path)
+
+
 def write_parquet(
     data: pyarrow.Table | IntoFrame,
     path: PathStr,
@@ -433,16 +880,16 @@ def write_parquet(
         **kwargs: Additional keyword arguments passed to the backend.
     """
     table = to_arrow(data, schema)  # to validate schema ...
-    if is_gcs(path):
-        fs = GCSFileSystem()  # pragma: no cover
-    else:
+    if is_local(path):
         fs = pyarrow.fs.LocalFileSystem()
         mk_parent_dir(path)
+    else:
+        fs = filesystem(path)
 
     if isinstance(table, pyarrow.Table):
         pq.write_table(
             table,
-            where=path,
+            where=_strip(path),
             filesystem=fs,
             # schema=schema,
             **kwargs,
@@ -454,6 +901,7 @@ def write_parquet(
         if isinstance(frame, narwhals.LazyFrame):
             frame = frame.collect()
         frame.write_parquet(path)
+    invalidate(path)
     # to make schema validation work / keep IO pure pyarrow it may bew better to go back to this(?):
     # pyarrow.dataset.write_dataset(
     #     data,
@@ -10,7 +10,7 @@ This approach duplicates metadata that might also be stored in data files
 from __future__ import annotations
 
 import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import NamedTuple
 
@@ -20,6 +20,7 @@ from ..meta import DatasetTagDict
 from ..meta import TagDict
 from ..meta.tags import matches_criteria
 from ..types import PathStr
+from . import catalog_index
 from . import fs
 from .json_helpers import sanitize_for_json
 
@@ -117,12 +118,21 @@ class JsonMetaIO:
         """Return the configured catalog directory path for the repository."""
         return self.repository["catalog"]["options"]["path"]
 
+    @property
+    def read_concurrency(self) -> int:
+        """Return the number of metadata files to read concurrently, from the catalog option 'read_concurrency'."""
+        options = self.repository["catalog"].get("options", {})
+        value = int(options.get("read_concurrency", fs.MAX_CONCURRENT_READS))
+        if value < 1:
+            raise ValueError(f"read_concurrency must be at least 1, not {value}.")
+        return value
+
     def fullpath(self, set_name: str = "") -> str:
         """Return the full path to a dataset's metadata file."""
         if not set_name:
             set_name = self.set_name
 
-        return str(Path(self.dir) / _filename(set_name))
+        return fs.path(self.dir, _filename(set_name))
 
     def read(self, **kwargs) -> dict:
         """Read and return the metadata for a given dataset.
@@ -168,6 +178,7 @@ class JsonMetaIO:
             )
             sanitized_tags = sanitize_for_json(tags)
             fs.write_json(self.fullpath(set_name), sanitized_tags)
+            catalog_index.update_index(self.dir, set_name, sanitized_tags)
             logger.info(
                 "JsonMetaIO.write.success %s: Writing metadata to file %s.",
                 set_name,
@@ -181,6 +192,68 @@ class JsonMetaIO:
                 self.fullpath(set_name),
             )
 
+    def write_many(
+        self,
+        tags_by_name: dict[str, dict],
+        max_workers: int = fs.MAX_CONCURRENT_READS,
+    ) -> dict[str, Exception]:
+        """Write the metadata files of several datasets concurrently, then update the catalog index once.
+
+        Args:
+            tags_by_name: The metadata to write, by dataset name.
+            max_workers: The maximum number of files written at the same time.
+
+        Returns:
+            The errors of the datasets whose metadata could not be written, by dataset name.
+            The other files are written regardless.
+        """
+        sanitized: dict[str, dict] = {}
+        errors: dict[str, Exception] = {}
+
+        def write_file(set_name: str, tags: dict) -> None:
+            try:
+                sanitized_tags = sanitize_for_json(tags)
+                fs.write_json(self.fullpath(set_name), sanitized_tags)
+                sanitized[set_name] = sanitized_tags
+            except Exception as e:
+                logger.exception(
+                    "JsonMetaIO.write_many.error %s: Writing metadata to file %s.",
+                    set_name,
+                    self.fullpath(set_name),
+                )
+                errors[set_name] = e
+
+        logger.info(
+            "JsonMetaIO.write_many.start: writing %s metadata files to\n\t%s",
+            len(tags_by_name),
+            self.dir,
+        )
+        if max_workers <= 1 or len(tags_by_name) <= 1:
+            for set_name, tags in tags_by_name.items():
+                write_file(set_name, tags)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(tags_by_name))
+            ) as executor:
+                list(executor.map(write_file, tags_by_name, tags_by_name.values()))
+        try:
+            # in the order of the input, not the order the writes completed
+            catalog_index.update_index_many(
+                self.dir, {k: sanitized[k] for k in tags_by_name if k in sanitized}
+            )
+        except Exception:
+            # a stale index is brought up to date from the files by the next search
+            logger.exception(
+                "JsonMetaIO.write_many.error: updating the catalog index in %s.",
+                self.dir,
+            )
+        logger.info(
+            "JsonMetaIO.write_many.success: wrote %s of %s metadata files.",
+            len(sanitized),
+            len(tags_by_name),
+        )
+        return errors
+
     @property
     def exists(self, set_name: str = "") -> bool:
         """Check if the metadata file for a given dataset exists."""
@@ -195,6 +268,11 @@ class JsonMetaIO:
             **kwargs: Search criteria including 'equals', 'contains', 'pattern',
                 'tags', 'datasets' (bool), and 'series' (bool).
 
+        The search is answered from the catalog index (see :py:mod:`~ssb_timeseries.io.catalog_index`),
+        which is brought up to date with the metadata files first.
+        Changed metadata files are read concurrently, see :py:attr:`read_concurrency`.
+        Tag criteria are resolved with its inverted index of tag values.
+
         Returns:
             A list of dictionaries, where each dictionary represents a
             matching dataset or series.
@@ -206,29 +284,25 @@ class JsonMetaIO:
         do_datasets = kwargs.pop("datasets", True)
         do_series = kwargs.pop("series", False)
 
-        json_files = find_metadata_files(path=self.dir, **kwargs)
-        results = []
-
-        for f in json_files:
-            tags_from_file = tags_from_json_file(f)
-            if not isinstance(tags_from_file, dict):
-                raise TypeError(
-                    f"Metadata file {f} did not contain a valid dictionary."
-                )
-
-            repo_name = tags_from_file.get("repository")
-
-            if do_datasets:
-                dataset_item = _build_dataset_item(tags_from_file, repo_name)
-                matching_set = _filter_items([dataset_item], tags_criteria)
-                results.extend(matching_set)
+        index = catalog_index.read_index(self.dir, self.read_concurrency)
+        selected = catalog_index.tag_index(self.dir, index).matching(tags_criteria)
+        names = catalog_index.matching_names(index, _name_pattern(**kwargs))
+        if names is not None:
+            selected = names if selected is None else selected & names
+        return catalog_index.catalog_items(
+            index, datasets=do_datasets, series=do_series, selected=selected
+        )
 
-            if do_series:
-                series_in_set = _build_series_items(tags_from_file, repo_name)
-                matching_series = _filter_items(series_in_set, tags_criteria)
-                results.extend(matching_series)
 
-        return results
+def _name_pattern(
+    pattern: str = "", contains: str = "", equals: str = "", **kwargs
+) -> str:
+    """Return the glob pattern for dataset names that :py:func:`find_metadata_files` would search for."""
+    if equals:
+        return equals
+    elif contains:
+        return f"*{contains}*"
+    return pattern or "*"
 
 
 def find_metadata_files(
@@ -304,11 +378,7 @@ def tags_from_json_file(
 ) -> DatasetTagDict | list[DatasetTagDict]:
     """Read and parse one or more metadata JSON files."""
     if isinstance(file_or_files, list):
-        result = []
-        for f in file_or_files:
-            j = fs.read_json(f)
-            result.append(json.loads(j))
-        return result
+        return [DatasetTagDict(t) for t in fs.read_json_many(file_or_files)]
     else:
         t = fs.read_json(file_or_files)
         return DatasetTagDict(t)
@@ -0,0 +1,124 @@
+"""A per-dataset manifest of the stored versions.
+
+Listing the versions of a dataset by globbing its directory and parsing the file names
+gets slow for datasets with many versions, in particular on GCS.
+Instead, the file based handlers record every written version in a small JSON file in the dataset directory:
+
+.. code-block:: json
+
+    {
+        "versions": [
+            {
+                "version": "2024-01-01T00:00:00+00:00",
+                "file": "my_dataset-as_of_2024-01-01T000000+0000-data.parquet",
+                "rows": 120,
+                "min": "2014-01-01T00:00:00+00:00",
+                "max": "2023-12-01T00:00:00+00:00"
+            }
+        ]
+    }
+
+The version marker is the UTC 'as of' date in ISO format for :py:attr:`~ssb_timeseries.types.Versioning.AS_OF`,
+and 'latest' for :py:attr:`~ssb_timeseries.types.Versioning.NONE`.
+'min' and 'max' are the first and last dates of the data, taken from the Parquet statistics.
+
+The manifest is replaced atomically: a temporary file is written and then moved into place.
+Updates are made while holding a lock file next to the manifest (see :py:func:`~ssb_timeseries.io.fs.locked`),
+so that processes writing versions of the same dataset at the same time do not lose each other's entries.
+Writers also add entries for data files that are missing from the manifest,
+like versions written by releases that did not know about manifests.
+For existing repositories, manifests can be (re)built from the data files with
+:py:func:`ssb_timeseries.io.rebuild_manifests` or ``ssb-timeseries rebuild-manifests``.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from ..logging import logger
+from . import fs
+from .predicates import date_range
+
+# mypy: disable-error-code="no-any-return"
+
+MANIFEST_FILE = "_manifest.json"
+LOCK_FILE = "_manifest.json.lock"
+
+_directory_lock = fs.StripedLock()
+
+
+def manifest_path(directory: str) -> str:
+    """Return the path of the manifest for a dataset directory."""
+    return os.path.join(directory, MANIFEST_FILE)
+
+
+def read_manifest(directory: str) -> list[dict[str, Any]] | None:
+    """Return the version entries of a dataset, or None if there is no manifest."""
+    path = manifest_path(directory)
+    if not fs.exists(path):
+        return None
+    return fs.read_json(path)["versions"]
+
+
+def write_manifest(directory: str, entries: list[dict[str, Any]]) -> None:
+    """Replace the manifest of a dataset directory, with entries sorted by version."""
+    path = manifest_path(directory)
+    temporary_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    fs.write_json(
+        temporary_path,
+        {"versions": sorted(entries, key=lambda e: e["version"])},
+    )
+    fs.mv(temporary_path, path)
+    logger.debug("DATASET.manifest: wrote %s versions to %s.", len(entries), path)
+
+
+@contextmanager
+def locked(directory: str) -> Iterator[None]:
+    """Context manager that holds the manifest lock of a dataset directory, across threads and processes.
+
+    Threads updating the manifests of other datasets do not wait for it.
+    """
+    with _directory_lock(directory), fs.locked(os.path.join(directory, LOCK_FILE)):
+        yield
+
+
+def update_manifest(
+    directory: str,
+    entry: dict[str, Any],
+    unlisted: Callable[[set[str]], list[dict[str, Any]]] | None = None,
+) -> None:
+    """Add or replace the entry for a version in the manifest of a dataset directory.
+
+    Args:
+        directory: The dataset directory.
+        entry: The entry of the version that was written.
+        unlisted: An optional function that returns the entries of the data files in the directory
+            whose names are not in the given set, to add files the manifest does not know about.
+    """
+    with locked(directory):
+        entries = [
+            e
+            for e in read_manifest(directory) or []
+            if e["version"] != entry["version"]
+        ]
+        if unlisted is not None:
+            entries += unlisted({e["file"] for e in entries} | {entry["file"]})
+        write_manifest(directory, [*entries, entry])
+
+
+def file_entry(path: str, version: str, date_columns: list[str]) -> dict[str, Any]:
+    """Return the manifest entry for a data file, reading only the Parquet footer."""
+    metadata = fs.parquet_file(path).metadata
+    first, last = date_range(metadata, date_columns)
+    return {
+        "version": version,
+        "file": os.path.basename(path),
+        "rows": metadata.num_rows,
+        "min": first.isoformat() if first else None,
+        "max": last.isoformat() if last else None,
+    }
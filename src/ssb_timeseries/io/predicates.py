@@ -0,0 +1,228 @@
+"""Translate an :py:class:`~ssb_timeseries.intervals.Interval` into predicates on the date columns of a dataset.
+
+The predicates are used by the Parquet based handlers to avoid reading data outside the requested interval:
+row groups are skipped by comparing the interval to the min/max statistics of the date columns,
+and the rows that are read are filtered exactly.
+
+Intervals are treated as inclusive in both ends, consistent with :py:meth:`Interval.includes <ssb_timeseries.intervals.Interval.includes>`.
+For 'AT' temporality, a row is included if ``start <= valid_at <= stop``.
+For 'FROM_TO' temporality, a row is included if its period overlaps the interval: ``valid_from <= stop`` and ``valid_to > start``.
+
+The same predicates are also available as SQL, see :py:func:`interval_sql`.
+Similarly, a selection of series is translated into the list of columns to read, see :py:func:`projected_columns`.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pyarrow
+import pyarrow.compute as pc
+
+from ..dates import date_utc
+
+if TYPE_CHECKING:
+    import pyarrow.parquet as pq
+
+    from ..intervals import Interval
+
+# mypy: disable-error-code="attr-defined, no-any-return, arg-type"
+
+_TIMESTAMP = pyarrow.timestamp(unit="ns", tz="UTC")
+
+
+def interval_bounds(
+    interval: Interval | None,
+) -> tuple[datetime | None, datetime | None]:
+    """Return the (UTC) start and stop of an interval, with None for open ends."""
+    if interval is None:
+        return (None, None)
+    start = (
+        None
+        if interval.start == datetime.min
+        else date_utc(interval.start, rounding="none")
+    )
+    stop = (
+        None
+        if interval.stop == datetime.max
+        else date_utc(interval.stop, rounding="none")
+    )
+    return (start, stop)
+
+
+def is_bounded(interval: Interval | None) -> bool:
+    """Check if an interval restricts the date range at all."""
+    return interval_bounds(interval) != (None, None)
+
+
+def interval_expression(
+    date_columns: list[str],
+    interval: Interval | None,
+) -> pc.Expression | None:
+    """Return a PyArrow expression selecting rows within the interval, or None if the interval is unbounded."""
+    start, stop = interval_bounds(interval)
+    if start is None and stop is None:
+        return None
+
+    lower, upper = _lower_and_upper_columns(date_columns)
+    conditions = []
+    if start is not None:
+        start_scalar = pyarrow.scalar(start, type=_TIMESTAMP)
+        if lower == upper:
+            conditions.append(pc.field(upper) >= start_scalar)
+        else:
+            conditions.append(
+                (pc.field(upper) > start_scalar) | pc.field(upper).is_null()
+            )
+    if stop is not None:
+        conditions.append(pc.field(lower) <= pyarrow.scalar(stop, type=_TIMESTAMP))
+
+    expression = conditions[0]
+    for condition in conditions[1:]:
+        expression = expression & condition
+    return expression
+
+
+def interval_sql(
+    date_columns: list[str],
+    interval: Interval | None,
+) -> tuple[str, list[datetime]] | None:
+    """Return an SQL condition selecting rows within the interval and its parameters, or None if the interval is unbounded.
+
+    The condition uses ``?`` placeholders and double quoted column names, as accepted by DuckDB.
+    """
+    start, stop = interval_bounds(interval)
+    if start is None and stop is None:
+        return None
+
+    lower, upper = _lower_and_upper_columns(date_columns)
+    conditions, parameters = [], []
+    if start is not None:
+        if lower == upper:
+            conditions.append(f'"{upper}" >= ?')
+        else:
+            conditions.append(f'("{upper}" > ? OR "{upper}" IS NULL)')
+        parameters.append(start)
+    if stop is not None:
+        conditions.append(f'"{lower}" <= ?')
+        parameters.append(stop)
+    return (" AND ".join(conditions), parameters)
+
+
+def row_groups_in_interval(
+    metadata: pq.FileMetaData,
+    date_columns: list[str],
+    interval: Interval | None,
+) -> list[int]:
+    """Return the indices of the row groups that may hold rows within the interval.
+
+    Row groups are excluded only when min/max statistics prove that none of their rows can match.
+    Row groups without statistics are always included.
+    """
+    all_row_groups = list(range(metadata.num_row_groups))
+    start, stop = interval_bounds(interval)
+    if start is None and stop is None:
+        return all_row_groups
+
+    lower, upper = _lower_and_upper_columns(date_columns)
+    names = metadata.schema.names
+    if lower not in names or upper not in names:
+        return all_row_groups
+    lower_index = names.index(lower)
+    upper_index = names.index(upper)
+
+    selected = []
+    for i in all_row_groups:
+        row_group = metadata.row_group(i)
+        lower_stats = row_group.column(lower_index).statistics
+        upper_stats = row_group.column(upper_index).statistics
+        if stop is not None and _has_min_max(lower_stats):
+            if _as_datetime(lower_stats.min) > stop:
+                continue
+        if start is not None and _has_min_max(upper_stats):
+            upper_max = _as_datetime(upper_stats.max)
+            if lower == upper and upper_max < start:
+                continue
+            if lower != upper and upper_max <= start and not upper_stats.null_count:
+                continue
+        selected.append(i)
+    return selected
+
+
+def date_range(
+    metadata: pq.FileMetaData,
+    date_columns: list[str],
+) -> tuple[datetime | None, datetime | None]:
+    """Return the first and last date of a file from the min/max statistics of its date columns.
+
+    Returns None for ends that can not be determined from the statistics.
+    """
+    lower, upper = _lower_and_upper_columns(date_columns)
+    names = metadata.schema.names
+    if lower not in names or upper not in names or metadata.num_row_groups == 0:
+        return (None, None)
+    lower_index = names.index(lower)
+    upper_index = names.index(upper)
+
+    first, last = None, None
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        lower_stats = row_group.column(lower_index).statistics
+        upper_stats = row_group.column(upper_index).statistics
+        if not (_has_min_max(lower_stats) and _has_min_max(upper_stats)):
+            return (None, None)
+        row_group_first = _as_datetime(lower_stats.min)
+        row_group_last = _as_datetime(upper_stats.max)
+        first = row_group_first if first is None else min(first, row_group_first)
+        last = row_group_last if last is None else max(last, row_group_last)
+    return (first, last)
+
+
+def filter_interval(
+    table: pyarrow.Table,
+    date_columns: list[str],
+    interval: Interval | None,
+) -> pyarrow.Table:
+    """Return only the rows of a table that are within the interval."""
+    expression = interval_expression(date_columns, interval)
+    if expression is None or table.num_rows == 0:
+        return table
+    return table.filter(expression)
+
+
+def projected_columns(
+    names: list[str],
+    date_columns: list[str],
+    series: list[str] | None,
+) -> list[str] | None:
+    """Return the stored columns to read for a selection of series, always including the date columns.
+
+    The columns are returned in stored order. Requested series that are not stored are ignored.
+    Returns None (ie all columns) if no selection is made.
+    """
+    if series is None:
+        return None
+    keep = set(date_columns) | {"as_of"} | set(series)
+    return [name for name in names if name in keep]
+
+
+def _lower_and_upper_columns(date_columns: list[str]) -> tuple[str, str]:
+    """Return the date columns holding the lower and upper bounds of the data points."""
+    if "valid_from" in date_columns and "valid_to" in date_columns:
+        return ("valid_from", "valid_to")
+    if "valid_at" in date_columns:
+        return ("valid_at", "valid_at")
+    raise ValueError(f"Can not apply an interval to date columns {date_columns}.")
+
+
+def _has_min_max(statistics: Any) -> bool:
+    return statistics is not None and statistics.has_min_max
+
+
+def _as_datetime(value: Any) -> datetime:
+    """Normalise a statistics value (datetime or pandas.Timestamp) to an aware UTC datetime."""
+    if hasattr(value, "to_pydatetime"):
+        value = value.to_pydatetime()
+    return date_utc(value, rounding="none")
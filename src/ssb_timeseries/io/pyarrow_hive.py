@@ -16,19 +16,53 @@ using a defined Hive-partitioned directory structure. For example:
         └── dataset=my_dataset/
             └── as_of=__HIVE_DEFAULT_PARTITION__/
                 └── part-0.parquet
+
+For high frequency data, the repository may add a secondary partitioning by the year,
+or by the year and month, of the first date column ('valid_at' or 'valid_from') in the default time zone:
+
+.. code-block:: json
+
+    "directory": {
+        "handler": "hive-parquet",
+        "options": {"path": "...", "time_partitioning": "month"}
+    }
+
+.. code-block::
+
+    dataset=my_dataset/
+    └── as_of=__HIVE_DEFAULT_PARTITION__/
+        ├── year=2023/
+        │   ├── month=1/
+        │   │   └── part-0.parquet
+        │   └── ...
+        └── year=2024/
+            └── ...
+
+Writes to unversioned datasets then merge and rewrite only the time partitions the new data falls in,
+and reads with an interval skip the directories outside it.
+Many small partitions make full reads slower, so 'year' is usually the better choice unless each month holds a lot of data.
+The option determines the layout on disk and should not be changed for existing datasets.
 """
 
 from __future__ import annotations
 
+import os
+import threading
+import uuid
+from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
 from urllib.parse import unquote
 
 import narwhals as nw
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset
 from dateutil.parser import parse
 from narwhals.typing import FrameT
 
@@ -37,9 +71,19 @@ from ..config import Config
 from ..dataframes import empty_frame
 from ..dataframes import is_empty
 from ..dataframes import merge_data
+from ..dates import DEFAULT_TZ
+from ..dates import date_utc
 from ..dates import prepend_as_of
 from ..dates import standardize_dates
+from ..logging import logger
+from . import deltas
 from . import fs
+from .predicates import interval_bounds
+from .predicates import interval_expression
+from .predicates import projected_columns
+
+if TYPE_CHECKING:
+    from ..intervals import Interval
 
 # mypy: disable-error-code="type-var, arg-type, type-arg, return-value, attr-defined, union-attr, operator, assignment,import-untyped"
 
@@ -54,6 +98,42 @@ PA_BEHAVIOR = (
 PA_NUMERIC = "float64"
 _TIMESTAMP = pa.timestamp(unit=PA_TIMESTAMP_UNIT, tz=PA_TIMESTAMP_TZ)  # type: ignore[call-overload]
 
+TIME_PARTITIONING: dict[str, tuple[str, ...]] = {
+    "none": (),
+    "year": ("year",),
+    "month": ("year", "month"),
+}
+
+DISCOVERY_CACHE_SIZE = 64
+"""The number of datasets whose discovered partitions are cached, see :py:meth:`HiveFileSystem._dataset`."""
+
+# Discovered datasets by directory, with the signature of the files at the time of discovery,
+# least recently used first.
+_discovered: OrderedDict[str, tuple[Any, pa.dataset.Dataset]] = OrderedDict()
+_discovered_lock = threading.Lock()
+
+
+def _tree_signature(directory: str) -> tuple[tuple[str, int, int], ...]:
+    """Return the relative paths, modification times and sizes of the files below a local directory.
+
+    Like partition discovery, files and directories with names starting with '_' or '.' are skipped.
+    """
+    found = []
+    for root, directories, files in os.walk(directory):
+        directories[:] = [d for d in directories if not d.startswith(("_", "."))]
+        for name in files:
+            if name.startswith(("_", ".")):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            found.append(
+                (os.path.relpath(path, directory), stat.st_mtime_ns, stat.st_size)
+            )
+    return tuple(sorted(found))
+
 
 class HiveFileSystem:
     """A filesystem abstraction for reading and writing Hive-partitioned datasets."""
@@ -82,68 +162,130 @@ class HiveFileSystem:
             )
         self.as_of_utc = as_of_utc
 
-    @property
+    @cached_property
     def root(self) -> str:
         """Return the root path of the configured repository."""
         ts_root = self.repository["directory"]["options"]["path"]
         return str(ts_root)
 
-    @property
+    @cached_property
     def directory(self) -> str:
         """Return the data directory for the dataset."""
-        return str(
-            Path(self.root)
-            / f"data_type={self.data_type.versioning!s}_{self.data_type.temporality!s}"
-            / f"dataset={self.set_name}"
+        return fs.path(
+            self.root,
+            f"data_type={self.data_type.versioning!s}_{self.data_type.temporality!s}",
+            f"dataset={self.set_name}",
         )
 
-    def read(self, *args, **kwargs) -> FrameT:
-        """Read a partitioned dataset from the filesystem."""
-        if not self.exists:
+    def read(
+        self,
+        interval: Interval | None = None,
+        columns: list[str] | None = None,
+        **kwargs: Any,
+    ) -> FrameT:
+        """Read the partition of the handler's version from the filesystem.
+
+        Only the directory of the 'as_of' partition is opened, other versions are never listed or read.
+
+        If an interval is provided, it is pushed down to the dataset scan as a filter on the date columns,
+        so that row groups outside the interval are skipped based on their statistics.
+        With time partitioning, directories outside the interval are skipped as well.
+        If a list of columns (series names) is provided, only those columns and the date columns are read.
+        """
+        if not fs.exists(self._partition_directory()):
             return empty_frame()
 
-        # Define the full schema, including the partition key, to avoid type inference errors
-        # when the partition only contains nulls (as is the case for Versioning.NONE).
-        # partition_schema = pa.schema( [pa.field("as_of", pa.timestamp("ns", tz="UTC"), nullable=True)])
-
-        (_file_schema, partitioning) = _parquet_schema(
-            self.data_type,
-            {
-                "name": self.set_name,
-                "versioning": self.data_type.versioning,
-                "temporality": self.data_type.temporality,
-            },  # define minimal tag dict, because it can not be empty (TODO: relax that?)
-            partition_by=["as_of"],
+        expression = interval_expression(
+            self.data_type.temporality.date_columns, interval
         )
-
-        dataset = pa.dataset.dataset(  # type: ignore[call-overload]
-            self.directory,
-            format=PA_FILE_FORMAT,
-            partitioning=partitioning,
-            partition_base_dir=self.directory,
+        table = self._read_base(
+            _and(expression, self._time_partition_filter(interval)), columns
         )
-        table = dataset.to_table()
-
-        # The 'as_of' column is a storage detail and should not be part of the logical dataset
-        if (
-            "as_of" in table.column_names
-            and self.data_type.versioning == types.Versioning.NONE
-        ):
-            table = table.drop(["as_of"])
 
+        if self.data_type.versioning == types.Versioning.NONE:
+            table = deltas.apply_deltas(
+                table,
+                deltas.read_deltas(
+                    deltas.delta_files(self.directory),
+                    self.data_type.date_columns,
+                    interval,
+                    columns,
+                ),
+                self.data_type,
+            )
         return table
 
+    def read_versions(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        interval: Interval | None = None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """Read all versions with 'as of' dates from ``from_`` to ``to`` (inclusive) into one table.
+
+        The version window is applied as a filter on the 'as_of' partition,
+        so partitions outside it are not read.
+        The result is sorted by 'as_of' and the date columns.
+        """
+        if self.data_type.versioning != types.Versioning.AS_OF:
+            raise ValueError(
+                f"Reading versions requires Versioning.AS_OF, {self.set_name} has {self.data_type.versioning}."
+            )
+        if not self.exists:
+            return empty_frame()
+
+        conditions = [
+            interval_expression(self.data_type.temporality.date_columns, interval),
+            self._time_partition_filter(interval),
+        ]
+        if from_ is not None:
+            conditions.append(
+                pc.field("as_of") >= pa.scalar(date_utc(from_), _TIMESTAMP)
+            )
+        if to is not None:
+            conditions.append(pc.field("as_of") <= pa.scalar(date_utc(to), _TIMESTAMP))
+        dataset = self._dataset(all_versions=True)
+        table = dataset.to_table(
+            columns=projected_columns(
+                dataset.schema.names, self.data_type.date_columns, columns
+            ),
+            filter=_and(*conditions),
+        )
+        table = table.select(
+            [
+                "as_of",
+                *[
+                    n
+                    for n in table.column_names
+                    if n != "as_of" and n not in self.time_partition_keys
+                ],
+            ]
+        )
+        sort_keys = ["as_of", *self.data_type.temporality.date_columns]
+        return table.sort_by([(k, "ascending") for k in sort_keys])
+
     def write(self, data: FrameT, tags: dict | None = None) -> None:
-        """Write data to the filesystem, partitioned by versioning scheme."""
+        """Write data to the filesystem, partitioned by versioning scheme.
+
+        If versioning is NONE, new data is merged into the existing data,
+        or with the repository option ``write_mode: append``, written to a delta file.
+        See :py:mod:`ssb_timeseries.io.deltas`.
+        """
         df = prepend_as_of(data, self.as_of_utc)
         df = standardize_dates(df)
-        (file_schema, partitioning) = _parquet_schema(
+        (file_schema, _) = _parquet_schema(
             self.data_type,
             tags,
             partition_by=["as_of"],
         )
+        folded_deltas = []
         if self.data_type.versioning == types.Versioning.NONE:
-            old_data = self.read()
+            if self.delta_options.write_mode == "append" and self.exists:
+                self._write_delta(_to_table(df, file_schema))
+                return
+            folded_deltas = deltas.delta_files(self.directory)
+            old_data = self._read_affected([_to_table(df, file_schema)], folded_deltas)
             if not is_empty(old_data):
                 old_data = prepend_as_of(old_data, None)
                 df = merge_data(
@@ -153,23 +295,276 @@ class HiveFileSystem:
                     temporality=self.data_type.temporality,
                 )
 
-        pa_table = nw.from_native(df).to_arrow()
-        pa_table = pa_table.select(file_schema.names).cast(file_schema)
+        self._write_dataset(
+            self._with_time_keys(_to_table(df, file_schema)),
+            self.directory,
+            self.partitioning,
+        )
+        deltas.remove_deltas(folded_deltas)
+
+    @cached_property
+    def delta_options(self) -> deltas.DeltaOptions:
+        """Return the write mode and compaction thresholds of the repository."""
+        return deltas.options(self.repository)
+
+    def _write_delta(self, table: pa.Table) -> None:
+        """Write a delta file, then compact if the thresholds are exceeded."""
+        deltas.write_delta(self.directory, table)
+        if deltas.needs_compaction(
+            deltas.delta_files(self.directory), self.delta_options
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold delta files into the partitioned base data.
+
+        The merged data is written to a temporary directory,
+        and the files are moved into place before the deltas that were folded in are removed.
+        With time partitioning, only the time partitions the deltas fall in are rewritten.
+        """
+        folded_deltas = deltas.delta_files(self.directory)
+        if not folded_deltas:
+            return
+        logger.info(
+            "DATASET.compact.start %s: folding %s deltas into %s.",
+            self.set_name,
+            len(folded_deltas),
+            self.directory,
+        )
+        merged = self._read_affected([], folded_deltas)
+        file_schema = pa.unify_schemas(
+            [_without(self._dataset().schema, self.time_partition_keys)]
+            + [fs.parquet_file(p).schema_arrow for p in folded_deltas]
+        )
+        df = standardize_dates(prepend_as_of(merged, None))
+
+        temporary_directory = fs.path(
+            self.directory, f"_compact-{uuid.uuid4().hex[:8]}"
+        )
+        self._write_dataset(
+            self._with_time_keys(_to_table(df, file_schema)),
+            temporary_directory,
+            self.partitioning,
+        )
+        depth = 1 + len(self.time_partition_keys)
+        for path in fs.ls(temporary_directory, pattern="*/" * depth + "*.parquet"):
+            relative = Path(path).relative_to(temporary_directory)
+            fs.mv(path, fs.path(self.directory, relative))
+        fs.rmtree(temporary_directory)
+        deltas.remove_deltas(folded_deltas)
+        logger.info("DATASET.compact.success %s.", self.set_name)
+
+    def _read_affected(self, new: list[pa.Table], delta_paths: list[str]) -> pa.Table:
+        """Read the base data that new data and deltas may change, with the deltas applied.
+
+        Without time partitioning, this is all the data.
+        With time partitioning, only the time partitions of the new data and the deltas are read,
+        so that writing the merged data back replaces exactly those partitions.
+        """
+        pending = deltas.read_deltas(delta_paths, self.data_type.date_columns)
+        base = self._read_base(self._time_partitions_of([*new, *pending]))
+        return deltas.apply_deltas(base, pending, self.data_type)
+
+    def _read_base(
+        self,
+        expression: pc.Expression | None = None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """Read the partition of the handler's version without deltas, dropping the partition keys."""
+        if not fs.exists(self._partition_directory()):
+            return empty_frame()
+        dataset = self._dataset()
+        table = dataset.to_table(
+            columns=projected_columns(
+                dataset.schema.names, self.data_type.date_columns, columns
+            ),
+            filter=expression,
+        )
+        # The partition keys are storage details and should not be part of the logical dataset
+        drop = [n for n in self.time_partition_keys if n in table.column_names]
+        if (
+            "as_of" in table.column_names
+            and self.data_type.versioning == types.Versioning.NONE
+        ):
+            drop.append("as_of")
+        table = table.drop(drop)
+        if self.time_partition_keys:
+            # fragments are discovered in directory name order, not in date order
+            sort_keys = self.data_type.temporality.date_columns
+            table = table.sort_by([(k, "ascending") for k in sort_keys])
+        return table
+
+    @cached_property
+    def time_partition_keys(self) -> tuple[str, ...]:
+        """Return the secondary time partition keys configured for the repository."""
+        return time_partition_keys(self.repository)
+
+    def _with_time_keys(self, table: pa.Table) -> pa.Table:
+        """Add the time partition keys as columns derived from the first date column.
+
+        Years and months are calendar periods in the default time zone, so that for instance
+        monthly data stored as UTC timestamps end up in the partition of the month they represent.
+        """
+        if not self.time_partition_keys or table.num_rows == 0:
+            return table
+        dates = pc.cast(
+            table[self.data_type.temporality.date_columns[0]],
+            pa.timestamp(PA_TIMESTAMP_UNIT, tz=DEFAULT_TZ.key),
+        )
+        for key in self.time_partition_keys:
+            values = pc.cast(getattr(pc, key)(dates), pa.int32())
+            table = table.append_column(pa.field(key, pa.int32()), values)
+        return table
 
+    def _time_partitions_of(self, tables: list[pa.Table]) -> pc.Expression | None:
+        """Return a filter selecting the time partitions the rows of the tables fall in.
+
+        Returns None (ie all partitions) without time partitioning.
+        """
+        keys = self.time_partition_keys
+        if not keys:
+            return None
+        partitions: set[tuple[int, ...]] = set()
+        for table in tables:
+            keyed = self._with_time_keys(table)
+            if keyed.num_rows:
+                partitions |= set(
+                    zip(*[keyed[k].to_pylist() for k in keys], strict=True)
+                )
+        if not partitions:
+            return pc.scalar(False)
+        by_year: dict[int, set[int]] = {}
+        for partition in partitions:
+            by_year.setdefault(partition[0], set()).update(partition[1:])
+        conditions = []
+        for year, months in by_year.items():
+            if year is None:
+                # rows without a date are kept in the default partition
+                conditions.append(pc.field("year").is_null())
+            elif "month" in keys:
+                conditions.append(
+                    (pc.field("year") == year) & pc.field("month").isin(sorted(months))
+                )
+            else:
+                conditions.append(pc.field("year") == year)
+        expression = conditions[0]
+        for condition in conditions[1:]:
+            expression = expression | condition
+        return expression
+
+    def _time_partition_filter(self, interval: Interval | None) -> pc.Expression | None:
+        """Return a filter on the time partition keys that excludes partitions outside the interval.
+
+        For 'FROM_TO' temporality, periods starting before the interval may overlap it,
+        so only partitions after the end of the interval are excluded.
+        """
+        keys = self.time_partition_keys
+        start, stop = interval_bounds(interval)
+        if not keys:
+            return None
+        conditions = []
+        if stop is not None:
+            conditions.append(_at_most(keys, stop))
+        if start is not None and self.data_type.temporality == types.Temporality.AT:
+            conditions.append(~_at_most(keys, start) | _in_partition(keys, start))
+        return _and(*conditions)
+
+    def _write_dataset(
+        self,
+        table: pa.Table,
+        base_dir: str,
+        partitioning: pa.dataset.Partitioning,
+    ) -> None:
+        filesystem, stripped_dir = fs.arrow_filesystem(base_dir)
         pa.dataset.write_dataset(
-            pa_table,
-            base_dir=self.directory,
+            table,
+            base_dir=stripped_dir,
+            filesystem=filesystem,
             partitioning=partitioning,
             existing_data_behavior=PA_BEHAVIOR,
             format=PA_FILE_FORMAT,
-            schema=file_schema,
+            schema=table.schema,
+        )
+        fs.invalidate(base_dir)
+        with _discovered_lock:
+            _discovered.pop(self.directory, None)
+
+    @cached_property
+    def partitioning(self) -> pa.dataset.Partitioning:
+        """Return the explicit Hive partitioning on 'as_of' and any time partition keys, so that partition values are not inferred."""
+        # Define the partition key type explicitly, to avoid type inference errors
+        # when the partition only contains nulls (as is the case for Versioning.NONE).
+        return pa.dataset.partitioning(
+            pa.schema(
+                [pa.field("as_of", _TIMESTAMP, nullable=True)]
+                + [pa.field(k, pa.int32()) for k in self.time_partition_keys]
+            ),
+            flavor=cast(str, PA_PARTITIONING_FLAVOR),  # type: ignore[call-overload]
         )
 
+    def _partition_directory(self) -> str:
+        """Return the partition directory for the version of the handler."""
+        if self.data_type.versioning == types.Versioning.AS_OF:
+            as_of = pa.scalar(date_utc(self.as_of_utc), _TIMESTAMP)
+            expression = pc.field("as_of") == as_of
+        else:
+            expression = pc.field("as_of").is_null()
+        return fs.path(self.directory, self.partitioning.format(expression)[0])
+
+    def _dataset(self, all_versions: bool = False) -> pa.dataset.Dataset:
+        """Return a PyArrow dataset for the partition of the handler's version, or for all partitions.
+
+        The partition of a single version is opened directly from its directory,
+        so the cost does not depend on the number of versions.
+        Discovery of all partitions is cached for the :py:data:`DISCOVERY_CACHE_SIZE` most recently used datasets,
+        and reused as long as the paths, modification times and sizes of all the files below the dataset directory are unchanged,
+        so that files written by other processes, or into new time partitions, are seen.
+        The cache is only used for local directories, where the files can be listed with their signatures cheaply.
+        """
+        filesystem, directory = fs.arrow_filesystem(self.directory)
+        if not all_versions:
+            return pa.dataset.dataset(  # type: ignore[call-overload]
+                fs.arrow_filesystem(self._partition_directory())[1],
+                filesystem=filesystem,
+                format=PA_FILE_FORMAT,
+                partitioning=self.partitioning,
+                partition_base_dir=directory,
+            )
+
+        signature = _tree_signature(directory) if fs.is_local(self.directory) else None
+        with _discovered_lock:
+            cached = _discovered.get(self.directory)
+            if signature is not None and cached is not None and cached[0] == signature:
+                _discovered.move_to_end(self.directory)
+                return cached[1]
+        dataset = pa.dataset.dataset(  # type: ignore[call-overload]
+            directory,
+            filesystem=filesystem,
+            format=PA_FILE_FORMAT,
+            partitioning=self.partitioning,
+            partition_base_dir=directory,
+        )
+        if signature is not None:
+            with _discovered_lock:
+                _discovered[self.directory] = (signature, dataset)
+                _discovered.move_to_end(self.directory)
+                while len(_discovered) > DISCOVERY_CACHE_SIZE:
+                    _discovered.popitem(last=False)
+        return dataset
+
     @property
     def exists(self) -> bool:
         """Check if the dataset directory exists."""
         return fs.exists(self.directory)
 
+    def series(self) -> list[str]:
+        """List the series names in the dataset version, reading only the Parquet footers."""
+        if not fs.exists(self._partition_directory()):
+            return []
+        names = self._dataset().schema.names
+        excluded = {"as_of", *self.data_type.date_columns, *self.time_partition_keys}
+        return [n for n in names if n not in excluded]
+
     def versions(self) -> list[datetime | str]:
         """List available versions by inspecting subdirectories."""
         if not self.exists or self.data_type.versioning != types.Versioning.AS_OF:
@@ -184,6 +579,59 @@ class HiveFileSystem:
         return sorted(versions)
 
 
+def time_partition_keys(repository: dict[str, Any]) -> tuple[str, ...]:
+    """Return the time partition keys from the data handler options of a repository configuration."""
+    handler_options = repository.get("directory", {}).get("options", {})
+    option = handler_options.get("time_partitioning") or "none"
+    if option not in TIME_PARTITIONING:
+        raise ValueError(
+            f"Unknown time_partitioning '{option}'. Expected one of {tuple(TIME_PARTITIONING)}."
+        )
+    return TIME_PARTITIONING[option]
+
+
+def _at_most(keys: tuple[str, ...], date: datetime) -> pc.Expression:
+    """Return a filter selecting time partitions up to and including the partition of a date."""
+    date = date.astimezone(DEFAULT_TZ)
+    if keys == ("year",):
+        return pc.field("year") <= date.year
+    return (pc.field("year") < date.year) | (
+        (pc.field("year") == date.year) & (pc.field("month") <= date.month)
+    )
+
+
+def _in_partition(keys: tuple[str, ...], date: datetime) -> pc.Expression:
+    """Return a filter selecting the time partition of a date."""
+    date = date.astimezone(DEFAULT_TZ)
+    expression = pc.field("year") == date.year
+    if "month" in keys:
+        expression = expression & (pc.field("month") == date.month)
+    return expression
+
+
+def _and(*conditions: pc.Expression | None) -> pc.Expression | None:
+    """Combine filter expressions with 'and', ignoring None. Returns None if there are none."""
+    expression = None
+    for condition in conditions:
+        if condition is not None:
+            expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _without(schema: pa.Schema, names: tuple[str, ...]) -> pa.Schema:
+    """Return a schema without the named fields."""
+    for name in names:
+        if name in schema.names:
+            schema = schema.remove(schema.get_field_index(name))
+    return schema
+
+
+def _to_table(df: FrameT, file_schema: pa.Schema) -> pa.Table:
+    """Convert a dataframe to a PyArrow table with the columns and types of the file schema."""
+    pa_table = nw.from_native(df).to_arrow()
+    return pa_table.select(file_schema.names).cast(file_schema)
+
+
 def _partitioning_schema(
     file_schema: pa.Schema,
     partition_by: list[str],
@@ -218,7 +666,7 @@ def _parquet_schema(
     ]
     date_col_fields.sort(key=lambda x: x.name)
 
-    if not series_meta:
+    if series_meta:
         num_col_fields = [
             pa.field(
                 series_key,
@@ -0,0 +1,315 @@
+"""Provides a PyArrow-based file handler that stores datasets in long (tidy) format.
+
+The wide format of :py:mod:`~ssb_timeseries.io.pyarrow_simple` has one float64 column per series,
+with the series tags embedded as metadata on each field.
+For sparse datasets with many thousands of series, that gives large footers and files that are mostly nulls.
+
+This handler instead stores one row per data point:
+
+.. code-block::
+
+    series_key: dictionary<values=string, indices=int32>
+    <date columns>: timestamp[ns, tz=UTC]
+    value: double
+
+Rows are sorted by series and date, so the min/max statistics of ``series_key`` let reads of a few series
+skip the row groups of all the others. Missing values are not stored.
+Only the dataset level tags are embedded in the schema metadata.
+The series tags are kept in the metadata catalog.
+
+On read, the data points are pivoted back into the wide frame :py:class:`~ssb_timeseries.dataset.Dataset` expects.
+Files use the same directory layout, file names and version manifest as :py:mod:`~ssb_timeseries.io.pyarrow_simple`,
+and unversioned datasets support the same 'append' write mode (with deltas stored wide).
+The two handlers can not read each other's files, so a repository should use one or the other.
+
+.. code-block:: json
+
+    "io_handlers": {
+        "long-parquet": {"handler": "ssb_timeseries.io.pyarrow_long.LongFileSystem"}
+    }
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pyarrow
+import pyarrow.compute as pc
+from narwhals.typing import FrameT
+
+from .. import types
+from ..dataframes import empty_frame
+from ..dataframes import numeric_matrix
+from ..dataframes import to_arrow
+from ..dates import date_utc
+from ..logging import logger
+from . import fs
+from .predicates import filter_interval
+from .predicates import is_bounded
+from .predicates import row_groups_in_interval
+from .pyarrow_simple import _TIMESTAMP
+from .pyarrow_simple import FileSystem
+
+if TYPE_CHECKING:
+    import pyarrow.parquet as pq
+    from numpy.typing import NDArray
+
+    from ..intervals import Interval
+
+# mypy: disable-error-code="arg-type, return-value, attr-defined, union-attr"
+
+SERIES_KEY = "series_key"
+VALUE = "value"
+_SERIES_KEY_TYPE = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+
+# Data points per row group. Override with the repository option 'row_group_size'.
+LONG_ROW_GROUP_SIZE = 16 * 1024
+
+
+class LongFileSystem(FileSystem):
+    """A filesystem abstraction for reading and writing dataset data in long format."""
+
+    @property
+    def row_group_size(self) -> int:
+        """Return the number of data points per row group for written files."""
+        options = self.repository["directory"].get("options", {})
+        return int(options.get("row_group_size", LONG_ROW_GROUP_SIZE))
+
+    def _read_row_groups(
+        self, interval: Interval | None, columns: list[str] | None
+    ) -> pyarrow.Table:
+        """Read the data points of the selected series within the interval and pivot them to wide format.
+
+        Row groups are skipped if the statistics of ``series_key`` or the date columns show that
+        they hold none of the selected series or no dates within the interval.
+        """
+        parquet_file = fs.parquet_file(self.fullpath)
+        date_columns = self.data_type.temporality.date_columns
+        row_groups = set(range(parquet_file.metadata.num_row_groups))
+        if columns is not None:
+            row_groups &= set(row_groups_with_series(parquet_file.metadata, columns))
+        if is_bounded(interval):
+            row_groups &= set(
+                row_groups_in_interval(parquet_file.metadata, date_columns, interval)
+            )
+        logger.debug(
+            "DATASET.read %s: %s of %s row groups with selected series and dates.",
+            self.set_name,
+            len(row_groups),
+            parquet_file.metadata.num_row_groups,
+        )
+        table = parquet_file.read_row_groups(sorted(row_groups))
+        if columns is not None:
+            table = table.filter(
+                pc.is_in(
+                    table[SERIES_KEY].cast(pyarrow.string()),
+                    value_set=pyarrow.array(columns, pyarrow.string()),
+                )
+            )
+        table = filter_interval(table, date_columns, interval)
+        return to_wide(table, date_columns)
+
+    def _write_file(
+        self,
+        data: FrameT,
+        path: str,
+        schema: pyarrow.Schema | None = None,
+    ) -> None:
+        """Write (wide) data to a data file in long format.
+
+        The dataset tags in the schema metadata are kept, the series tags are not.
+        """
+        wide = to_arrow(data, schema)
+        metadata = (schema if schema is not None else wide.schema).metadata
+        long = to_long(wide, self.data_type.temporality.date_columns)
+        fs.write_parquet(
+            data=long.replace_schema_metadata(metadata),
+            path=path,
+            row_group_size=self.row_group_size,
+            write_page_index=True,
+        )
+
+    def read_numeric(
+        self,
+        interval: Interval | None = None,
+        columns: list[str] | None = None,
+    ) -> NDArray:
+        """Read the series into a read-only, column-major float64 matrix."""
+        return numeric_matrix(self.read(interval, columns), read_only=True)
+
+    def read_versions(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        interval: Interval | None = None,
+        columns: list[str] | None = None,
+    ) -> pyarrow.Table:
+        """Read all versions with 'as of' dates from ``from_`` to ``to`` (inclusive) into one table.
+
+        Each version is read and pivoted separately, then stacked with an 'as_of' column.
+        The result is sorted by 'as_of' and the date columns.
+        """
+        if self.data_type.versioning != types.Versioning.AS_OF:
+            raise ValueError(
+                f"Reading versions requires Versioning.AS_OF, {self.set_name} has {self.data_type.versioning}."
+            )
+        versions = [
+            v
+            for v in self.versions(
+                file_pattern="*.parquet", pattern=self.data_type.versioning
+            )
+            if (from_ is None or v >= date_utc(from_))
+            and (to is None or v <= date_utc(to))
+        ]
+        tables = []
+        for version in versions:
+            handler = LongFileSystem(
+                repository=self.repository,
+                set_name=self.set_name,
+                set_type=self.data_type,
+                as_of_utc=version,
+            )
+            table = handler.read(interval, columns)
+            as_of = pyarrow.scalar(version, type=_TIMESTAMP)
+            tables.append(
+                table.add_column(0, "as_of", pyarrow.repeat(as_of, table.num_rows))
+            )
+        if not tables:
+            return empty_frame()
+        table = pyarrow.concat_tables(tables, promote_options="default")
+        sort_keys = ["as_of", *self.data_type.temporality.date_columns]
+        return table.sort_by([(k, "ascending") for k in sort_keys])
+
+    def series(self) -> list[str]:
+        """List the series names in the data file, reading only the series key column."""
+        if not self.exists:
+            return []
+        keys = fs.parquet_file(self.fullpath).read(columns=[SERIES_KEY])[SERIES_KEY]
+        return sorted(pc.unique(keys.cast(pyarrow.string())).to_pylist())
+
+
+def to_long(wide: pyarrow.Table, date_columns: list[str]) -> pyarrow.Table:
+    """Unpivot a wide table into one row per non-missing data point, sorted by series and date.
+
+    A missing value is still stored for series that have no values at all,
+    and for dates where all series are missing, so that :py:func:`to_wide` gives back the same frame.
+    """
+    wide = wide.sort_by([(d, "ascending") for d in date_columns])
+    names = sorted(n for n in wide.column_names if n not in {"as_of", *date_columns})
+    codes, rows, values, missing = [], [], [], []
+    has_value = np.zeros(wide.num_rows, dtype=bool)
+    for code, name in enumerate(names):
+        column = wide[name].cast(pyarrow.float64())
+        valid = column.is_valid().to_numpy(zero_copy_only=False)
+        index = np.flatnonzero(valid)
+        if not len(index) and wide.num_rows:
+            # keep a series without values
+            index = np.array([0])
+            missing.append(np.ones(1, dtype=bool))
+        else:
+            missing.append(np.zeros(len(index), dtype=bool))
+        has_value |= valid
+        codes.append(np.full(len(index), code, dtype="int32"))
+        rows.append(index)
+        values.append(column.to_numpy(zero_copy_only=False)[index])
+    empty_rows = np.flatnonzero(~has_value) if names else np.array([], dtype=int)
+    if len(empty_rows):
+        # keep dates without values
+        codes.append(np.zeros(len(empty_rows), dtype="int32"))
+        rows.append(empty_rows)
+        values.append(np.full(len(empty_rows), np.nan))
+        missing.append(np.ones(len(empty_rows), dtype=bool))
+
+    if codes:
+        code = np.concatenate(codes)
+        row = np.concatenate(rows)
+        order = np.lexsort((row, code))
+        code, row = code[order], row[order]
+        value = np.concatenate(values)[order]
+        mask = np.concatenate(missing)[order]
+    else:
+        code = np.array([], dtype="int32")
+        row = np.array([], dtype=int)
+        value = np.array([], dtype="float64")
+        mask = np.array([], dtype=bool)
+
+    series_key = pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array(code, pyarrow.int32()), pyarrow.array(names, pyarrow.string())
+    )
+    arrays = [series_key]
+    fields = [pyarrow.field(SERIES_KEY, _SERIES_KEY_TYPE, nullable=False)]
+    for d in date_columns:
+        arrays.append(wide[d].take(pyarrow.array(row)).cast(_TIMESTAMP))
+        fields.append(pyarrow.field(d, _TIMESTAMP, nullable=False))
+    arrays.append(pyarrow.array(value, pyarrow.float64(), mask=mask))
+    fields.append(pyarrow.field(VALUE, pyarrow.float64()))
+    return pyarrow.Table.from_arrays(arrays, schema=pyarrow.schema(fields))
+
+
+def to_wide(long: pyarrow.Table, date_columns: list[str]) -> pyarrow.Table:
+    """Pivot a long table into a wide table with the date columns followed by one column per series.
+
+    Series columns are sorted by name and rows by date. Data points that are not stored are null.
+    """
+    dates = (
+        long.select(date_columns)
+        .group_by(date_columns, use_threads=False)
+        .aggregate([])
+        .sort_by([(d, "ascending") for d in date_columns])
+    )
+    dates = dates.append_column("_row", pyarrow.array(np.arange(dates.num_rows)))
+    keys = long[SERIES_KEY].cast(pyarrow.string())
+    names = pyarrow.array(sorted(pc.unique(keys).to_pylist()), pyarrow.string())
+
+    joined = (
+        long.select([VALUE, *date_columns])
+        .append_column("_code", pc.index_in(keys, value_set=names))
+        .join(dates, keys=date_columns)
+    )
+    row = joined["_row"].to_numpy()
+    code = joined["_code"].to_numpy()
+    valid = joined[VALUE].is_valid().to_numpy(zero_copy_only=False)
+    value = joined[VALUE].to_numpy(zero_copy_only=False)
+
+    matrix = np.full((dates.num_rows, len(names)), np.nan, order="F")
+    present = np.zeros((dates.num_rows, len(names)), dtype=bool, order="F")
+    matrix[row[valid], code[valid]] = value[valid]
+    present[row[valid], code[valid]] = True
+
+    arrays = [dates[d] for d in date_columns]
+    arrays += [
+        pyarrow.array(matrix[:, j], pyarrow.float64(), mask=~present[:, j])
+        for j in range(len(names))
+    ]
+    schema = pyarrow.schema(
+        [long.schema.field(d) for d in date_columns]
+        + [pyarrow.field(n, pyarrow.float64()) for n in names.to_pylist()],
+        metadata=long.schema.metadata,
+    )
+    return pyarrow.Table.from_arrays(arrays, schema=schema)
+
+
+def row_groups_with_series(
+    metadata: pq.FileMetaData,
+    series: list[str],
+) -> list[int]:
+    """Return the indices of the row groups that may hold data points of the selected series.
+
+    Row groups are excluded only when the min/max statistics of ``series_key`` prove that none of the series are in them.
+    Row groups without statistics are always included.
+    """
+    names = metadata.schema.names
+    all_row_groups = list(range(metadata.num_row_groups))
+    if SERIES_KEY not in names:
+        return all_row_groups
+    index = names.index(SERIES_KEY)
+    selected = []
+    for i in all_row_groups:
+        statistics = metadata.row_group(i).column(index).statistics
+        if statistics is None or not statistics.has_min_max:
+            selected.append(i)
+        elif any(statistics.min <= s <= statistics.max for s in series):
+            selected.append(i)
+    return selected
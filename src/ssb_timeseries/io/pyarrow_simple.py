@@ -21,29 +21,50 @@ from __future__ import annotations
 
 import os
 import re
+import uuid
 from datetime import datetime
+from functools import cached_property
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import NamedTuple
 from typing import cast
 
 import narwhals as nw
+import numpy as np
 import pyarrow
 import pyarrow.compute
+import pyarrow.dataset
 from narwhals.typing import FrameT
 
 from .. import types
 from ..config import Config
 from ..dataframes import empty_frame
+from ..dataframes import fill_matrix
 from ..dataframes import is_empty
 from ..dataframes import merge_data
+from ..dataframes import numeric_matrix
 from ..dates import date_utc
 from ..dates import datelike_to_utc
 from ..dates import prepend_as_of
+from ..dates import standardize_dates
+from ..dates import utc_iso
 from ..dates import utc_iso_no_colon
 from ..logging import logger
 from ..types import PathStr
+from . import deltas
 from . import fs
+from . import manifest
 from .parquet_schema import parquet_schema
+from .predicates import filter_interval
+from .predicates import interval_expression
+from .predicates import is_bounded
+from .predicates import projected_columns
+from .predicates import row_groups_in_interval
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ..intervals import Interval
 
 # mypy: disable-error-code="type-var, arg-type, type-arg, return-value, attr-defined, union-attr, operator, assignment,import-untyped, "
 
@@ -54,6 +75,13 @@ active_config = Config.active
 PA_TIMESTAMP_UNIT = "ns"
 PA_TIMESTAMP_TZ = "UTC"
 PA_NUMERIC = "float64"
+_TIMESTAMP = pyarrow.timestamp(unit=PA_TIMESTAMP_UNIT, tz=PA_TIMESTAMP_TZ)
+
+# Rows per Parquet row group; None for the pyarrow default.
+# Smaller row groups (with a page index) let interval reads skip more data,
+# but add per column metadata, which makes the footer and full reads of wide sets slower.
+# Opt in with the repository option 'row_group_size'.
+ROW_GROUP_SIZE: int | None = None
 
 
 def _version_from_file_name(
@@ -112,6 +140,68 @@ def last_version_number_by_regex(directory: str, pattern: str = "*") -> str:
     return out
 
 
+def _version_marker(set_type: types.SeriesType, as_of_utc: datetime | None) -> str:
+    """Return the version marker recorded in the manifest for a data file."""
+    if set_type.versioning == types.Versioning.AS_OF:
+        return utc_iso(as_of_utc)
+    return "latest"
+
+
+def _as_of_file_name(set_name: str, as_of_utc: datetime) -> str:
+    """Return the name of the data file for a version of an AS_OF dataset."""
+    return f"{set_name}-as_of_{utc_iso_no_colon(as_of_utc)}-data.parquet"
+
+
+def _versions_from_files(
+    directory: str,
+    file_pattern: str = "*.parquet",
+    pattern: str | types.Versioning = "as_of",
+) -> list[str]:
+    """Parse version markers from the names of the files in a data directory."""
+    files = fs.ls(directory, pattern=file_pattern)
+    return [_version_from_file_name(str(fname), pattern, group=2) for fname in files]
+
+
+def rebuild_manifest(directory: str, set_type: types.SeriesType) -> list[dict]:
+    """Rebuild the version manifest of a dataset directory from its data files.
+
+    Returns the manifest entries, or an empty list (and no manifest) if there are no data files.
+    """
+    with manifest.locked(directory):
+        entries = _file_entries(directory, set_type)
+        if entries:
+            manifest.write_manifest(directory, entries)
+    return entries
+
+
+def _file_entries(
+    directory: str,
+    set_type: types.SeriesType,
+    known: set[str] | frozenset = frozenset(),
+) -> list[dict]:
+    """Return manifest entries for the data files in a dataset directory, except the known file names.
+
+    Files that can not be read yet are skipped: they are being written by another process,
+    which adds them to the manifest when it is done.
+    """
+    entries = []
+    for path in sorted(fs.ls(directory, pattern="*.parquet")):
+        if os.path.basename(path) in known:
+            continue
+        version = _version_from_file_name(path, set_type.versioning, group=2)
+        if set_type.versioning == types.Versioning.AS_OF:
+            version = utc_iso(version)
+        try:
+            entry = manifest.file_entry(
+                path, version, set_type.temporality.date_columns
+            )
+        except pyarrow.ArrowInvalid:
+            logger.debug("MANIFEST: skipping %s, which is not complete.", path)
+            continue
+        entries.append(entry)
+    return entries
+
+
 class FileSystem:
     """A filesystem abstraction for reading and writing dataset data."""
 
@@ -146,21 +236,38 @@ class FileSystem:
                 "An 'as of' datetime must be specified when the type has versioning of type Versioning.AS_OF."
             )
 
-        self.as_of_utc: datetime = as_of_utc
+        self.as_of_utc = as_of_utc
 
     @property
+    def as_of_utc(self) -> datetime | None:
+        """The version marker of the dataset; changing it resets the cached file paths."""
+        return self._as_of_utc
+
+    @as_of_utc.setter
+    def as_of_utc(self, value: datetime | None) -> None:
+        self._as_of_utc = value
+        self.__dict__.pop("filename", None)
+        self.__dict__.pop("fullpath", None)
+
+    @cached_property
     def root(self) -> str:
         """Return the root path of the configured repository."""
         ts_root = self.repository["directory"]["options"]["path"]
         return str(ts_root)
 
-    @property
+    @cached_property
+    def row_group_size(self) -> int | None:
+        """Return the number of rows per row group for written files, or None for the pyarrow default."""
+        options = self.repository["directory"].get("options", {})
+        value = options.get("row_group_size", ROW_GROUP_SIZE)
+        return None if value is None else int(value)
+
+    @cached_property
     def filename(self) -> str:
         """Construct the standard filename for the dataset's data file."""
         match str(self.data_type.versioning):
             case "AS_OF":
-                safe_timestamp = utc_iso_no_colon(self.as_of_utc)
-                file_name = f"{self.set_name}-as_of_{safe_timestamp}-data.parquet"
+                file_name = _as_of_file_name(self.set_name, self.as_of_utc)
             case "NONE":
                 file_name = f"{self.set_name}-latest-data.parquet"
             case "NAMED":
@@ -171,7 +278,7 @@ class FileSystem:
         logger.debug(file_name)
         return file_name
 
-    @property
+    @cached_property
     def directory(self) -> str:
         """Return the data directory for the dataset."""
         return os.path.join(
@@ -180,20 +287,35 @@ class FileSystem:
             self.set_name,
         )
 
-    @property
+    @cached_property
     def fullpath(self) -> str:
         """Return the full path to the dataset's data file."""
         return os.path.join(self.directory, self.filename)
 
     def read(
         self,
-        interval: str = "",  # TODO: Implement use av interval = Interval.all,
+        interval: Interval | None = None,
+        columns: list[str] | None = None,
     ) -> pyarrow.Table:
         """Read data from the filesystem.
 
+        If an interval is provided, row groups that fall entirely outside of it
+        are skipped based on the min/max statistics of the date columns,
+        and only rows within the interval are returned.
+
+        If a list of columns (series names) is provided, only those columns and the date columns are read.
+
         Returns an empty dataframe if the file is not found.
         """
-        logger.debug(interval)
+        return self._read(interval, columns)
+
+    def _read(
+        self,
+        interval: Interval | None = None,
+        columns: list[str] | None = None,
+        delta_paths: list[str] | None = None,
+    ) -> pyarrow.Table:
+        """Read data as by :py:meth:`read`, merging the given delta files, or all of them if None."""
         if fs.exists(self.fullpath):
             logger.info(
                 "DATASET.read.start %s: Reading data from file %s",
@@ -201,7 +323,9 @@ class FileSystem:
                 self.fullpath,
             )
             try:
-                df = fs.read_parquet(self.fullpath, implementation="pyarrow")
+                df = self._read_row_groups(interval, columns)
+                if self.data_type.versioning == types.Versioning.NONE:
+                    df = self._apply_deltas(df, interval, columns, delta_paths)
                 logger.info("DATASET.read.success %s: Read data.", self.set_name)
             except FileNotFoundError:
                 logger.exception(
@@ -222,18 +346,186 @@ class FileSystem:
 
         return cast(pyarrow.Table, pa_table)
 
+    def read_numeric(
+        self,
+        interval: Interval | None = None,
+        columns: list[str] | None = None,
+    ) -> NDArray:
+        """Read the series columns into a read-only, column-major float64 matrix.
+
+        Row groups are decoded one at a time straight into a preallocated matrix,
+        so peak memory stays close to the size of the matrix.
+        The file is read through a buffered file object rather than memory mapped,
+        since the mapped pages of the whole file would otherwise stay resident while the matrix is filled.
+
+        Falls back to :py:func:`~ssb_timeseries.dataframes.numeric_matrix` of a regular read
+        for bounded intervals, delta files or non float64 columns.
+        """
+        if (
+            not fs.exists(self.fullpath)
+            or is_bounded(interval)
+            or deltas.delta_files(self.directory)
+        ):
+            return numeric_matrix(self.read(interval, columns), read_only=True)
+
+        parquet_file = fs.parquet_file(self.fullpath, memory_map=False)
+        schema = parquet_file.schema_arrow
+        selected = projected_columns(
+            schema.names, self.data_type.date_columns, columns
+        ) or list(schema.names)
+        names = [
+            n for n in selected if n not in self.data_type.date_columns and n != "as_of"
+        ]
+        if any(schema.field(n).type != pyarrow.float64() for n in names):
+            return numeric_matrix(self.read(interval, columns), read_only=True)
+
+        matrix = np.empty(
+            (parquet_file.metadata.num_rows, len(names)), dtype="float64", order="F"
+        )
+        offset = 0
+        for i in range(parquet_file.num_row_groups):
+            row_group = parquet_file.read_row_group(i, columns=names)
+            fill_matrix(matrix, row_group.columns, row_offset=offset)
+            offset += row_group.num_rows
+        matrix.flags.writeable = False
+        return matrix
+
+    def read_versions(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        interval: Interval | None = None,
+        columns: list[str] | None = None,
+    ) -> pyarrow.Table:
+        """Read all versions with 'as of' dates from ``from_`` to ``to`` (inclusive) into one table.
+
+        The selected files are read in a single (multithreaded) dataset scan,
+        with the same interval filter and column selection as :py:meth:`read`.
+        The 'as_of' column is derived from the file names.
+        The result is sorted by 'as_of' and the date columns.
+        """
+        if self.data_type.versioning != types.Versioning.AS_OF:
+            raise ValueError(
+                f"Reading versions requires Versioning.AS_OF, {self.set_name} has {self.data_type.versioning}."
+            )
+        versions = [
+            v
+            for v in self.versions(
+                file_pattern="*.parquet", pattern=self.data_type.versioning
+            )
+            if (from_ is None or v >= date_utc(from_))
+            and (to is None or v <= date_utc(to))
+        ]
+        if not versions:
+            return empty_frame()
+        as_of_by_file = {
+            _as_of_file_name(self.set_name, v): pyarrow.scalar(v, type=_TIMESTAMP)
+            for v in versions
+        }
+        filesystem, directory = fs.arrow_filesystem(self.directory)
+        paths = [os.path.join(directory, f) for f in as_of_by_file]
+        dataset = pyarrow.dataset.dataset(
+            paths, filesystem=filesystem, format="parquet"
+        )
+        schema = pyarrow.unify_schemas(
+            [f.physical_schema for f in dataset.get_fragments()]
+        )
+        dataset = pyarrow.dataset.dataset(
+            paths, schema=schema, filesystem=filesystem, format="parquet"
+        )
+
+        selected = projected_columns(
+            schema.names, self.data_type.date_columns, columns
+        ) or list(schema.names)
+        scanner = dataset.scanner(
+            columns=[n for n in selected if n != "as_of"],
+            filter=interval_expression(
+                self.data_type.temporality.date_columns, interval
+            ),
+        )
+        schema = pyarrow.schema(
+            [pyarrow.field("as_of", _TIMESTAMP), *scanner.projected_schema]
+        )
+        batches = []
+        for tagged in scanner.scan_batches():
+            batch = tagged.record_batch
+            as_of = as_of_by_file[os.path.basename(tagged.fragment.path)]
+            batches.append(
+                pyarrow.RecordBatch.from_arrays(
+                    [pyarrow.repeat(as_of, batch.num_rows), *batch.columns],
+                    schema=schema,
+                )
+            )
+        table = pyarrow.Table.from_batches(batches, schema=schema)
+        sort_keys = ["as_of", *self.data_type.temporality.date_columns]
+        return table.sort_by([(k, "ascending") for k in sort_keys])
+
+    def _apply_deltas(
+        self,
+        base: pyarrow.Table,
+        interval: Interval | None,
+        columns: list[str] | None,
+        paths: list[str] | None = None,
+    ) -> pyarrow.Table:
+        """Merge delta files into the data read from the base file: the given ones, or all of them if None."""
+        if paths is None:
+            paths = deltas.delta_files(self.directory)
+        if not paths:
+            return base
+        logger.debug("DATASET.read %s: merging %s deltas.", self.set_name, len(paths))
+        return deltas.apply_deltas(
+            base,
+            deltas.read_deltas(paths, self.data_type.date_columns, interval, columns),
+            self.data_type,
+        )
+
+    def _read_row_groups(
+        self, interval: Interval | None, columns: list[str] | None
+    ) -> pyarrow.Table:
+        """Read the selected columns of the row groups that may hold data within the interval."""
+        parquet_file = fs.parquet_file(self.fullpath)
+        date_columns = self.data_type.temporality.date_columns
+        columns = projected_columns(
+            parquet_file.schema_arrow.names, self.data_type.date_columns, columns
+        )
+        if not is_bounded(interval):
+            return parquet_file.read(columns=columns)
+
+        row_groups = row_groups_in_interval(
+            parquet_file.metadata, date_columns, interval
+        )
+        logger.debug(
+            "DATASET.read %s: %s of %s row groups within %s.",
+            self.set_name,
+            len(row_groups),
+            parquet_file.metadata.num_row_groups,
+            interval,
+        )
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+        return filter_interval(table, date_columns, interval)
+
     def write(self, data: FrameT, tags: dict | None = None) -> None:
         """Write data to the filesystem.
 
         If versioning is AS_OF, a new file is always created.
-        If versioning is NONE, new data is merged into the existing file.
+        If versioning is NONE, new data is merged into the existing file,
+        or with the repository option ``write_mode: append``, written to a delta file next to it.
+        See :py:mod:`ssb_timeseries.io.deltas`.
+
+        Errors are logged and raised.
         """
         new = nw.from_native(data)
+        folded_deltas = []
         if self.data_type.versioning == types.Versioning.AS_OF:
             # consider a merge option for versioned writing?
             df = prepend_as_of(new, self.as_of_utc)
+        elif self.delta_options.write_mode == "append" and self.exists:
+            self._write_delta(new, tags)
+            return
         else:
-            old = self.read(self.set_name)
+            # the deltas that are merged are exactly those that are removed after the write
+            folded_deltas = deltas.delta_files(self.directory)
+            old = self._read(delta_paths=folded_deltas)
             if is_empty(old):
                 df = new
             else:
@@ -256,11 +548,11 @@ class FileSystem:
             self.fullpath,
         )
         try:
-            fs.write_parquet(
-                data=df,
-                path=self.fullpath,
-                schema=parquet_schema(self.data_type, tags),
+            self._write_file(
+                df, self.fullpath, schema=parquet_schema(self.data_type, tags)
             )
+            deltas.remove_deltas(folded_deltas)
+            self._update_manifest()
         except Exception as e:
             logger.exception(
                 "DATASET.write.error %s: writing data to file\n\t%s\nreturned exception: %s.",
@@ -268,27 +560,129 @@ class FileSystem:
                 self.fullpath,
                 e,
             )
+            raise
         logger.info(
             "DATASET.write.success %s: writing data to file\n\t%s\nended.",
             self.set_name,
             self.fullpath,
         )
 
+    def _write_file(
+        self,
+        data: FrameT,
+        path: str,
+        schema: pyarrow.Schema | None = None,
+    ) -> None:
+        """Write (wide) data to a data file, with series as columns.
+
+        A page index is only written along with the small row groups of the 'row_group_size' option.
+        """
+        fs.write_parquet(
+            data=data,
+            path=path,
+            schema=schema,
+            row_group_size=self.row_group_size,
+            write_page_index=self.row_group_size is not None,
+        )
+
+    @cached_property
+    def delta_options(self) -> deltas.DeltaOptions:
+        """Return the write mode and compaction thresholds of the repository."""
+        return deltas.options(self.repository)
+
+    def _write_delta(self, data: FrameT, tags: dict | None) -> None:
+        """Write data to a delta file, then compact if the thresholds are exceeded."""
+        logger.info(
+            "DATASET.write.start %s: appending delta to %s.",
+            self.set_name,
+            self.directory,
+        )
+        deltas.write_delta(
+            self.directory,
+            standardize_dates(data),
+            schema=parquet_schema(self.data_type, tags),
+        )
+        if deltas.needs_compaction(
+            deltas.delta_files(self.directory), self.delta_options
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold delta files into the base data file.
+
+        The merged data is written to a temporary file that replaces the base file,
+        before the deltas that were folded in are removed.
+        The tags embedded in the newest files are kept, see :py:func:`~ssb_timeseries.io.deltas.tagged_schema`.
+        """
+        folded_deltas = deltas.delta_files(self.directory)
+        if not folded_deltas:
+            return
+        logger.info(
+            "DATASET.compact.start %s: folding %s deltas into %s.",
+            self.set_name,
+            len(folded_deltas),
+            self.fullpath,
+        )
+        base = self._read_row_groups(interval=None, columns=None)
+        merged = deltas.apply_deltas(
+            base,
+            deltas.read_deltas(folded_deltas, self.data_type.date_columns),
+            self.data_type,
+        )
+        schema = deltas.tagged_schema(
+            merged,
+            [base.schema] + [fs.parquet_file(p).schema_arrow for p in folded_deltas],
+        )
+        merged = pyarrow.Table.from_arrays(merged.columns, schema=schema)
+        temporary_path = f"{self.fullpath}.{uuid.uuid4().hex[:8]}.tmp"
+        self._write_file(merged, temporary_path)
+        fs.mv(temporary_path, self.fullpath)
+        deltas.remove_deltas(folded_deltas)
+        self._update_manifest()
+        logger.info("DATASET.compact.success %s.", self.set_name)
+
     @property
     def exists(self) -> bool:
         """Check if the data file for the dataset exists."""
         return fs.exists(self.fullpath)
 
+    def signature(self) -> tuple | None:
+        """Return a marker of the stored data, or None if there is no data file.
+
+        The marker holds the signatures (see :py:func:`~ssb_timeseries.io.fs.file_signature`) of the data file,
+        and for unversioned sets, of its delta files; it changes whenever the data that :py:meth:`read` returns may have changed.
+        """
+        data_file = fs.file_signature(self.fullpath)
+        if data_file is None:
+            return None
+        if self.data_type.versioning != types.Versioning.NONE:
+            return (data_file,)
+        delta_files = fs.signatures(deltas.delta_directory(self.directory), "*.parquet")
+        return (data_file, *sorted(delta_files.items()))
+
+    def series(self) -> list[str]:
+        """List the series names in the data file, reading only the Parquet footer."""
+        if not self.exists:
+            return []
+        names = fs.parquet_file(self.fullpath).schema_arrow.names
+        return [n for n in names if n not in {"as_of", *self.data_type.date_columns}]
+
     def versions(
         self, file_pattern: str = "*", pattern: str | types.Versioning = "as_of"
     ) -> list[datetime | str]:
-        """List all available version markers from the data directory."""
-        files = fs.ls(self.directory, pattern=file_pattern)
+        """List all available version markers.
+
+        The markers are read from the version manifest of the dataset (see :py:mod:`ssb_timeseries.io.manifest`).
+        For datasets without a manifest, they are parsed from the names of the files in the data directory.
+        """
+        entries = manifest.read_manifest(self.directory)
+        if entries is None:
+            vs_strings = _versions_from_files(self.directory, file_pattern, pattern)
+        else:
+            vs_strings = [e["version"] for e in entries]
+
         versions: list[str | datetime] = []
-        if files:
-            vs_strings = [
-                _version_from_file_name(str(fname), pattern, group=2) for fname in files
-            ]
+        if vs_strings:
             match types.Versioning(pattern):
                 case types.Versioning.AS_OF:
                     versions = sorted([date_utc(as_of) for as_of in vs_strings])
@@ -300,6 +694,37 @@ class FileSystem:
                     raise ValueError(f"pattern '{pattern}' not recognized.")
         return versions
 
+    def _update_manifest(self) -> None:
+        """Record the current data file in the version manifest.
+
+        Data files that are missing from the manifest (or all of them, if there is no manifest yet) are added as well.
+        """
+        manifest.update_manifest(
+            self.directory,
+            manifest.file_entry(
+                self.fullpath,
+                _version_marker(self.data_type, self.as_of_utc),
+                self.data_type.temporality.date_columns,
+            ),
+            unlisted=lambda known: _file_entries(self.directory, self.data_type, known),
+        )
+
+    @classmethod
+    def rebuild_manifests(cls, repository: dict[str, Any]) -> int:
+        """Rebuild the version manifests of all datasets in a repository and return the number of datasets."""
+        root = repository["directory"]["options"]["path"]
+        count = 0
+        for type_directory in fs.ls(root):
+            type_name = os.path.basename(type_directory)
+            if type_name not in types.SeriesType.permutations():
+                continue
+            set_type = types.seriestype_from_str(type_name)
+            for set_directory in fs.ls(type_directory):
+                if rebuild_manifest(set_directory, set_type):
+                    count += 1
+        logger.info("Rebuilt version manifests for %s datasets in %s.", count, root)
+        return count
+
 
 # ================================ SEARCH: =================================
 
@@ -2,9 +2,15 @@
 
 It provides data structures and functions for managing tags and taxonomies.
 Functionality is imported from submodules to create a single, convenient point of access.
+Taxonomy features depend on networkx and are imported on first access.
 """
 
-from ssb_timeseries.meta.loaders import KlassTaxonomy
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
 from ssb_timeseries.meta.tags import DatasetTagDict
 from ssb_timeseries.meta.tags import SeriesTagDict
 from ssb_timeseries.meta.tags import TagDict
@@ -17,5 +23,23 @@ from ssb_timeseries.meta.tags import inherit_set_tags
 from ssb_timeseries.meta.tags import matches_criteria
 from ssb_timeseries.meta.tags import replace_dataset_tags
 from ssb_timeseries.meta.tags import search_by_tags
-from ssb_timeseries.meta.taxonomy import Taxonomy
-from ssb_timeseries.meta.taxonomy import permutations
+
+if TYPE_CHECKING:
+    from ssb_timeseries.meta.loaders import KlassTaxonomy
+    from ssb_timeseries.meta.taxonomy import Taxonomy
+    from ssb_timeseries.meta.taxonomy import permutations
+
+_LAZY_ATTRIBUTES = {
+    "KlassTaxonomy": "ssb_timeseries.meta.loaders",
+    "Taxonomy": "ssb_timeseries.meta.taxonomy",
+    "permutations": "ssb_timeseries.meta.taxonomy",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import taxonomy features on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,13 +16,20 @@ from typing import TypeAlias
 
 import narwhals as nw
 import pyarrow as pa
-from klass import get_classification
 from narwhals.typing import IntoFrameT
 
 from ssb_timeseries.dataframes import is_df_like
 from ssb_timeseries.io import fs
 from ssb_timeseries.types import PathStr
 
+
+def get_classification(klass_id: str) -> Any:
+    """Retrieve a classification from KLASS; the KLASS client is imported on first use."""
+    from klass import get_classification as klass_get_classification
+
+    return klass_get_classification(klass_id)
+
+
 # Re-define shared constants and types
 KLASS_ITEM_SCHEMA = pa.schema(
     [
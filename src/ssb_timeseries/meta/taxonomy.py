@@ -14,7 +14,6 @@ from itertools import chain
 from typing import TYPE_CHECKING
 from typing import Any
 
-import matplotlib.pyplot as plt
 import narwhals as nw
 import networkx as nx
 
@@ -204,6 +203,8 @@ class Taxonomy:
                 "linewidths": 1,
                 "width": 1,
             }
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=figsize)
         nx.draw_networkx(
             self.structure,
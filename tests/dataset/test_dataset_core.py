@@ -1,16 +1,20 @@
+import asyncio
 import logging
 import uuid
 from datetime import timedelta
 
+import numpy as np
 import pytest
 from pytest import LogCaptureFixture
 
+from ssb_timeseries import io
 from ssb_timeseries.dataframes import is_empty
 from ssb_timeseries.dataset import Dataset
 from ssb_timeseries.dataset import default_repository
 from ssb_timeseries.dataset import search
 from ssb_timeseries.dates import date_utc
 from ssb_timeseries.dates import now_utc
+from ssb_timeseries.intervals import Interval
 from ssb_timeseries.io import DataIO
 from ssb_timeseries.io import MetaIO
 from ssb_timeseries.io.fs import file_count
@@ -349,6 +353,122 @@ def test_read_existing_estimate_data(
     assert x.data.shape == (12, 28)
 
 
+def test_read_existing_estimate_data_within_interval(
+    existing_estimate_set: Dataset,
+) -> None:
+    first_dates = existing_estimate_set.data["valid_at"][:2]
+    x = Dataset(
+        name=existing_estimate_set.name,
+        as_of_tz=existing_estimate_set.as_of_utc,
+        interval=Interval(start=first_dates.iloc[0], stop=first_dates.iloc[1]),
+    )
+    assert x.data.shape == (2, 28)
+
+
+def test_read_existing_data_for_selected_series_only(
+    existing_small_set: Dataset,
+) -> None:
+    x = Dataset(
+        name=existing_small_set.name,
+        as_of_tz=existing_small_set.as_of_utc,
+        series=["a1_b_c"],
+        tags={"A": "a3"},
+    )
+    assert x.series == ["a1_b_c", "a3_b_c"]
+    assert x.data.shape == (3, 3)
+    assert set(x.tags["series"]) == set(existing_small_set.series)
+
+
+def test_open_existing_set_reads_metadata_but_defers_data(
+    existing_estimate_set: Dataset,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    reads = []
+    read = DataIO.read
+
+    def spy(self, *args, **kwargs):
+        reads.append(self.ds.name)
+        return read(self, *args, **kwargs)
+
+    monkeypatch.setattr(DataIO, "read", spy)
+    x = Dataset.open(existing_estimate_set.name)
+
+    assert x.series == existing_estimate_set.series
+    assert x.tags["series"].keys() == existing_estimate_set.tags["series"].keys()
+    assert x.data_type == existing_estimate_set.data_type
+    assert x.versions()
+    assert not x.data_is_loaded
+    assert reads == []
+
+    assert x.data.shape == existing_estimate_set.data.shape
+    assert x.data_is_loaded
+    assert reads == [existing_estimate_set.name]
+
+
+def test_open_applies_series_tags_and_auto_tags_when_data_is_read(
+    existing_estimate_set: Dataset,
+) -> None:
+    x = Dataset.open(
+        existing_estimate_set.name,
+        series_tags={"unit": "NOK"},
+        attributes=["P", "Q", "R"],
+    )
+    assert not x.data_is_loaded
+    assert all("unit" not in t for t in x.tags["series"].values())
+
+    assert x.data.shape == existing_estimate_set.data.shape
+    for name, tags in x.tags["series"].items():
+        assert tags["unit"] == "NOK"
+        assert [tags["P"], tags["Q"], tags["R"]] == name.split("_")
+
+
+def test_asave_and_aopen_round_trip(conftest, xyz_at) -> None:
+    x = Dataset(
+        name=conftest.function_name_hex(),
+        data_type=SeriesType.estimate(),
+        as_of_tz=date_utc("2022-01-01"),
+        data=xyz_at,
+    )
+    asyncio.run(x.asave())
+
+    y = asyncio.run(Dataset.aopen(x.name))
+    assert y.data_is_loaded
+    assert y.as_of_utc == x.as_of_utc
+    assert y.series == x.series
+    assert y.data.shape == x.data.shape
+    assert not asyncio.run(Dataset.aopen(x.name, lazy=True)).data_is_loaded
+
+
+def test_load_many_returns_the_same_as_opening_each_set(
+    existing_estimate_set: Dataset,
+    existing_small_set: Dataset,
+) -> None:
+    names = [existing_estimate_set.name, existing_small_set.name]
+
+    loaded = Dataset.load_many(names)
+
+    assert list(loaded) == names
+    for name in names:
+        one = Dataset(name)
+        assert loaded[name].as_of_utc == one.as_of_utc
+        assert loaded[name].data_type == one.data_type
+        assert loaded[name].repository == one.repository
+        assert loaded[name].tags == one.tags
+        assert loaded[name].data.equals(one.data)
+
+
+def test_lazy_dataset_materializes_data_for_math_and_select(
+    existing_small_set: Dataset,
+) -> None:
+    x = Dataset(existing_small_set.name, lazy=True)
+    assert (x * 2).data.shape == existing_small_set.data.shape
+    x = Dataset(existing_small_set.name, lazy=True)
+    assert x.select("a1_b_c").series == ["a1_b_c"]
+    x = Dataset(existing_small_set.name, lazy=True, series=["a2_b_c"])
+    assert x.series == ["a2_b_c"]
+    assert x.numeric_array().shape == (3, 1)
+
+
 def test_load_existing_set_without_loading_data(
     conftest,
     caplog: LogCaptureFixture,
@@ -774,3 +894,55 @@ def test_select_preserves_tags(
 
     # The rest of the tags should be identical
     assert original_tags == selected_tags
+
+
+def test_read_only_numeric_array_of_lazy_set_is_filled_from_storage(
+    existing_estimate_set: Dataset,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    expected = Dataset(existing_estimate_set.name).numeric_array()
+    monkeypatch.setattr(
+        DataIO, "read", lambda *args, **kwargs: pytest.fail("data was read")
+    )
+    x = Dataset.open(existing_estimate_set.name)
+
+    matrix = x.numeric_array(read_only=True)
+
+    assert not matrix.flags.writeable
+    assert np.array_equal(matrix, expected)
+    assert not x.data_is_loaded
+    subset = x.numeric_array(series=x.series[1:3], read_only=True)
+    assert np.array_equal(subset, expected[:, 1:3])
+
+
+def test_read_only_numeric_array_of_lazy_set_keeps_empty_tag_selection(
+    existing_estimate_set: Dataset,
+) -> None:
+    name = existing_estimate_set.name
+    requested = existing_estimate_set.series[:2]
+    expected = Dataset(name, tags={"A": "no-such-value"}).numeric_array(
+        series=requested
+    )
+    x = Dataset.open(name, tags={"A": "no-such-value"})
+
+    matrix = x.numeric_array(series=requested, read_only=True)
+
+    assert expected.shape[1] == 0
+    assert matrix.shape == expected.shape
+
+
+def test_read_versions_stacks_saved_versions(
+    new_dataset_as_of_at: Dataset,
+) -> None:
+    x = new_dataset_as_of_at
+    as_of_dates = [date_utc(d) for d in ("2024-01-01", "2024-02-01", "2024-03-01")]
+    for as_of in as_of_dates:
+        x.as_of_utc = as_of
+        x.save()
+
+    stacked = x.read_versions(from_=as_of_dates[1], series=x.series[:3])
+
+    assert sorted(set(stacked["as_of"].to_pylist())) == as_of_dates[1:]
+    assert stacked.num_rows == 2 * len(x.data)
+    assert stacked.column_names == ["as_of", "valid_at", *x.series[:3]]
+    assert io.read_versions(x.repository, x.name).num_rows == 3 * len(x.data)
@@ -0,0 +1,291 @@
+"""Unit tests for the catalog index of the JSON metadata handler."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from ssb_timeseries.io import catalog_index
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import json_metadata
+
+# mypy: ignore-errors
+
+
+def _tags(set_name: str, n: int = 3, **dataset_tags) -> dict:
+    return {
+        "name": set_name,
+        "repository": "test",
+        "versioning": "NONE",
+        "temporality": "AT",
+        **dataset_tags,
+        "series": {
+            f"{set_name}_s{i}": {
+                "name": f"{set_name}_s{i}",
+                "dataset": set_name,
+                "unit": "NOK" if i % 2 else "EUR",
+                "quality": ["good", "bad"][i % 2],
+            }
+            for i in range(n)
+        },
+    }
+
+
+def _search_files(path: Path, **kwargs) -> list[dict]:
+    """Search by parsing every metadata file, without the index."""
+    tags = kwargs.pop("tags", None) or {}
+    datasets = kwargs.pop("datasets", True)
+    series = kwargs.pop("series", False)
+    results = []
+    for f in sorted(json_metadata.find_metadata_files(path=str(path), **kwargs)):
+        t = fs.read_json(f)
+        if datasets:
+            results.extend(
+                json_metadata._filter_items(
+                    [json_metadata._build_dataset_item(t, t.get("repository"))], tags
+                )
+            )
+        if series:
+            results.extend(
+                json_metadata._filter_items(
+                    json_metadata._build_series_items(t, t.get("repository")), tags
+                )
+            )
+    return results
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> json_metadata.JsonMetaIO:
+    handler = json_metadata.JsonMetaIO(
+        repository={"name": "test", "catalog": {"options": {"path": str(tmp_path)}}}
+    )
+    for i, set_name in enumerate(["alpha", "beta", "gamma_1", "gamma_2"]):
+        handler.write(
+            tags=_tags(set_name, n=i + 1, owner=f"o{i % 2}"), set_name=set_name
+        )
+    return handler
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {},
+        {"equals": "beta"},
+        {"contains": "gamma"},
+        {"pattern": "*a"},
+        {"tags": {"owner": "o1"}},
+        {"tags": {"unit": "NOK"}, "datasets": False, "series": True},
+        {"tags": [{"unit": "EUR"}, {"quality": ["bad"]}], "series": True},
+        {"contains": "gamma", "tags": {"unit": ["NOK", "USD"]}, "series": True},
+    ],
+)
+def test_search_with_index_returns_same_as_reading_all_files(
+    catalog: json_metadata.JsonMetaIO,
+    criteria: dict,
+) -> None:
+    assert catalog.search(**dict(criteria)) == _search_files(
+        Path(catalog.dir), **dict(criteria)
+    )
+    assert fs.exists(catalog_index.index_path(catalog.dir))
+
+
+def test_write_updates_index_so_search_reads_no_metadata_files(
+    catalog: json_metadata.JsonMetaIO,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    catalog.search()
+    catalog.write(tags=_tags("delta", n=2), set_name="delta")
+    catalog.write(tags=_tags("alpha", n=5), set_name="alpha")
+
+    def fail(path):
+        raise AssertionError(f"read {path}")
+
+    monkeypatch.setattr(fs, "read_json", fail)
+    series = catalog.search(datasets=False, series=True, contains="a")
+
+    assert [s["object_name"] for s in series if s["parent"] == "alpha"] == [
+        f"alpha_s{i}" for i in range(5)
+    ]
+    assert {s["parent"] for s in series} == {
+        "alpha",
+        "beta",
+        "delta",
+        "gamma_1",
+        "gamma_2",
+    }
+
+
+def test_write_many_stores_index_once_and_reports_failed_files(
+    catalog: json_metadata.JsonMetaIO,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    catalog.search()
+    stored = []
+    store = catalog_index._store
+
+    def spy(directory, index):
+        stored.append(index.num_rows)
+        return store(directory, index)
+
+    write_json = fs.write_json
+
+    def fail_for_epsilon(path, content):
+        if "epsilon" in str(path):
+            raise OSError("disk full")
+        return write_json(path, content)
+
+    monkeypatch.setattr(catalog_index, "_store", spy)
+    monkeypatch.setattr(fs, "write_json", fail_for_epsilon)
+    errors = catalog.write_many(
+        {
+            "delta": _tags("delta", n=2),
+            "epsilon": _tags("epsilon"),
+            "alpha": _tags("alpha", n=5),
+        },
+        max_workers=3,
+    )
+
+    assert list(errors) == ["epsilon"]
+    assert isinstance(errors["epsilon"], OSError)
+    assert len(stored) == 1
+    monkeypatch.setattr(fs, "write_json", write_json)
+    assert catalog.search(series=True) == _search_files(Path(catalog.dir), series=True)
+    assert "epsilon" not in [d["object_name"] for d in catalog.search()]
+
+
+def test_index_is_validated_against_file_changes(
+    catalog: json_metadata.JsonMetaIO,
+) -> None:
+    catalog.search()
+    # changed and removed outside the handler
+    path = Path(catalog.fullpath("beta"))
+    path.write_text(json.dumps(_tags("beta", n=1, owner="someone else")))
+    Path(catalog.fullpath("gamma_2")).unlink()
+
+    found = catalog.search(series=True)
+
+    assert found == _search_files(Path(catalog.dir), series=True)
+    assert [d["object_tags"]["owner"] for d in found if d["object_name"] == "beta"] == [
+        "someone else"
+    ]
+    assert "gamma_2" not in [d["object_name"] for d in found]
+
+
+def test_search_without_write_access_returns_index_in_memory(
+    catalog: json_metadata.JsonMetaIO,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    expected = _search_files(Path(catalog.dir), series=True)
+    assert not fs.exists(catalog_index.index_path(catalog.dir))
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only bucket")
+
+    monkeypatch.setattr(fs, "write_parquet", read_only)
+
+    assert catalog.search(series=True) == expected
+    assert [d["object_name"] for d in catalog.search(equals="beta")] == ["beta"]
+    assert catalog_index.rebuild_index(catalog.dir).num_rows == 4 + (1 + 2 + 3 + 4)
+    assert not fs.exists(catalog_index.index_path(catalog.dir))
+
+
+def test_indexes_of_different_catalogs_are_read_at_the_same_time(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    candidates = [str(tmp_path / f"catalog_{n}") for n in range(10)]
+    first = candidates[0]
+    second = next(
+        d
+        for d in candidates
+        if catalog_index._directory_lock(d) is not catalog_index._directory_lock(first)
+    )
+    for directory in [first, second]:
+        fs.write_json(
+            f"{directory}/alpha{catalog_index.METADATA_SUFFIX}", _tags("alpha")
+        )
+    # each read waits, while holding its lock, until the other has started
+    both_started = threading.Barrier(2, timeout=5)
+    signatures = fs.signatures
+
+    def signatures_together(*args, **kwargs):
+        both_started.wait()
+        return signatures(*args, **kwargs)
+
+    monkeypatch.setattr(fs, "signatures", signatures_together)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        indexes = list(executor.map(catalog_index.read_index, [first, second]))
+
+    assert [i.num_rows for i in indexes] == [1 + 3, 1 + 3]
+
+
+def test_unreadable_index_is_rebuilt(
+    catalog: json_metadata.JsonMetaIO,
+) -> None:
+    expected = catalog.search(series=True)
+    Path(catalog_index.index_path(catalog.dir)).write_bytes(b"not parquet")
+    catalog_index._loaded.clear()
+
+    assert catalog.search(series=True) == expected
+    assert catalog_index.rebuild_index(catalog.dir).num_rows == 4 + (1 + 2 + 3 + 4)
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {"unit": "NOK"},
+        {"unit": "NOK", "quality": "bad"},
+        {"unit": "NOK", "quality": "good"},
+        {"unit": ["NOK", "EUR"], "dataset": ["beta", "gamma_2"]},
+        [{"owner": "o1"}, {"unit": "EUR", "dataset": "alpha"}],
+        {"owner": None},
+        {"unit": []},
+        {"no_such_attribute": "x"},
+    ],
+)
+def test_tag_index_matches_same_rows_as_matches_criteria(
+    catalog: json_metadata.JsonMetaIO,
+    criteria: dict | list[dict],
+) -> None:
+    index = catalog_index.read_index(catalog.dir)
+    objects = [json.loads(t) for t in index["tags"].to_pylist()]
+
+    selected = catalog_index.TagIndex(index).matching(criteria)
+
+    assert selected.tolist() == [
+        json_metadata._matches_tags(tags, criteria) for tags in objects
+    ]
+
+
+def test_tag_index_is_rebuilt_after_write(
+    catalog: json_metadata.JsonMetaIO,
+) -> None:
+    criteria = {"owner": "new owner"}
+    assert catalog.search(tags=criteria) == []
+    catalog.write(tags=_tags("delta", owner="new owner"), set_name="delta")
+
+    assert [d["object_name"] for d in catalog.search(tags=criteria)] == ["delta"]
+
+
+def test_search_reads_metadata_files_with_configured_concurrency(
+    catalog: json_metadata.JsonMetaIO,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+    read_json_many = fs.read_json_many
+
+    def spy(paths, max_workers=fs.MAX_CONCURRENT_READS):
+        calls.append(max_workers)
+        return read_json_many(paths, max_workers=max_workers)
+
+    monkeypatch.setattr(fs, "read_json_many", spy)
+    catalog.repository["catalog"]["options"]["read_concurrency"] = 3
+    # the index is built by the first search
+    assert catalog.search(series=True) == _search_files(Path(catalog.dir), series=True)
+    assert calls == [3]
+
+    catalog.repository["catalog"]["options"]["read_concurrency"] = 0
+    with pytest.raises(ValueError, match="read_concurrency"):
+        catalog.search()
@@ -0,0 +1,68 @@
+"""Unit tests for the in-process data cache."""
+
+import pyarrow
+import pytest
+
+from ssb_timeseries.io import data_cache
+
+# mypy: ignore-errors
+
+
+def _table(rows: int) -> pyarrow.Table:
+    return pyarrow.table({"x": pyarrow.array(range(rows), pyarrow.int64())})
+
+
+@pytest.fixture
+def cache():
+    data_cache.reset_stats()
+    with data_cache.enabled(max_bytes=2_000):
+        yield
+    data_cache.reset_stats()
+
+
+def test_data_cache_is_off_by_default() -> None:
+    data_cache.put(("r", "x", None), 1, _table(1))
+
+    assert not data_cache.is_enabled()
+    assert data_cache.get(("r", "x", None), 1) is None
+    assert data_cache.stats() == (0, 0, 0, 0)
+
+
+def test_data_cache_returns_the_cached_table_for_the_same_signature(cache) -> None:
+    key = ("r", "x", None)
+    table = _table(10)
+    data_cache.put(key, ("mtime", 80), table)
+
+    assert data_cache.get(key, ("mtime", 80)) is table
+    assert data_cache.get(key, ("changed", 80)) is None
+    assert data_cache.get(key, ("mtime", 80)) is None
+    assert data_cache.stats() == (1, 2, 0, 0)
+
+
+def test_data_cache_evicts_least_recently_used_tables_within_budget(cache) -> None:
+    # 800 bytes each, for a budget of 2000 bytes
+    for name in ["a", "b"]:
+        data_cache.put(("r", name, None), 1, _table(100))
+    data_cache.get(("r", "a", None), 1)
+    data_cache.put(("r", "c", None), 1, _table(100))
+
+    assert data_cache.get(("r", "b", None), 1) is None
+    assert data_cache.get(("r", "a", None), 1) is not None
+    assert data_cache.stats().entries == 2
+    assert data_cache.stats().nbytes == 1600
+
+    data_cache.put(("r", "d", None), 1, _table(1000))
+    assert data_cache.get(("r", "d", None), 1) is None
+    assert data_cache.stats().nbytes == 1600
+
+
+def test_data_cache_context_restores_previous_setting() -> None:
+    with data_cache.enabled(max_bytes=1_000):
+        data_cache.put(("r", "x", None), 1, _table(1))
+        with data_cache.enabled(max_bytes=10_000):
+            assert data_cache.stats().entries == 0
+        assert data_cache.is_enabled()
+    assert not data_cache.is_enabled()
+
+    with pytest.raises(ValueError, match="budget"):
+        data_cache.enable(max_bytes=0)
@@ -0,0 +1,173 @@
+"""Unit tests for the local disk cache of remote files, with the in-memory filesystem standing in for GCS."""
+
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pyarrow
+import pytest
+
+from ssb_timeseries.io import disk_cache
+from ssb_timeseries.io import fs
+
+# mypy: ignore-errors
+
+
+@pytest.fixture
+def remote():
+    root = f"memory://test-{uuid.uuid4().hex[:8]}"
+    yield root
+    fs.rmtree(root)
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    disk_cache.reset_stats()
+    with disk_cache.enabled(tmp_path / "cache", max_bytes=10_000):
+        yield tmp_path / "cache"
+    disk_cache.reset_stats()
+
+
+def _copies(directory: Path) -> list[str]:
+    return sorted(
+        p.name for p in directory.iterdir() if not p.name.endswith((".lock", ".part"))
+    )
+
+
+def test_disk_cache_is_off_by_default(remote) -> None:
+    fs.write_json(f"{remote}/x.json", {"x": 1})
+
+    assert not disk_cache.is_enabled()
+    assert fs.read_json(f"{remote}/x.json") == {"x": 1}
+    assert disk_cache.stats() == (0, 0, 0, 0)
+
+
+def test_remote_json_is_read_from_a_local_copy(remote, cache) -> None:
+    path = f"{remote}/x.json"
+    fs.write_json(path, {"x": 1})
+
+    assert fs.read_json(path) == {"x": 1}
+    assert fs.read_json(path) == {"x": 1}
+    assert disk_cache.stats()[:3] == (1, 1, 1)
+    assert [Path(c).suffix for c in _copies(cache)] == [".json"]
+
+
+def test_changed_remote_file_is_downloaded_again(remote, cache) -> None:
+    path = f"{remote}/x.json"
+    fs.write_json(path, {"x": 1})
+    fs.read_json(path)
+    fs.write_json(path, {"x": 12})
+
+    assert fs.read_json(path) == {"x": 12}
+    assert disk_cache.stats()[:3] == (0, 2, 1)
+
+
+def test_remote_parquet_is_read_from_a_local_copy(remote, cache) -> None:
+    path = f"{remote}/x.parquet"
+    fs.write_parquet(path=path, data=pyarrow.table({"x": list(range(100))}))
+
+    assert fs.parquet_file(path).metadata.num_rows == 100
+    assert fs.read_parquet(path).shape == (100, 1)
+    assert fs.parquet_file(path, memory_map=False).read().num_rows == 100
+    assert disk_cache.stats()[:3] == (2, 1, 1)
+
+
+def test_local_files_are_not_cached(tmp_path: Path, cache) -> None:
+    path = tmp_path / "x.json"
+    fs.write_json(path, {"x": 1})
+
+    assert fs.read_json(path) == {"x": 1}
+    assert disk_cache.stats() == (0, 0, 0, 0)
+
+
+def test_disk_cache_evicts_least_recently_used_copies_within_budget(
+    remote, cache
+) -> None:
+    # 4000 bytes each, for a budget of 10 000 bytes
+    content = {"x": "-" * 3990}
+    for name in ["a", "b", "c"]:
+        fs.write_json(f"{remote}/{name}.json", content)
+    fs.read_json(f"{remote}/a.json")
+    fs.read_json(f"{remote}/b.json")
+    # make a the most recently used copy, regardless of the timestamp resolution
+    for copy in _copies(cache):
+        os.utime(cache / copy, (1, 1))
+    fs.read_json(f"{remote}/a.json")
+    fs.read_json(f"{remote}/c.json")
+    disk_cache.reset_stats()
+
+    fs.read_json(f"{remote}/a.json")
+    fs.read_json(f"{remote}/c.json")
+    fs.read_json(f"{remote}/b.json")
+    assert disk_cache.stats()[:2] == (2, 1)
+    assert disk_cache.stats().nbytes <= 10_000
+
+
+def test_files_larger_than_the_budget_are_read_from_the_remote(remote, cache) -> None:
+    path = f"{remote}/x.json"
+    fs.write_json(path, {"x": "-" * 20_000})
+
+    assert len(fs.read_json(path)["x"]) == 20_000
+    assert disk_cache.stats() == (0, 0, 0, 0)
+
+
+def test_copy_with_unexpected_size_is_not_kept(cache) -> None:
+    def download(target: str) -> None:
+        Path(target).write_bytes(b"truncated")
+
+    assert disk_cache.local_copy("memory://x", ("generation", 100), download) is None
+    assert _copies(cache) == []
+    assert not [p for p in os.listdir(cache) if p.endswith(".part")]
+
+
+def test_concurrent_reads_download_a_file_once(remote, cache) -> None:
+    path = f"{remote}/x.parquet"
+    fs.write_parquet(path=path, data=pyarrow.table({"x": list(range(100))}))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tables = list(executor.map(lambda _: fs.read_parquet(path), range(16)))
+
+    assert all(t.shape == (100, 1) for t in tables)
+    assert disk_cache.stats()[:3] == (15, 1, 1)
+
+
+def test_lock_files_do_not_grow_with_the_number_of_files(
+    remote, cache, monkeypatch
+) -> None:
+    monkeypatch.setattr(disk_cache, "_LOCK_STRIPES", 4)
+    for n in range(20):
+        fs.write_json(f"{remote}/{n}.json", {"x": n})
+        assert fs.read_json(f"{remote}/{n}.json") == {"x": n}
+
+    locks = [p for p in os.listdir(cache) if p.endswith(".lock")]
+    # the download stripes and the directory lock
+    assert len(locks) <= 4 + 1
+    assert disk_cache.stats()[:3] == (0, 20, 20)
+
+
+def test_disk_cache_is_kept_between_sessions(remote, cache) -> None:
+    path = f"{remote}/x.json"
+    fs.write_json(path, {"x": 1})
+    fs.read_json(path)
+    disk_cache.disable()
+    disk_cache.enable(cache, max_bytes=10_000)
+    disk_cache.reset_stats()
+
+    assert fs.read_json(path) == {"x": 1}
+    assert disk_cache.stats()[:3] == (1, 0, 1)
+
+    disk_cache.clear()
+    assert disk_cache.stats().entries == 0
+
+
+def test_disk_cache_context_restores_previous_setting(tmp_path: Path) -> None:
+    with disk_cache.enabled(tmp_path / "a", max_bytes=1_000):
+        with disk_cache.enabled(tmp_path / "b"):
+            assert disk_cache._directory == str(tmp_path / "b")
+        assert disk_cache._directory == str(tmp_path / "a")
+        assert disk_cache._max_bytes == 1_000
+    assert not disk_cache.is_enabled()
+
+    with pytest.raises(ValueError, match="positive"):
+        disk_cache.enable(tmp_path, max_bytes=0)
@@ -0,0 +1,217 @@
+"""Unit tests for the DuckDB data and metadata handlers."""
+
+from pathlib import Path
+
+import pytest
+
+from ssb_timeseries.dataset import Dataset
+from ssb_timeseries.dates import date_utc
+from ssb_timeseries.dates import datelike_to_utc
+from ssb_timeseries.intervals import Interval
+from ssb_timeseries.io import duckdb_io as io
+from ssb_timeseries.io import json_metadata
+from ssb_timeseries.io import pyarrow_simple
+from ssb_timeseries.sample_data import create_df
+
+# mypy: ignore-errors
+
+
+def _repository(root: Path) -> dict:
+    return {
+        "name": "duck",
+        "directory": {"options": {"path": str(root)}},
+        "catalog": {"options": {"path": str(root)}},
+    }
+
+
+def _handlers(
+    dataset: Dataset, root: Path
+) -> tuple[io.DuckDbDataIO, pyarrow_simple.FileSystem]:
+    """Return a DuckDB and a simple handler for the dataset, in separate repositories."""
+    return tuple(
+        handler(
+            repository=_repository(root / name),
+            set_name=dataset.name,
+            set_type=dataset.data_type,
+            as_of_utc=dataset.as_of_utc,
+        )
+        for name, handler in [
+            ("duckdb", io.DuckDbDataIO),
+            ("simple", pyarrow_simple.FileSystem),
+        ]
+    )
+
+
+def test_duckdb_handler_reads_back_what_the_simple_handler_does(
+    one_new_set_for_each_data_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    data = datelike_to_utc(dataset.data)
+    duck, simple = _handlers(dataset, tmp_path)
+    assert not duck.exists
+    duck.write(data=data, tags=dataset.tags)
+    simple.write(data=data, tags=dataset.tags)
+
+    assert duck.exists
+    assert (tmp_path / "duckdb" / io.DATABASE_FILE).exists()
+    assert duck.read().to_pydict() == simple.read().to_pydict()
+    assert duck.read().schema.field(dataset.datetime_columns[0]).type == io._TIMESTAMP
+    assert duck.series() == simple.series()
+    assert duck.versions() == simple.versions(pattern=dataset.data_type.versioning)
+
+
+def test_read_pushes_down_interval_and_columns(
+    one_new_set_for_each_data_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    data = datelike_to_utc(dataset.data)
+    duck, simple = _handlers(dataset, tmp_path)
+    duck.write(data=data, tags=dataset.tags)
+    simple.write(data=data, tags=dataset.tags)
+    interval = Interval(start=date_utc("2022-03-15"), stop=date_utc("2022-06-15"))
+    selected = sorted(dataset.series)[:2]
+
+    result = duck.read(interval=interval, columns=selected)
+
+    assert result.column_names == [*dataset.datetime_columns, *selected]
+    assert (
+        result.to_pydict()
+        == simple.read(interval=interval, columns=selected).to_pydict()
+    )
+
+
+def test_writes_to_unversioned_sets_are_merged_like_the_simple_handler(
+    one_new_set_for_each_unversioned_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_unversioned_type
+    series = sorted(dataset.series)
+    data = datelike_to_utc(dataset.data)
+    new_data = create_df(
+        [*series[1:], "new_series"],
+        start_date="2022-10-01",
+        end_date="2023-03-31",
+        freq="MS",
+        temporality=dataset.data_type.temporality.name,
+    )
+    new_data = datelike_to_utc(new_data)
+    duck, simple = _handlers(dataset, tmp_path)
+    for handler in (duck, simple):
+        handler.write(data=data, tags=dataset.tags)
+        handler.write(data=new_data, tags=dataset.tags)
+
+    merged = duck.read().to_pydict()
+    # the simple handler only stores the series in the tags
+    added = merged.pop("new_series")
+    assert "new_series" in duck.series()
+    assert added == [None] * 9 + new_data["new_series"].to_list()
+    assert merged == simple.read().to_pydict()
+
+
+def test_versions_are_stored_as_rows_and_read_in_one_query(
+    new_dataset_as_of_at: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = new_dataset_as_of_at
+    data = datelike_to_utc(dataset.data)
+    duck, simple = _handlers(dataset, tmp_path)
+    as_of_dates = [date_utc(d) for d in ("2024-01-01", "2024-02-01", "2024-03-01")]
+    for handler in (duck, simple):
+        for as_of in as_of_dates:
+            handler.as_of_utc = as_of
+            handler.write(data=data, tags=dataset.tags)
+    # rewriting a version replaces its rows
+    duck.write(data=data, tags=dataset.tags)
+
+    assert duck.versions() == as_of_dates
+    stacked = duck.read_versions(from_=as_of_dates[1])
+    assert stacked.to_pydict() == simple.read_versions(from_=as_of_dates[1]).to_pydict()
+    assert duck.read().num_rows == len(dataset.data)
+
+
+def test_read_versions_requires_as_of_versioning(
+    new_dataset_none_at: Dataset,
+    tmp_path: Path,
+) -> None:
+    duck, _ = _handlers(new_dataset_none_at, tmp_path)
+    with pytest.raises(ValueError, match="AS_OF"):
+        duck.read_versions()
+
+
+def test_metadata_is_written_read_and_searched_by_tags(
+    one_new_set_for_each_data_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    meta = io.DuckDbMetaIO(repository=_repository(tmp_path), set_name=dataset.name)
+    assert not meta.exists
+    assert meta.read() == {"name": dataset.name}
+
+    meta.write(tags=dataset.tags, set_name=dataset.name)
+    meta.write(tags={"name": "other_set", "series": {}}, set_name="other_set")
+
+    assert meta.exists
+    assert meta.read()["series"].keys() == dataset.tags["series"].keys()
+    assert [r["object_name"] for r in meta.search()] == sorted(
+        [dataset.name, "other_set"]
+    )
+    assert [r["object_name"] for r in meta.search(equals="other_set")] == ["other_set"]
+    assert [r["object_name"] for r in meta.search(contains="other")] == ["other_set"]
+
+    first = next(iter(dataset.tags["series"]))
+    tags = {
+        k: v
+        for k, v in dataset.tags["series"][first].items()
+        if isinstance(v, str) and k not in {"name", "dataset"}
+    }
+    found = meta.search(tags=tags, datasets=False, series=True)
+    assert first in [r["object_name"] for r in found]
+    assert all(r["parent"] == dataset.name for r in found)
+    assert all(all(r["object_tags"][k] == v for k, v in tags.items()) for r in found)
+    assert meta.search(tags={"no_such_attribute": "x"}, series=True) == []
+
+
+def _tag_sets() -> dict[str, dict]:
+    return {
+        name: {
+            "name": name,
+            **({"owner": owner} if owner != "missing" else {}),
+            "series": {
+                f"{name}_s{i}": {"name": f"{name}_s{i}", "unit": unit}
+                for i, unit in enumerate(["NOK", None, "missing"])
+                if unit != "missing"
+            }
+            | {f"{name}_untagged": {"name": f"{name}_untagged"}},
+        }
+        for name, owner in [("a", "x"), ("b", None), ("c", "missing")]
+    }
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {"owner": None},
+        {"owner": [None, "x"]},
+        {"unit": None},
+        {"unit": None, "name": "b_untagged"},
+        [{"owner": None}, {"unit": "NOK"}],
+        {"owner": "x"},
+        {"unit": []},
+    ],
+)
+def test_tag_search_matches_the_json_handler(tmp_path: Path, criteria) -> None:
+    duck = io.DuckDbMetaIO(repository=_repository(tmp_path / "duckdb"))
+    catalog = json_metadata.JsonMetaIO(repository=_repository(tmp_path / "json"))
+    for name, tags in _tag_sets().items():
+        duck.write(tags=tags, set_name=name)
+        catalog.write(tags=tags, set_name=name)
+
+    def found(handler) -> list[tuple]:
+        return sorted(
+            (r["object_type"], r["object_name"])
+            for r in handler.search(tags=criteria, datasets=True, series=True)
+        )
+
+    assert found(duck) == found(catalog)
@@ -1,12 +1,28 @@
 """Integration tests for the high-level I/O facade in `io/__init__.py`."""
 
+import asyncio
 import logging
+import threading
+import time
+import uuid
+from functools import partial
 
 # from pathlib import Path
+import pytest
 from pytest import LogCaptureFixture
 
+import ssb_timeseries
 from ssb_timeseries import io
 from ssb_timeseries.dataset import Dataset
+from ssb_timeseries.dates import date_utc
+from ssb_timeseries.dates import datelike_to_utc
+from ssb_timeseries.intervals import Interval
+from ssb_timeseries.io import data_cache
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import json_metadata
+from ssb_timeseries.io import pyarrow_hive
+from ssb_timeseries.io import pyarrow_long
+from ssb_timeseries.io import pyarrow_simple
 from ssb_timeseries.types import SeriesType
 
 # from ssb_timeseries.dates import datelike_to_utc
@@ -195,3 +211,536 @@ def test_search_for_dataset_in_multiple_repos_returns_list_with_multiple_items(
     test_logger.debug(f"search for {set_name} returned: {datasets_found!s}")
 
     assert isinstance(datasets_found, list) and len(datasets_found) == 2
+
+
+def test_find_in_multiple_repos_returns_tags_in_repository_order(
+    conftest,
+    xyz_at,
+):
+    from ssb_timeseries.config import Config
+
+    set_name = conftest.function_name_hex()
+    for repository in ["test_2", "test_1"]:
+        io.save(
+            Dataset(
+                name=set_name,
+                data_type=SeriesType.simple(),
+                load_data=False,
+                data=xyz_at,
+                repository=repository,
+            )
+        )
+    expected = [
+        name
+        for name, repo in Config.active().repositories.items()
+        if name in {"test_1", "test_2"} and "catalog" in repo
+    ]
+
+    found = io.find(set_name=set_name)
+
+    assert [tags["repository"] for tags in found] == expected
+    assert all(tags["name"] == set_name for tags in found)
+
+
+def test_data_io_handler_instances_are_reused_for_same_dataset(
+    existing_estimate_set: Dataset,
+) -> None:
+    first = io.DataIO(existing_estimate_set).dh
+    second = io.DataIO(existing_estimate_set).dh
+    assert first is second
+
+
+def test_data_io_handler_instances_differ_by_version(
+    existing_estimate_set: Dataset,
+) -> None:
+    x = existing_estimate_set
+    first = io.DataIO(x).dh
+    x.as_of_utc = date_utc("2023-01-01")
+    second = io.DataIO(x).dh
+    assert first is not second
+    assert first.fullpath != second.fullpath
+
+
+def test_handler_class_is_imported_once(
+    existing_estimate_set: Dataset,
+    monkeypatch,
+) -> None:
+    io._HANDLERS.clear()
+    assert io.DataIO(existing_estimate_set).dh
+    imports = []
+    original = io.importlib.import_module
+    monkeypatch.setattr(
+        io.importlib,
+        "import_module",
+        lambda name: imports.append(name) or original(name),
+    )
+    io._HANDLERS.clear()
+    assert io.DataIO(existing_estimate_set).dh.exists
+    assert io.MetaIO(existing_estimate_set).read()
+    assert "ssb_timeseries.io.pyarrow_simple" not in imports
+
+
+def test_handler_cache_is_bounded() -> None:
+    cache = io._HandlerCache(maxsize=2)
+    for n in range(3):
+        cache.put((n,), object())
+    assert len(cache) == 2
+    assert cache.get((0,)) is None
+    assert cache.get((2,)) is not None
+
+
+def test_read_data_with_interval_returns_subset(
+    existing_simple_set: Dataset,
+) -> None:
+    everything = io.read_data(
+        repository=existing_simple_set.repository,
+        set_name=existing_simple_set.name,
+    )
+    dates = everything["valid_at"]
+    interval = Interval(start=dates[0].as_py(), stop=dates[2].as_py())
+    within = io.read_data(
+        repository=existing_simple_set.repository,
+        set_name=existing_simple_set.name,
+        interval=interval,
+    )
+    assert within.num_rows == 3
+    assert within["valid_at"].to_pylist() == dates[:3].to_pylist()
+
+
+def test_read_data_with_tags_reads_only_matching_series(
+    existing_small_set: Dataset,
+) -> None:
+    projected = io.read_data(
+        repository=existing_small_set.repository,
+        set_name=existing_small_set.name,
+        as_of_tz=existing_small_set.as_of_utc,
+        tags={"A": "a2"},
+    )
+    assert projected.column_names == ["valid_at", "a2_b_c"]
+
+
+def test_select_series_combines_names_and_tag_criteria_by_or() -> None:
+    stored = {
+        "series": {
+            "x": {"A": "a"},
+            "y": {"A": "b"},
+            "z": {"A": "c"},
+        }
+    }
+    assert io.select_series(stored) is None
+    assert io.select_series(stored, series="x") == ["x"]
+    assert io.select_series(stored, series=["x"], tags=[{"A": "b"}, {"A": "c"}]) == [
+        "x",
+        "y",
+        "z",
+    ]
+    assert io.select_series(stored, series=["y"], tags={"A": "b"}) == ["y"]
+
+
+@pytest.mark.parametrize(
+    "handler",
+    [
+        pyarrow_simple.FileSystem,
+        pyarrow_hive.HiveFileSystem,
+        pyarrow_long.LongFileSystem,
+    ],
+)
+def test_handlers_read_and_write_memory_repositories(
+    one_new_set_for_each_data_type: Dataset,
+    tmp_path,
+    handler,
+):
+    dataset = one_new_set_for_each_data_type
+    data = datelike_to_utc(dataset.data)
+    memory_root = f"memory://test-{uuid.uuid4().hex[:8]}"
+    results = []
+    for root in (memory_root, str(tmp_path)):
+        repository = {
+            "name": "test",
+            "directory": {"options": {"path": f"{root}/data"}},
+            "catalog": {"options": {"path": f"{root}/metadata"}},
+        }
+        data_io = handler(
+            repository=repository,
+            set_name=dataset.name,
+            set_type=dataset.data_type,
+            as_of_utc=dataset.as_of_utc,
+        )
+        data_io.write(data=data, tags=dataset.tags)
+        meta_io = json_metadata.JsonMetaIO(repository=repository)
+        meta_io.write(tags=dataset.tags, set_name=dataset.name)
+        results.append(
+            (
+                data_io.exists,
+                data_io.read().to_pydict(),
+                [r["object_name"] for r in meta_io.search(series=True)],
+            )
+        )
+
+    assert results[0] == results[1]
+    assert results[0][0]
+
+
+def test_aread_many_opens_datasets_concurrently_in_name_order(
+    existing_estimate_set: Dataset,
+    existing_simple_set: Dataset,
+) -> None:
+    names = [existing_simple_set.name, existing_estimate_set.name]
+
+    found = asyncio.run(io.aread_many(names, max_concurrency=2))
+
+    assert list(found) == names
+    assert found[existing_simple_set.name].data.shape == existing_simple_set.data.shape
+    latest = Dataset(existing_estimate_set.name)
+    assert found[existing_estimate_set.name].as_of_utc == latest.as_of_utc
+
+
+def test_asearch_returns_the_same_as_search(conftest, xyz_at) -> None:
+    set_name = conftest.function_name_hex()
+    for repository in ["test_1", "test_2"]:
+        io.save(
+            Dataset(
+                name=set_name,
+                data_type=SeriesType.simple(),
+                data=xyz_at,
+                repository=repository,
+            )
+        )
+
+    assert asyncio.run(io.asearch(equals=set_name)) == io.search(equals=set_name)
+    assert asyncio.run(io.afind(set_name=set_name)) == io.find(set_name=set_name)
+
+
+def test_gather_limited_bounds_concurrency_and_keeps_order() -> None:
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def work(i):
+        with lock:
+            running.append(i)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(i)
+        return i
+
+    async def main():
+        return await io.gather_limited(
+            (lambda i=i: io.run_async(work, i) for i in range(12)),
+            max_concurrency=3,
+        )
+
+    assert asyncio.run(main()) == list(range(12))
+    assert max(peak) <= 3
+
+
+def test_gather_limited_reads_max_async_workers_when_called(monkeypatch) -> None:
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    monkeypatch.setattr(io, "MAX_ASYNC_WORKERS", 2)
+    asyncio.run(io.gather_limited(call for _ in range(8)))
+    assert peak == 2
+
+
+def test_gather_limited_cancels_remaining_calls_on_error() -> None:
+    started = []
+
+    async def call(i):
+        started.append(i)
+        if i == 0:
+            raise ValueError("boom")
+        await asyncio.sleep(10)
+
+    async def main():
+        return await io.gather_limited(
+            (lambda i=i: call(i) for i in range(10)), max_concurrency=2
+        )
+
+    begin = time.monotonic()
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(main())
+    assert time.monotonic() - begin < 5
+    assert len(started) <= 3
+    with pytest.raises(ValueError):
+        asyncio.run(io.gather_limited([], max_concurrency=0))
+
+
+def test_read_many_returns_data_and_metadata_in_name_order(
+    existing_estimate_set: Dataset,
+    existing_simple_set: Dataset,
+) -> None:
+    names = [existing_simple_set.name, existing_estimate_set.name]
+
+    found = io.read_many(names, max_workers=2)
+
+    assert list(found) == names
+    simple = found[existing_simple_set.name]
+    assert simple.repository == existing_simple_set.repository
+    assert simple.as_of_utc is None
+    assert simple.tags["series"].keys() == existing_simple_set.tags["series"].keys()
+    assert simple.data.shape == existing_simple_set.data.shape
+    estimate = found[existing_estimate_set.name]
+    assert estimate.as_of_utc == Dataset(existing_estimate_set.name).as_of_utc
+
+
+def test_read_many_reads_selected_series_and_version(
+    existing_estimate_set: Dataset,
+    existing_simple_set: Dataset,
+) -> None:
+    names = [existing_simple_set.name, existing_estimate_set.name]
+    series = existing_estimate_set.series[:2]
+
+    found = io.read_many(names, as_of_tz=existing_estimate_set.as_of_utc, series=series)
+
+    assert (
+        found[existing_estimate_set.name].as_of_utc == existing_estimate_set.as_of_utc
+    )
+    for name in names:
+        assert found[name].data.shape[1] == 1 + len(series)
+
+
+def test_read_many_combines_datasets_into_one_table(
+    existing_estimate_set: Dataset,
+    existing_simple_set: Dataset,
+) -> None:
+    names = [existing_simple_set.name, existing_estimate_set.name]
+
+    table = io.read_many(names, combine=True)
+
+    assert table.column_names[0] == "dataset"
+    assert table.num_rows == sum(len(Dataset(n).data) for n in names)
+    assert set(table["dataset"].to_pylist()) == set(names)
+
+
+def test_repeated_reads_of_latest_versions_reuse_handlers(
+    existing_estimate_set: Dataset,
+    monkeypatch,
+) -> None:
+    x = existing_estimate_set
+    # every call is at a different time
+    ticks = iter(range(1_000))
+    monkeypatch.setattr(
+        io, "now_utc", lambda: date_utc(f"2024-01-01T00:{next(ticks):02d}:00+00:00")
+    )
+    io.read_many([x.name])
+    io.read_versions(x.repository, x.name)
+    cached = len(io._HANDLERS)
+
+    for _ in range(3):
+        io.read_many([x.name])
+        io.read_versions(x.repository, x.name)
+    assert len(io._HANDLERS) == cached
+
+
+def test_read_many_raises_for_missing_datasets(existing_simple_set: Dataset) -> None:
+    with pytest.raises(LookupError, match="no-such-set"):
+        io.read_many([existing_simple_set.name, "no-such-set"])
+
+
+@pytest.fixture
+def cached_reads(monkeypatch: pytest.MonkeyPatch):
+    """Enable the data cache, and count the data files read from storage."""
+    reads = []
+    parquet_file = fs.parquet_file
+
+    def counted(path, *args, **kwargs):
+        reads.append(path)
+        return parquet_file(path, *args, **kwargs)
+
+    monkeypatch.setattr(fs, "parquet_file", counted)
+    with data_cache.enabled():
+        yield reads
+
+
+def test_data_cache_serves_reopened_datasets_from_memory(
+    conftest, xyz_at, cached_reads
+) -> None:
+    x = Dataset(
+        name=conftest.function_name_hex(), data_type=SeriesType.simple(), data=xyz_at
+    )
+    x.save()
+    cached_reads.clear()
+
+    first = Dataset(x.name)
+    second = Dataset(x.name)
+    selected = Dataset(x.name, series=["x"])
+
+    assert cached_reads == []
+    assert first.data is second.data
+    assert data_cache.stats().entries == 1
+    assert selected.data.column_names == ["valid_at", "x"]
+    assert selected.data["x"].equals(first.data["x"])
+    assert io.read_data("test_1", x.name).equals(first.data)
+
+
+def test_data_cache_reads_datasets_changed_in_storage_again(
+    conftest, xyz_at, cached_reads
+) -> None:
+    x = Dataset(
+        name=conftest.function_name_hex(), data_type=SeriesType.simple(), data=xyz_at
+    )
+    x.save()
+    # written by another process: the cache is not refilled
+    handler = pyarrow_simple.FileSystem(
+        repository=io._repo_config("test_1"),
+        set_name=x.name,
+        set_type=SeriesType.simple(),
+    )
+    changed = xyz_at.astype({"x": float, "y": float, "z": float})
+    changed["x"] = changed["x"] * 2
+    handler.write(data=datelike_to_utc(changed), tags=x.tags)
+    cached_reads.clear()
+
+    reopened = Dataset(x.name)
+
+    assert cached_reads == [handler.fullpath]
+    assert reopened.data["x"].to_pylist() == [2 * v for v in xyz_at["x"]]
+
+
+def test_data_cache_selections_match_uncached_reads(
+    conftest, xyz_at, cached_reads
+) -> None:
+    x = Dataset(
+        name=conftest.function_name_hex(), data_type=SeriesType.simple(), data=xyz_at
+    )
+    x.save()
+    interval = Interval(start="2022-03-01", end="2022-06-01")
+
+    cached = io.read_data("test_1", x.name, series=["y", "z"], interval=interval)
+    with data_cache.enabled(max_bytes=1):
+        uncached = io.read_data("test_1", x.name, series=["y", "z"], interval=interval)
+
+    assert cached.equals(uncached)
+
+
+def test_prefetched_yields_in_order_with_bounded_read_ahead() -> None:
+    started = []
+
+    def call(i):
+        started.append(i)
+        return i
+
+    calls = [partial(call, i) for i in range(10)]
+    results = []
+    for result in io.prefetched(calls, prefetch=3):
+        # the calls for this result and at most three more have started
+        assert len(started) <= result + 1 + 3
+        results.append(result)
+    assert results == list(range(10))
+
+    assert list(io.prefetched(calls, prefetch=0)) == list(range(10))
+    with pytest.raises(ValueError, match="prefetch"):
+        next(io.prefetched(calls, prefetch=-1))
+
+
+def test_prefetched_raises_errors_when_due_and_cancels_on_close() -> None:
+    release = threading.Event()
+    started = []
+
+    def call(i):
+        started.append(i)
+        if i == 1:
+            raise OSError("unreadable")
+        release.wait(5)
+        return i
+
+    results = io.prefetched([partial(call, i) for i in range(3)], prefetch=1)
+    release.set()
+    assert next(results) == 0
+    with pytest.raises(OSError, match="unreadable"):
+        next(results)
+
+    release.clear()
+    results = io.prefetched([partial(call, i) for i in range(10, 20)], prefetch=1)
+    release.set()
+    assert next(results) == 10
+    results.close()
+    time.sleep(0.1)
+    assert max(started) <= 12
+
+
+def test_save_many_writes_the_same_as_saving_each_set(conftest, xyz_at) -> None:
+    datasets = [
+        Dataset(
+            name=f"{conftest.function_name_hex()}_{i}",
+            data_type=data_type,
+            as_of_tz=as_of,
+            data=xyz_at,
+            repository=repository,
+        )
+        for i, (data_type, as_of, repository) in enumerate(
+            [
+                (SeriesType.simple(), None, "test_1"),
+                (SeriesType.estimate(), date_utc("2022-01-01"), "test_1"),
+                (SeriesType.simple(), None, "test_2"),
+            ]
+        )
+    ]
+
+    result = io.save_many(datasets, max_workers=3)
+
+    assert result.saved == [ds.name for ds in datasets]
+    assert result.errors == {}
+    for ds in datasets:
+        stored = Dataset(ds.name, repository=ds.repository)
+        assert stored.as_of_utc == ds.as_of_utc
+        assert stored.series == ds.series
+        assert stored.data.shape == ds.data.shape
+        assert io.find(set_name=ds.name, repository=ds.repository)
+
+
+def test_save_many_reports_errors_without_stopping_other_writes(
+    conftest,
+    xyz_at,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    names = [f"{conftest.function_name_hex()}_{i}" for i in range(3)]
+    datasets = [
+        Dataset(name=n, data_type=SeriesType.simple(), data=xyz_at.copy())
+        for n in names
+    ]
+    write_table = fs.pq.write_table
+
+    def write_table_or_fail(table, where, **kwargs):
+        if names[1] in str(where):
+            raise OSError("disk full")
+        return write_table(table, where, **kwargs)
+
+    monkeypatch.setattr(fs.pq, "write_table", write_table_or_fail)
+    result = io.save_many(datasets)
+
+    assert result.saved == [names[0], names[2]]
+    assert list(result.errors) == [names[1]]
+    assert isinstance(result.errors[names[1]], OSError)
+    assert "disk full" in str(result.errors[names[1]])
+    assert names[1] in result.errors[names[1]].__notes__[0]
+    assert not io.find(set_name=names[1])
+    for name in result.saved:
+        assert Dataset(name).data.shape == xyz_at.shape
+
+
+def test_save_many_rejects_duplicate_names(conftest, xyz_at) -> None:
+    name = conftest.function_name_hex()
+    datasets = [
+        Dataset(name=name, data_type=SeriesType.simple(), data=xyz_at) for _ in range(2)
+    ]
+    with pytest.raises(ValueError, match=name):
+        io.save_many(datasets)
+
+
+def test_save_all_is_save_many(conftest, xyz_at) -> None:
+    x = Dataset(
+        name=conftest.function_name_hex(), data_type=SeriesType.simple(), data=xyz_at
+    )
+
+    assert ssb_timeseries.save_all([x]) == io.SaveResult([x.name], {})
+    assert Dataset(x.name).data.shape == xyz_at.shape
@@ -1,6 +1,7 @@
 """Unit tests for the `simple` I/O handler."""
 
 import logging
+import shutil
 import time
 from pathlib import Path
 
@@ -10,7 +11,10 @@ from pytest import LogCaptureFixture
 
 from ssb_timeseries.dataframes import is_empty
 from ssb_timeseries.dataset import Dataset
+from ssb_timeseries.dates import date_utc
 from ssb_timeseries.dates import now_utc
+from ssb_timeseries.intervals import Interval
+from ssb_timeseries.io import deltas
 from ssb_timeseries.io import fs
 from ssb_timeseries.io import pyarrow_hive as io
 from ssb_timeseries.io.pyarrow_hive import _parquet_schema
@@ -302,3 +306,317 @@ def test_read_non_existent_dataset_returns_empty_frame(
     read_data = io_handler.read()
     assert read_data.shape == (0, 0)
     assert is_empty(read_data)
+
+
+def test_read_with_interval_returns_only_rows_within_interval(
+    one_new_set_for_each_data_type: Dataset,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    io_handler = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=dataset.as_of_utc,
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    everything = io_handler.read()
+    first_date = everything.column(dataset.data_type.temporality.date_columns[0])
+    interval = Interval(start=first_date[5].as_py(), stop=first_date[7].as_py())
+
+    within = io_handler.read(interval=interval)
+
+    # consecutive periods: only the 6th, 7th and 8th overlap the interval
+    assert within.num_rows == 3
+    assert within.column_names == everything.column_names
+
+
+def test_read_with_columns_reads_only_selected_series_and_date_columns(
+    one_new_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_new_set_for_each_unversioned_type
+    io_handler = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=dataset.as_of_utc,
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    selected = dataset.series[:2]
+
+    projected = io_handler.read(columns=selected)
+
+    date_columns = dataset.data_type.temporality.date_columns
+    assert sorted(projected.column_names) == sorted(date_columns + selected)
+
+
+def test_append_mode_writes_deltas_that_are_read_and_compacted(
+    one_new_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_new_set_for_each_unversioned_type
+    repository = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    ).repository
+    directory = repository["directory"]
+    io_handler = io.HiveFileSystem(
+        repository={
+            **repository,
+            "directory": {
+                **directory,
+                "options": {**directory["options"], "write_mode": "append"},
+            },
+        },
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    new_data = create_df(
+        dataset.series,
+        start_date="2023-01-01",
+        end_date="2023-03-31",
+        freq="MS",
+        temporality=dataset.data_type.temporality.name,
+    )
+
+    io_handler.write(data=new_data, tags=dataset.tags)
+
+    assert len(deltas.delta_files(io_handler.directory)) == 1
+    assert io_handler._dataset().count_rows() == 12
+    merged = io_handler.read()
+    assert merged.num_rows == 15
+
+    io_handler.compact()
+
+    assert deltas.delta_files(io_handler.directory) == []
+    assert io_handler._dataset().count_rows() == 15
+    assert io_handler.read().equals(merged)
+
+
+def test_read_versions_filters_as_of_partitions(
+    new_dataset_as_of_at: Dataset,
+) -> None:
+    dataset = new_dataset_as_of_at
+    io_handler = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=date_utc("2024-01-01"),
+    )
+    as_of_dates = [date_utc(d) for d in ("2024-01-01", "2024-02-01", "2024-03-01")]
+    for as_of in as_of_dates:
+        io_handler.as_of_utc = as_of
+        io_handler.write(data=dataset.data, tags=dataset.tags)
+
+    stacked = io_handler.read_versions(from_=as_of_dates[0], to=as_of_dates[1])
+
+    assert stacked.column_names[0] == "as_of"
+    assert sorted(set(stacked["as_of"].to_pylist())) == as_of_dates[:2]
+    assert stacked.num_rows == 2 * len(dataset.data)
+    projected = io_handler.read_versions(columns=dataset.series[:1])
+    assert sorted(projected.column_names) == sorted(
+        ["as_of", "valid_at", dataset.series[0]]
+    )
+    assert projected.num_rows == 3 * len(dataset.data)
+
+
+def test_read_opens_only_the_partition_of_the_handler_version(
+    new_dataset_as_of_at: Dataset,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dataset = new_dataset_as_of_at
+    io_handler = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=date_utc("2024-01-01"),
+    )
+    as_of_dates = [date_utc(d) for d in ("2024-01-01", "2024-02-01", "2024-03-01")]
+    for as_of in as_of_dates:
+        io_handler.as_of_utc = as_of
+        io_handler.write(data=dataset.data, tags=dataset.tags)
+
+    opened = []
+    original = io.pa.dataset.dataset
+
+    def spy(source, **kwargs):
+        opened.append(source)
+        return original(source, **kwargs)
+
+    monkeypatch.setattr(io.pa.dataset, "dataset", spy)
+    io_handler.as_of_utc = as_of_dates[1]
+    table = io_handler.read()
+
+    assert opened == [io_handler._partition_directory()]
+    assert set(table["as_of"].to_pylist()) == {as_of_dates[1]}
+    assert table.num_rows == len(dataset.data)
+
+
+def test_partition_discovery_is_cached_until_a_write(
+    new_dataset_as_of_at: Dataset,
+) -> None:
+    dataset = new_dataset_as_of_at
+    io_handler = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=date_utc("2024-01-01"),
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+
+    discovered = io_handler._dataset(all_versions=True)
+    assert io_handler._dataset(all_versions=True) is discovered
+
+    io_handler.as_of_utc = date_utc("2024-02-01")
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    rediscovered = io_handler._dataset(all_versions=True)
+    assert rediscovered is not discovered
+    assert len(rediscovered.files) == 2
+
+
+def test_partition_discovery_sees_files_written_by_other_processes(
+    new_dataset_as_of_at: Dataset,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dataset = new_dataset_as_of_at
+    io_handler = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=date_utc("2024-01-01"),
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    discovered = io_handler._dataset(all_versions=True)
+    # as if written by another process, into an existing partition
+    partition = Path(io_handler._partition_directory())
+    shutil.copy(next(partition.glob("*.parquet")), partition / "part-1.parquet")
+
+    rediscovered = io_handler._dataset(all_versions=True)
+    assert rediscovered is not discovered
+    assert len(rediscovered.files) == 2
+
+    monkeypatch.setattr(io, "DISCOVERY_CACHE_SIZE", 1)
+    other = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=f"{dataset.name}_other",
+        set_type=dataset.data_type,
+        as_of_utc=date_utc("2024-01-01"),
+    )
+    other.write(data=dataset.data, tags=dataset.tags)
+    other._dataset(all_versions=True)
+    assert list(io._discovered) == [other.directory]
+
+
+def _handler_with_options(dataset: Dataset, **options) -> io.HiveFileSystem:
+    repository = io.HiveFileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=dataset.as_of_utc,
+    ).repository
+    directory = repository["directory"]
+    return io.HiveFileSystem(
+        repository={
+            **repository,
+            "directory": {
+                **directory,
+                "options": {**directory["options"], **options},
+            },
+        },
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=dataset.as_of_utc,
+    )
+
+
+def test_time_partitioning_rewrites_only_affected_partitions(
+    one_new_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_new_set_for_each_unversioned_type
+    io_handler = _handler_with_options(dataset, time_partitioning="month")
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+
+    files = sorted(fs.ls(io_handler.directory, pattern="*/*/*/*.parquet"))
+    assert len(files) == 12
+    assert Path(files[0]).parent.name.startswith("month=")
+    modified = {f: Path(f).stat().st_mtime_ns for f in files}
+    everything = io_handler.read()
+    assert everything.num_rows == 12
+    assert "year" not in everything.column_names
+    assert sorted(io_handler.series()) == sorted(dataset.series)
+
+    time.sleep(0.01)
+    update = create_df(
+        dataset.series,
+        start_date="2022-03-01",
+        end_date="2022-04-01",
+        freq="MS",
+        temporality=dataset.data_type.temporality.name,
+    )
+    io_handler.write(data=update, tags=dataset.tags)
+
+    changed = [f for f in files if Path(f).stat().st_mtime_ns != modified[f]]
+    assert sorted(Path(f).parent.name for f in changed) == ["month=3", "month=4"]
+    assert io_handler.read().num_rows == 12
+
+
+def test_time_partitioning_prunes_directories_outside_interval(
+    one_new_set_for_each_data_type: Dataset,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    io_handler = _handler_with_options(dataset, time_partitioning="month")
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    everything = io_handler.read()
+    first_date = everything.column(dataset.data_type.temporality.date_columns[0])
+    interval = Interval(start=first_date[5].as_py(), stop=first_date[7].as_py())
+
+    within = io_handler.read(interval=interval)
+    fragments = list(
+        io_handler._dataset().get_fragments(
+            filter=io_handler._time_partition_filter(interval)
+        )
+    )
+
+    assert within.num_rows == 3
+    assert within.column_names == everything.column_names
+    if dataset.data_type.temporality.name == "AT":
+        assert len(fragments) == 3
+    else:
+        assert len(fragments) == 8
+
+
+def test_time_partitioning_with_deltas_compacts_affected_partitions(
+    one_new_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_new_set_for_each_unversioned_type
+    io_handler = _handler_with_options(
+        dataset, time_partitioning="year", write_mode="append"
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    new_data = create_df(
+        dataset.series,
+        start_date="2023-01-01",
+        end_date="2023-03-31",
+        freq="MS",
+        temporality=dataset.data_type.temporality.name,
+    )
+    io_handler.write(data=new_data, tags=dataset.tags)
+    merged = io_handler.read()
+
+    io_handler.compact()
+
+    assert deltas.delta_files(io_handler.directory) == []
+    years = sorted(Path(p).name for p in fs.ls(io_handler._partition_directory()))
+    assert years == ["year=2022", "year=2023"]
+    assert io_handler.read().equals(merged)
+    assert merged.num_rows == 15
+
+
+def test_unknown_time_partitioning_raises_value_error(
+    one_new_set_for_each_unversioned_type: Dataset,
+) -> None:
+    io_handler = _handler_with_options(
+        one_new_set_for_each_unversioned_type, time_partitioning="week"
+    )
+    with pytest.raises(ValueError, match="time_partitioning"):
+        _ = io_handler.partitioning
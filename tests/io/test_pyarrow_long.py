@@ -0,0 +1,168 @@
+"""Unit tests for the `long` I/O handler."""
+
+from pathlib import Path
+
+import numpy as np
+import pyarrow
+import pyarrow.parquet
+import pytest
+
+from ssb_timeseries.dataset import Dataset
+from ssb_timeseries.dates import date_utc
+from ssb_timeseries.intervals import Interval
+from ssb_timeseries.io import deltas
+from ssb_timeseries.io import pyarrow_long as io
+from ssb_timeseries.io import pyarrow_simple
+from ssb_timeseries.sample_data import create_df
+
+# mypy: ignore-errors
+
+
+def _handlers(
+    dataset: Dataset, root: Path, **options
+) -> tuple[io.LongFileSystem, pyarrow_simple.FileSystem]:
+    """Return a long and a simple handler for the dataset, in separate repositories."""
+    return tuple(
+        handler(
+            repository={
+                "directory": {"options": {"path": str(root / name), **options}}
+            },
+            set_name=dataset.name,
+            set_type=dataset.data_type,
+            as_of_utc=dataset.as_of_utc,
+        )
+        for name, handler in [
+            ("long", io.LongFileSystem),
+            ("wide", pyarrow_simple.FileSystem),
+        ]
+    )
+
+
+def test_long_handler_reads_back_what_the_simple_handler_does(
+    one_new_set_for_each_data_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    long, wide = _handlers(dataset, tmp_path)
+    long.write(data=dataset.data, tags=dataset.tags)
+    wide.write(data=dataset.data, tags=dataset.tags)
+
+    stored = pyarrow.parquet.read_table(long.fullpath)
+    assert stored.column_names == [
+        io.SERIES_KEY,
+        *dataset.data_type.temporality.date_columns,
+        io.VALUE,
+    ]
+    assert stored.schema.field(io.SERIES_KEY).type == pyarrow.dictionary(
+        pyarrow.int32(), pyarrow.string()
+    )
+    assert long.read().equals(wide.read())
+    assert long.series() == sorted(dataset.series)
+    assert long.versions(pattern=dataset.data_type.versioning) == wide.versions(
+        pattern=dataset.data_type.versioning
+    )
+
+
+def test_sparse_data_stores_only_values_and_keeps_shape(
+    one_new_set_for_each_unversioned_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_unversioned_type
+    long, wide = _handlers(dataset, tmp_path)
+    data = dataset.data.copy()
+    series = sorted(dataset.series)
+    data.loc[:, series[1:]] = np.nan
+    data.loc[3, series[0]] = np.nan
+
+    long.write(data=data, tags=dataset.tags)
+    wide.write(data=data, tags=dataset.tags)
+
+    stored = pyarrow.parquet.read_table(long.fullpath)
+    # 11 values of the first series, one row to keep each of the other (empty) series
+    # and one row to keep the date where all series are missing
+    assert stored.num_rows == 11 + len(series) - 1 + 1
+    assert stored[io.VALUE].null_count == len(series)
+    assert long.read().equals(wide.read())
+
+
+def test_reading_selected_series_skips_row_groups_of_other_series(
+    one_new_set_for_each_data_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    long, wide = _handlers(dataset, tmp_path, row_group_size=12)
+    long.write(data=dataset.data, tags=dataset.tags)
+    wide.write(data=dataset.data, tags=dataset.tags)
+    selected = sorted(dataset.series)[:2]
+
+    metadata = pyarrow.parquet.read_metadata(long.fullpath)
+    row_groups = io.row_groups_with_series(metadata, selected)
+
+    assert metadata.num_row_groups == len(dataset.series)
+    assert row_groups == [0, 1]
+    assert long.read(columns=selected).equals(wide.read(columns=selected))
+
+
+def test_read_with_interval_returns_same_rows_as_simple_handler(
+    one_new_set_for_each_data_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    long, wide = _handlers(dataset, tmp_path, row_group_size=4)
+    long.write(data=dataset.data, tags=dataset.tags)
+    wide.write(data=dataset.data, tags=dataset.tags)
+    interval = Interval(start=date_utc("2022-03-15"), stop=date_utc("2022-06-15"))
+
+    assert long.read(interval=interval).equals(wide.read(interval=interval))
+
+
+def test_merge_and_append_modes_give_same_result_as_simple_handler(
+    one_new_set_for_each_unversioned_type: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = one_new_set_for_each_unversioned_type
+    new_data = create_df(
+        dataset.series,
+        start_date="2022-10-01",
+        end_date="2023-03-31",
+        freq="MS",
+        temporality=dataset.data_type.temporality.name,
+    )
+    for write_mode in ("merge", "append"):
+        long, wide = _handlers(dataset, tmp_path / write_mode, write_mode=write_mode)
+        for handler in (long, wide):
+            handler.write(data=dataset.data, tags=dataset.tags)
+            handler.write(data=new_data, tags=dataset.tags)
+
+        # merging deltas may change the nullability of the date columns, so compare values only
+        assert long.read().to_pydict() == wide.read().to_pydict()
+        long.compact()
+        assert deltas.delta_files(long.directory) == []
+        assert long.read().to_pydict() == wide.read().to_pydict()
+
+
+def test_read_versions_stacks_versions(
+    new_dataset_as_of_at: Dataset,
+    tmp_path: Path,
+) -> None:
+    dataset = new_dataset_as_of_at
+    long, wide = _handlers(dataset, tmp_path)
+    as_of_dates = [date_utc(d) for d in ("2024-01-01", "2024-02-01", "2024-03-01")]
+    for handler in (long, wide):
+        for as_of in as_of_dates:
+            handler.as_of_utc = as_of
+            handler.write(data=dataset.data, tags=dataset.tags)
+
+    stacked = long.read_versions(from_=as_of_dates[1])
+
+    assert stacked.equals(wide.read_versions(from_=as_of_dates[1]))
+    assert sorted(set(stacked["as_of"].to_pylist())) == as_of_dates[1:]
+
+
+def test_read_versions_requires_as_of_versioning(
+    new_dataset_none_at: Dataset,
+    tmp_path: Path,
+) -> None:
+    long, _ = _handlers(new_dataset_none_at, tmp_path)
+    with pytest.raises(ValueError, match="AS_OF"):
+        long.read_versions()
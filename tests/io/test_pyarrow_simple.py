@@ -1,16 +1,31 @@
 """Unit tests for the `simple` I/O handler."""
 
+import json
 import logging
+import multiprocessing
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pyarrow
+import pyarrow.parquet
 import pytest
 from pytest import LogCaptureFixture
 
 # from ssb_timeseries.io import json_metadata
+from ssb_timeseries.dataframes import merge_data
+from ssb_timeseries.dataframes import numeric_matrix
+from ssb_timeseries.dataframes import to_arrow
 from ssb_timeseries.dataset import Dataset
+from ssb_timeseries.dates import date_utc
 from ssb_timeseries.dates import now_utc
+from ssb_timeseries.intervals import Interval
+from ssb_timeseries.io import deltas
+from ssb_timeseries.io import fs
+from ssb_timeseries.io import json_helpers
+from ssb_timeseries.io import manifest
 from ssb_timeseries.io import pyarrow_simple as io
 from ssb_timeseries.io.fs import file_count
 from ssb_timeseries.sample_data import create_df
@@ -200,3 +215,595 @@ def test_simple_write_with_none_data_raises_type_error(
 
     with pytest.raises(TypeError):
         io_handler.write(data=None, tags=dataset.tags)
+
+
+def _rows_within(table: pyarrow.Table, data_type: SeriesType, interval) -> int:
+    """Count rows within an interval the straightforward way, for comparison."""
+    start = date_utc(interval.start)
+    stop = date_utc(interval.stop)
+    if "valid_at" in table.column_names:
+        return sum(start <= d <= stop for d in table["valid_at"].to_pylist())
+    return sum(
+        f <= stop and t > start
+        for f, t in zip(
+            table["valid_from"].to_pylist(), table["valid_to"].to_pylist(), strict=True
+        )
+    )
+
+
+def test_read_with_interval_returns_only_rows_within_interval(
+    one_new_set_for_each_data_type: Dataset,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=dataset.as_of_utc,
+    )
+    io_handler.row_group_size = 3
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    everything = io_handler.read()
+    first_date = everything.column(dataset.data_type.temporality.date_columns[0])
+    interval = Interval(start=first_date[5].as_py(), stop=first_date[7].as_py())
+
+    within = io_handler.read(interval=interval)
+
+    assert within.num_rows == _rows_within(everything, dataset.data_type, interval)
+    assert 0 < within.num_rows < everything.num_rows
+    assert within.column_names == everything.column_names
+
+
+def test_read_with_interval_skips_row_groups_outside_interval(
+    new_dataset_none_at: Dataset,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dataset = new_dataset_none_at
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    )
+    io_handler.row_group_size = 2
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    metadata = pyarrow.parquet.read_metadata(io_handler.fullpath)
+    assert metadata.num_row_groups == 6
+
+    row_groups_read = []
+    read_row_groups = pyarrow.parquet.ParquetFile.read_row_groups
+
+    def spy(self, row_groups, *args, **kwargs):
+        row_groups_read.extend(row_groups)
+        return read_row_groups(self, row_groups, *args, **kwargs)
+
+    monkeypatch.setattr(pyarrow.parquet.ParquetFile, "read_row_groups", spy)
+    last_date = io_handler.read()["valid_at"][-1].as_py()
+    within = io_handler.read(interval=Interval(start=last_date))
+
+    assert row_groups_read == [5]
+    assert within.num_rows == 1
+
+
+def test_read_with_interval_outside_data_returns_no_rows(
+    new_dataset_none_at: Dataset,
+) -> None:
+    dataset = new_dataset_none_at
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    within = io_handler.read(interval=Interval(start=date_utc("2030-01-01")))
+    assert within.num_rows == 0
+    assert "valid_at" in within.column_names
+
+
+def test_read_with_columns_reads_only_selected_series_and_date_columns(
+    one_new_set_for_each_data_type: Dataset,
+) -> None:
+    dataset = one_new_set_for_each_data_type
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=dataset.as_of_utc,
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    selected = dataset.series[:2]
+
+    projected = io_handler.read(columns=[*selected, "not_a_series"])
+
+    date_columns = dataset.data_type.temporality.date_columns
+    assert sorted(projected.column_names) == sorted(date_columns + selected)
+    assert projected.num_rows == io_handler.read().num_rows
+
+
+def test_series_are_listed_from_file_schema(
+    existing_simple_set: Dataset,
+) -> None:
+    io_handler = io.FileSystem(
+        repository=existing_simple_set.repository,
+        set_name=existing_simple_set.name,
+        set_type=existing_simple_set.data_type,
+    )
+    assert sorted(io_handler.series()) == existing_simple_set.series
+
+
+def _append_mode_handler(dataset: Dataset, **options) -> io.FileSystem:
+    """Return a handler for the dataset with the repository configured for append writes."""
+    repository = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    ).repository
+    directory = repository["directory"]
+    handler_options = {**directory["options"], "write_mode": "append", **options}
+    return io.FileSystem(
+        repository={
+            **repository,
+            "directory": {**directory, "options": handler_options},
+        },
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    )
+
+
+def _overlapping_update(dataset: Dataset):
+    """Twelve months of new data overlapping the last six months of the existing data."""
+    return create_df(
+        dataset.series,
+        start_date="2022-07-01",
+        end_date="2023-06-30",
+        freq="MS",
+        temporality=dataset.data_type.temporality,
+    )
+
+
+def test_append_mode_writes_delta_and_read_merges_it(
+    one_existing_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_existing_set_for_each_unversioned_type
+    io_handler = _append_mode_handler(dataset)
+    base_rows = pyarrow.parquet.read_metadata(io_handler.fullpath).num_rows
+    before = io_handler.read()
+    update = _overlapping_update(dataset)
+
+    io_handler.write(data=update, tags=dataset.tags)
+
+    assert len(deltas.delta_files(io_handler.directory)) == 1
+    assert pyarrow.parquet.read_metadata(io_handler.fullpath).num_rows == base_rows
+    expected = merge_data(
+        old=before,
+        new=update,
+        date_cols=dataset.data_type.date_columns,
+        temporality=dataset.data_type.temporality,
+    )
+    after = io_handler.read()
+    assert len(after) == 18
+    assert after.equals(to_arrow(expected).select(after.column_names))
+
+
+def test_compact_folds_deltas_into_base_file(
+    one_existing_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_existing_set_for_each_unversioned_type
+    io_handler = _append_mode_handler(dataset)
+    io_handler.write(data=_overlapping_update(dataset), tags=dataset.tags)
+    merged = io_handler.read()
+
+    io_handler.compact()
+
+    assert deltas.delta_files(io_handler.directory) == []
+    assert pyarrow.parquet.read_metadata(io_handler.fullpath).num_rows == 18
+    assert io_handler.read().equals(merged)
+    assert io_handler.series() == dataset.series
+
+
+def test_compact_keeps_tags_of_series_added_by_deltas(
+    one_existing_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_existing_set_for_each_unversioned_type
+    io_handler = _append_mode_handler(dataset)
+    update = _overlapping_update(dataset)
+    update["added"] = 1.0
+    tags = {
+        **dataset.tags,
+        "series": {**dataset.tags["series"], "added": {"name": "added", "unit": "NOK"}},
+    }
+    io_handler.write(data=update, tags=tags)
+
+    io_handler.compact()
+
+    schema = pyarrow.parquet.read_schema(io_handler.fullpath)
+    assert json_helpers.tags_from_json(schema.field("added").metadata) == {
+        "name": "added",
+        "unit": "NOK",
+    }
+    assert json_helpers.tags_from_json(schema.metadata)["name"] == dataset.name
+    for name in dataset.series:
+        assert schema.field(name).metadata
+
+
+def test_append_mode_compacts_when_delta_count_reaches_threshold(
+    one_existing_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_existing_set_for_each_unversioned_type
+    io_handler = _append_mode_handler(dataset, delta_max_files=3)
+    update = _overlapping_update(dataset)
+
+    for _ in range(2):
+        io_handler.write(data=update, tags=dataset.tags)
+    assert len(deltas.delta_files(io_handler.directory)) == 2
+
+    io_handler.write(data=update, tags=dataset.tags)
+    assert deltas.delta_files(io_handler.directory) == []
+    assert len(io_handler.read()) == 18
+
+
+def test_merge_mode_write_folds_existing_deltas(
+    one_existing_set_for_each_unversioned_type: Dataset,
+) -> None:
+    dataset = one_existing_set_for_each_unversioned_type
+    _append_mode_handler(dataset).write(
+        data=_overlapping_update(dataset), tags=dataset.tags
+    )
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    )
+    later = create_df(
+        dataset.series,
+        start_date="2023-06-01",
+        end_date="2023-07-31",
+        freq="MS",
+        temporality=dataset.data_type.temporality,
+    )
+
+    io_handler.write(data=later, tags=dataset.tags)
+
+    assert deltas.delta_files(io_handler.directory) == []
+    assert len(io_handler.read()) == 19
+
+
+def test_merge_mode_write_removes_only_the_deltas_it_merged(
+    one_existing_set_for_each_unversioned_type: Dataset,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dataset = one_existing_set_for_each_unversioned_type
+    appending = _append_mode_handler(dataset)
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    )
+    later = create_df(
+        dataset.series,
+        start_date="2023-06-01",
+        end_date="2023-07-31",
+        freq="MS",
+        temporality=dataset.data_type.temporality,
+    )
+    update = _overlapping_update(dataset)
+    update[dataset.series] = 12345.0
+    delta_files = deltas.delta_files
+    appended = []
+
+    def delta_appended_after_listing(directory):
+        listed = delta_files(directory)
+        if not appended:
+            appended.append(True)
+            appending.write(data=update, tags=dataset.tags)
+        return listed
+
+    monkeypatch.setattr(deltas, "delta_files", delta_appended_after_listing)
+    io_handler.write(data=later, tags=dataset.tags)
+    monkeypatch.undo()
+
+    # the delta that was not merged into the base file is kept, and applied on read
+    assert len(deltas.delta_files(io_handler.directory)) == 1
+    base = pyarrow.parquet.read_table(io_handler.fullpath)
+    assert 12345.0 not in base[dataset.series[0]].to_pylist()
+    assert io_handler.read()[dataset.series[0]].to_pylist().count(12345.0) == 12
+
+
+def test_unknown_write_mode_raises_value_error(
+    existing_simple_set: Dataset,
+) -> None:
+    io_handler = _append_mode_handler(existing_simple_set, write_mode="sometimes")
+    with pytest.raises(ValueError):
+        io_handler.write(data=existing_simple_set.data, tags=existing_simple_set.tags)
+
+
+def test_read_numeric_fills_matrix_one_row_group_at_a_time(
+    new_dataset_none_at: Dataset,
+) -> None:
+    dataset = new_dataset_none_at
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+    )
+    io_handler.row_group_size = 5
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    expected = numeric_matrix(io_handler.read())
+
+    matrix = io_handler.read_numeric()
+
+    assert pyarrow.parquet.read_metadata(io_handler.fullpath).num_row_groups > 1
+    assert not matrix.flags.writeable
+    assert np.array_equal(matrix, expected)
+    selected = io_handler.read_numeric(columns=dataset.series[-2:])
+    assert np.array_equal(selected, expected[:, -2:])
+
+
+def test_writes_record_versions_in_manifest(
+    new_dataset_as_of_at: Dataset,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dataset = new_dataset_as_of_at
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=date_utc("2024-01-01"),
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    io_handler.as_of_utc = date_utc("2024-02-01")
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+
+    entries = manifest.read_manifest(io_handler.directory)
+    assert [e["file"] for e in entries] == sorted(
+        Path(f).name for f in fs.ls(io_handler.directory, "*.parquet")
+    )
+    assert all(e["rows"] == len(dataset.data) for e in entries)
+    dates = io_handler.read()["valid_at"]
+    assert entries[-1]["min"] == dates[0].as_py().isoformat()
+    assert entries[-1]["max"] == dates[-1].as_py().isoformat()
+    assert not fs.ls(io_handler.directory, "*.tmp")
+
+    def no_listing(*args, **kwargs):
+        raise AssertionError("versions() should only read the manifest")
+
+    monkeypatch.setattr(fs, "ls", no_listing)
+    assert io_handler.versions(pattern=dataset.data_type.versioning) == [
+        date_utc("2024-01-01"),
+        date_utc("2024-02-01"),
+    ]
+
+
+def _write_version(handler_args: dict, as_of: str, data, tags: dict) -> None:
+    """Write a version of a dataset, in a separate process."""
+    io.FileSystem(**handler_args, as_of_utc=date_utc(as_of)).write(data=data, tags=tags)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="Needs the fork start method.",
+)
+def test_concurrent_processes_record_all_versions_in_manifest(
+    new_dataset_as_of_at: Dataset,
+) -> None:
+    dataset = new_dataset_as_of_at
+    handler_args = {
+        "repository": dataset.repository,
+        "set_name": dataset.name,
+        "set_type": dataset.data_type,
+    }
+    as_of_dates = [f"2024-{m:02d}-01" for m in range(1, 9)]
+    # the first version creates the manifest
+    _write_version(handler_args, as_of_dates[0], dataset.data, dataset.tags)
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(
+            target=_write_version,
+            args=(handler_args, as_of, dataset.data, dataset.tags),
+        )
+        for as_of in as_of_dates[1:]
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join(timeout=120)
+    assert [p.exitcode for p in processes] == [0] * len(processes)
+
+    io_handler = io.FileSystem(**handler_args, as_of_utc=date_utc(as_of_dates[0]))
+    assert io_handler.versions(pattern=dataset.data_type.versioning) == [
+        date_utc(d) for d in as_of_dates
+    ]
+    assert not fs.exists(Path(io_handler.directory) / manifest.LOCK_FILE)
+
+
+def _update_manifest_entries(directory: str, worker: int, count: int) -> None:
+    """Add manifest entries, in a separate process."""
+    for i in range(count):
+        version = f"{worker:02d}-{i:02d}"
+        manifest.update_manifest(directory, {"version": version, "file": version})
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="Needs the fork start method.",
+)
+def test_concurrent_manifest_updates_are_not_lost(tmp_path: Path) -> None:
+    directory = str(tmp_path)
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_update_manifest_entries, args=(directory, w, 10))
+        for w in range(4)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join(timeout=120)
+
+    assert [p.exitcode for p in processes] == [0] * len(processes)
+    assert len(manifest.read_manifest(directory)) == 40
+
+
+def test_manifest_updates_of_different_datasets_do_not_wait_for_each_other(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    candidates = [str(tmp_path / f"set_{n}") for n in range(10)]
+    first = candidates[0]
+    second = next(
+        d
+        for d in candidates
+        if manifest._directory_lock(d) is not manifest._directory_lock(first)
+    )
+    # each update waits, while holding its lock, until the other has started
+    both_started = threading.Barrier(2, timeout=5)
+    read_manifest = manifest.read_manifest
+
+    def read_manifest_together(directory):
+        both_started.wait()
+        return read_manifest(directory)
+
+    monkeypatch.setattr(manifest, "read_manifest", read_manifest_together)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(
+            executor.map(
+                lambda d: manifest.update_manifest(d, {"version": "v", "file": "f"}),
+                [first, second],
+            )
+        )
+
+    monkeypatch.undo()
+    assert manifest.read_manifest(first) == manifest.read_manifest(second)
+
+
+def test_write_adds_data_files_missing_from_manifest(
+    new_dataset_as_of_at: Dataset,
+) -> None:
+    dataset = new_dataset_as_of_at
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=date_utc("2024-01-01"),
+    )
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+    # as written by a release without manifests
+    unlisted = str(
+        Path(io_handler.directory)
+        / io._as_of_file_name(dataset.name, date_utc("2024-02-01"))
+    )
+    fs.cp(io_handler.fullpath, unlisted)
+    io_handler.as_of_utc = date_utc("2024-03-01")
+    io_handler.write(data=dataset.data, tags=dataset.tags)
+
+    assert io_handler.versions(pattern=dataset.data_type.versioning) == [
+        date_utc("2024-01-01"),
+        date_utc("2024-02-01"),
+        date_utc("2024-03-01"),
+    ]
+
+
+def test_locked_waits_for_lock_file_and_removes_expired(tmp_path: Path) -> None:
+    path = tmp_path / "x.lock"
+    with fs.locked(path):
+        assert path.exists()
+        with pytest.raises(TimeoutError, match="waiting for the lock file"):
+            with fs.locked(path, timeout=0.05):
+                pass
+    assert not path.exists()
+
+    path.write_text('{"created": 0}')
+    with fs.locked(path, timeout=0.05):
+        assert path.exists()
+    assert not path.exists()
+
+
+def test_locked_only_removes_lock_files_with_the_token_it_judged(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = tmp_path / "x.lock"
+    fresh = json.dumps({"created": time.time(), "token": "fresh"})
+    lock_holder = fs._lock_holder
+
+    def taken_over_after_read(p):
+        holder = lock_holder(p)
+        if holder and holder[0] == "expired":
+            # another waiter removes the expired lock and takes it
+            path.write_text(fresh)
+        return holder
+
+    path.write_text(json.dumps({"created": 0, "token": "expired"}))
+    monkeypatch.setattr(fs, "_lock_holder", taken_over_after_read)
+    with pytest.raises(TimeoutError):
+        with fs.locked(path, timeout=0.05):
+            pass
+    assert path.read_text() == fresh
+
+    path.unlink()
+    with fs.locked(path, expires=0):
+        # the lock expires and another process takes it over
+        path.write_text(fresh)
+    assert path.read_text() == fresh
+
+
+def test_manifest_is_rebuilt_from_data_files(
+    existing_estimate_set: Dataset,
+    conftest,
+) -> None:
+    io_handler = io.FileSystem(
+        repository=existing_estimate_set.repository,
+        set_name=existing_estimate_set.name,
+        set_type=existing_estimate_set.data_type,
+        as_of_utc=existing_estimate_set.as_of_utc,
+    )
+    versioning = existing_estimate_set.data_type.versioning
+    expected = io_handler.versions(pattern=versioning)
+    fs.rm(manifest.manifest_path(io_handler.directory))
+
+    assert io_handler.versions(pattern=versioning) == expected
+    assert io.FileSystem.rebuild_manifests(io_handler.repository) >= 1
+    assert manifest.read_manifest(io_handler.directory)
+    assert io_handler.versions(pattern=versioning) == expected
+
+
+def test_read_versions_returns_versions_within_window_with_as_of_column(
+    new_dataset_as_of_from_to: Dataset,
+) -> None:
+    dataset = new_dataset_as_of_from_to
+    io_handler = io.FileSystem(
+        repository=dataset.repository,
+        set_name=dataset.name,
+        set_type=dataset.data_type,
+        as_of_utc=date_utc("2024-01-01"),
+    )
+    as_of_dates = [date_utc(d) for d in ("2024-01-01", "2024-02-01", "2024-03-01")]
+    for factor, as_of in enumerate(as_of_dates, start=1):
+        io_handler.as_of_utc = as_of
+        io_handler.write(data=(dataset * factor).data, tags=dataset.tags)
+
+    stacked = io_handler.read_versions(from_=as_of_dates[1])
+
+    assert stacked.column_names[0] == "as_of"
+    assert set(stacked["as_of"].to_pylist()) == set(as_of_dates[1:])
+    for as_of in as_of_dates[1:]:
+        io_handler.as_of_utc = as_of
+        single = io_handler.read()
+        version = stacked.filter(pyarrow.compute.equal(stacked["as_of"], as_of))
+        assert version.drop(["as_of"]).equals(single.select(version.column_names[1:]))
+
+    selected = dataset.series[:2]
+    projected = io_handler.read_versions(to=as_of_dates[0], columns=selected)
+    assert sorted(projected.column_names) == sorted(
+        ["as_of", "valid_from", "valid_to", *selected]
+    )
+    assert projected.num_rows == len(dataset.data)
+
+
+def test_read_versions_raises_for_unversioned_sets(existing_simple_set) -> None:
+    io_handler = io.FileSystem(
+        repository=existing_simple_set.repository,
+        set_name=existing_simple_set.name,
+        set_type=existing_simple_set.data_type,
+    )
+    with pytest.raises(ValueError):
+        io_handler.read_versions()
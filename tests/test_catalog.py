@@ -1,5 +1,6 @@
 """Tests for catalog.py."""
 
+import asyncio
 import logging
 from collections import namedtuple
 from math import log
@@ -482,3 +483,50 @@ def test_catalog_search_for_dataset_in_multiple_repos_returns_list_with_multiple
 #         expected = test_case[2][1]
 #     criteria = {parameter_name: parameter_value}
 #     assert catalog_or_repo.count(object_type=return_type, **criteria) == expected
+
+
+def test_catalog_adatasets_and_aseries_return_the_same_as_datasets_and_series(
+    existing_sets,
+    catalog_with_two_repos: Catalog,
+) -> None:
+    catalog = catalog_with_two_repos
+
+    assert asyncio.run(catalog.adatasets()) == catalog.datasets()
+    assert asyncio.run(catalog.aseries()) == catalog.series()
+    assert asyncio.run(catalog.adatasets(repository="test_2")) == catalog.datasets(
+        repository="test_2"
+    )
+    assert asyncio.run(
+        catalog.repositories[0].adatasets(contains="estimate")
+    ) == catalog.repositories[0].datasets(contains="estimate")
+
+
+def test_catalog_iter_datasets_yields_the_same_datasets_as_get(
+    existing_sets,
+    catalog_with_two_repos: Catalog,
+) -> None:
+    catalog = catalog_with_two_repos
+    items = catalog.datasets(repository="test_1")
+
+    for prefetch in [0, 3]:
+        found = list(catalog.iter_datasets(repository="test_1", prefetch=prefetch))
+        assert [ds.name for ds in found] == [i.object_name for i in items]
+        for ds, item in zip(found, items):
+            assert ds.data.shape == item.get().data.shape
+
+
+def test_catalog_item_get_reads_lazily_and_selected_columns(
+    existing_small_set,
+    catalog_with_two_repos: Catalog,
+) -> None:
+    [item] = catalog_with_two_repos.datasets(
+        repository="test_1", equals=existing_small_set.name
+    )
+    columns = existing_small_set.series[:1]
+
+    lazy = item.get(lazy=True)
+    assert not lazy.data_is_loaded
+    assert lazy.series == existing_small_set.series
+
+    selected = item.get(columns=columns)
+    assert selected.data.shape == (len(existing_small_set.data), 1 + len(columns))
@@ -21,6 +21,7 @@ Running with a predefined configuration file depnds on:
 Fixtures
 """
 
+import copy
 import logging
 import os
 import uuid
@@ -371,3 +372,63 @@ def test_init_w_no_params_and_env_var_pointing_to_non_existing_file_raises_error
     with pytest.raises(FileNotFoundError):
         configuration = cfg.Config()
         test_logger.debug(f"Created configuration: {configuration}")
+
+
+@pytest.fixture(scope="function")
+def saved_config_copy(buildup_and_teardown, tmp_path):
+    cfg = copy.deepcopy(buildup_and_teardown)
+    cfg.save(path=tmp_path / "cached_config.json")
+    yield cfg
+
+
+def test_config_active_is_served_from_cache_while_file_is_unchanged(
+    saved_config_copy,
+    monkeypatch,
+) -> None:
+    config.Config.refresh()
+    reads = []
+    original = config.load_json_file
+    monkeypatch.setattr(
+        config, "load_json_file", lambda **kw: reads.append(kw) or original(**kw)
+    )
+    before = config.Config.cache_info()
+
+    first = config.Config.active()
+    second = config.Config.active()
+
+    after = config.Config.cache_info()
+    assert reads == []
+    assert after.hits - before.hits == 2
+    assert after.reloads == before.reloads
+    assert first == second == saved_config_copy
+    assert id(first) != id(second)
+
+
+def test_config_active_reloads_when_file_changes(saved_config_copy) -> None:
+    config.Config.refresh()
+    reloads_before = config.Config.cache_info().reloads
+
+    changed = config.Config.active()
+    changed.repositories[REPO]["default"] = False
+    fs.write_text(
+        content=str(changed),
+        path=saved_config_copy.configuration_file,
+        file_format="json",
+    )
+
+    reloaded = config.Config.active()
+    assert config.Config.cache_info().reloads == reloads_before + 1
+    assert reloaded.repositories[REPO]["default"] is False
+
+
+def test_config_refresh_forces_reload(saved_config_copy) -> None:
+    config.Config.active()
+    reloads_before = config.Config.cache_info().reloads
+    config.Config.refresh()
+    assert config.Config.cache_info().reloads == reloads_before + 1
+
+
+def test_changes_to_returned_config_do_not_leak_into_cache(saved_config_copy) -> None:
+    cfg = config.Config.active()
+    cfg.repositories[REPO]["name"] = "changed but not saved"
+    assert config.Config.active().repositories[REPO]["name"] == REPO
@@ -1,6 +1,7 @@
 import logging
 
 import narwhals as nw
+import numpy as np
 import pandas
 import polars
 import pyarrow as pa
@@ -14,6 +15,7 @@ from ssb_timeseries.dataframes import empty_frame
 from ssb_timeseries.dataframes import is_df_like
 from ssb_timeseries.dataframes import is_empty
 from ssb_timeseries.dataframes import merge_data
+from ssb_timeseries.dataframes import numeric_matrix
 from ssb_timeseries.dates import date_utc
 from ssb_timeseries.dates import datelike_to_utc
 from ssb_timeseries.sample_data import create_df
@@ -326,3 +328,34 @@ def test_merge_data_raises_error_on_different_temporalities(
 
     with pytest.raises(ValueError, match=r"No matching date columns;.*"):
         merge_data(at_df, from_to_df, ["valid_at"], temporality="AT")
+
+
+def test_numeric_matrix_stacks_arrow_columns_in_column_major_order() -> None:
+    table = pa.table(
+        {
+            "valid_at": pa.array([date_utc("2024-01-01"), date_utc("2024-01-02")]),
+            "a": pa.chunked_array([[1.0], [2.0]]),
+            "b": [3.0, None],
+        }
+    )
+    matrix = numeric_matrix(table, read_only=True)
+    assert matrix.shape == (2, 2)
+    assert matrix.flags.f_contiguous
+    assert not matrix.flags.writeable
+    assert np.array_equal(matrix, [[1.0, 3.0], [2.0, np.nan]], equal_nan=True)
+    assert numeric_matrix(table).flags.writeable
+
+
+def test_numeric_matrix_returns_single_column_without_nulls_as_view() -> None:
+    table = pa.table({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    view = numeric_matrix(table, series="b", read_only=True)
+    assert view.shape == (2, 1)
+    assert view.base is not None and not view.flags.owndata
+    assert numeric_matrix(table, series="b").flags.owndata
+
+
+@pytest.mark.parametrize("implementation", [pandas.DataFrame, polars.DataFrame])
+def test_numeric_matrix_selects_series_from_other_frames(implementation) -> None:
+    df = implementation({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": ["x", "y"]})
+    assert numeric_matrix(df).shape == (2, 2)
+    assert np.array_equal(numeric_matrix(df, series=["b"]), [[3.0], [4.0]])
@@ -322,3 +322,194 @@ def test_write_parquet_supports_arrow_table_input(
         schema=None,
     )
     assert fs.exists(temp_file)
+
+
+def test_read_json_many_reads_concurrently_and_keeps_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+    import time
+
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"f{i}.json"
+        path.write_text(f'{{"i": {i}}}')
+        paths.append(str(path))
+    read_json = fs.read_json
+    threads = set()
+
+    def slow_read_json(path):
+        threads.add(threading.get_ident())
+        time.sleep(0.05 * (8 - int(Path(path).stem[1:])) / 8)
+        return read_json(path)
+
+    monkeypatch.setattr(fs, "read_json", slow_read_json)
+
+    assert fs.read_json_many(paths, max_workers=4) == [{"i": i} for i in range(8)]
+    assert len(threads) > 1
+    threads.clear()
+    assert fs.read_json_many(paths, max_workers=1) == [{"i": i} for i in range(8)]
+    assert threads == {threading.get_ident()}
+
+
+def test_read_json_many_error_names_the_file(tmp_path: Path) -> None:
+    good = tmp_path / "good.json"
+    good.write_text("{}")
+    bad = tmp_path / "bad.json"
+    bad.write_text("not json")
+
+    with pytest.raises(ValueError) as error:
+        fs.read_json_many([str(good), str(bad), str(good)], max_workers=3)
+    assert any(str(bad) in note for note in error.value.__notes__)
+
+
+def test_protocols_are_normalised() -> None:
+    assert fs.protocol("/home/jovyan") == "file"
+    assert fs.protocol("file:///home/jovyan") == "file"
+    assert fs.protocol("gs:/bucket/x") == "gs"
+    assert fs.protocol("memory://x") == "memory"
+    assert fs.path_to_str("file:///home/jovyan") == fs.path_to_str("/home/jovyan")
+    assert fs.path("memory://root", "a", "b") == "memory://root/a/b"
+    assert fs.fs_type("memory://root") == "memory"
+
+
+def test_filesystem_objects_are_cached_per_protocol_and_bucket(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created = []
+
+    def gcs_filesystem():
+        created.append(object())
+        return created[-1]
+
+    monkeypatch.setattr(fs, "_gcs_filesystem", gcs_filesystem)
+    monkeypatch.setattr(fs, "_filesystems", {})
+
+    assert fs.filesystem("gs://a/x") is fs.filesystem("gs://a/y/z")
+    assert fs.filesystem("gs://b/x") is not fs.filesystem("gs://a/x")
+    assert len(created) == 2
+    assert fs.filesystem("memory://a") is fs.filesystem("memory://b")
+    assert fs.filesystem("/tmp") is fs.filesystem("file:///home")
+
+
+def test_memory_filesystem_supports_file_operations(df) -> None:
+    root = f"memory://test-{uuid.uuid4().hex[:8]}"
+    fs.write_json(f"{root}/a/x.json", {"x": 1})
+    fs.write_parquet(path=f"{root}/a/x.parquet", data=fs.to_arrow(df))
+
+    assert fs.exists(f"{root}/a/x.json")
+    assert fs.read_json(f"{root}/a/x.json") == {"x": 1}
+    assert fs.read_json_many([f"{root}/a/x.json"] * 3) == [{"x": 1}] * 3
+    assert sorted(fs.ls(f"{root}/a")) == [f"{root}/a/x.json", f"{root}/a/x.parquet"]
+    assert list(fs.signatures(f"{root}/a", "*.json")) == [f"{root}/a/x.json"]
+    assert fs.parquet_file(f"{root}/a/x.parquet").metadata.num_rows == len(df)
+    assert fs.read_parquet(f"{root}/a/x.parquet").shape == df.shape
+
+    fs.cp(f"{root}/a/x.json", f"{root}/b/y.json")
+    fs.mv(f"{root}/b/y.json", f"{root}/b/z.json")
+    assert fs.ls(f"{root}/b") == [f"{root}/b/z.json"]
+    fs.rmtree(root)
+    assert not fs.exists(f"{root}/a/x.json")
+
+
+def test_remote_parquet_file_is_closed_with_the_parquet_file(df, monkeypatch) -> None:
+    root = f"memory://test-{uuid.uuid4().hex[:8]}"
+    fs.write_parquet(path=f"{root}/x.parquet", data=fs.to_arrow(df))
+    memory = fs.filesystem(root)
+    opened = []
+    closed = []
+    open_file = memory.open
+
+    def tracked_open(*args, **kwargs):
+        file = open_file(*args, **kwargs)
+        # closing a file of the in-memory filesystem does nothing, so it is recorded instead
+        file.close = lambda: closed.append(file)
+        opened.append(file)
+        return file
+
+    monkeypatch.setattr(memory, "open", tracked_open)
+    with fs.parquet_file(f"{root}/x.parquet") as parquet_file:
+        assert parquet_file.read().num_rows == len(df)
+
+    assert opened
+    assert closed == opened
+    fs.rmtree(root)
+
+
+def test_mv_between_filesystems_removes_the_source(tmp_path: Path) -> None:
+    source = tmp_path / "x.json"
+    fs.write_json(source, {"x": 1})
+    target = f"memory://test-{uuid.uuid4().hex[:8]}/x.json"
+
+    fs.mv(source, target)
+    assert not fs.exists(source)
+    fs.mv(target, source)
+    assert fs.read_json(source) == {"x": 1}
+    assert not fs.exists(target)
+
+
+@pytest.fixture
+def listing_cache():
+    fs.reset_listing_cache_stats()
+    with fs.listing_cache(ttl=60):
+        yield
+    fs.reset_listing_cache_stats()
+
+
+def test_listing_cache_is_off_by_default(tmp_path: Path) -> None:
+    fs.reset_listing_cache_stats()
+    fs.ls(str(tmp_path))
+    fs.ls(str(tmp_path))
+    assert fs.listing_cache_stats() == (0, 0, 0)
+
+
+def test_listing_cache_counts_hits_and_misses(listing_cache, tmp_path: Path) -> None:
+    fs.write_json(tmp_path / "a.json", {"a": 1})
+
+    assert fs.ls(str(tmp_path)) == [str(tmp_path / "a.json")]
+    assert fs.ls(str(tmp_path)) == [str(tmp_path / "a.json")]
+    assert fs.exists(tmp_path / "a.json")
+    assert fs.exists(tmp_path / "a.json")
+    assert fs.listing_cache_stats() == (2, 2, 2)
+
+
+def test_listing_cache_is_invalidated_by_writes_moves_and_deletes(
+    listing_cache, tmp_path: Path
+) -> None:
+    directory = f"memory://test-{uuid.uuid4().hex[:8]}"
+    assert fs.ls(directory, pattern="*/*.json") == []
+    assert not fs.exists(f"{directory}/a/x.json")
+
+    fs.write_json(f"{directory}/a/x.json", {"x": 1})
+    assert fs.ls(directory, pattern="*/*.json") == [f"{directory}/a/x.json"]
+    assert fs.exists(f"{directory}/a/x.json")
+
+    fs.mv(f"{directory}/a/x.json", f"{directory}/a/y.json")
+    assert fs.ls(directory, pattern="*/*.json") == [f"{directory}/a/y.json"]
+    assert not fs.exists(f"{directory}/a/x.json")
+
+    fs.rmtree(f"{directory}/a")
+    assert fs.ls(directory, pattern="*/*.json") == []
+    assert not fs.exists(f"{directory}/a/y.json")
+
+
+def test_listing_cache_entries_expire(
+    listing_cache, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(fs, "_clock", lambda: now[0])
+    fs.ls(str(tmp_path))
+    (tmp_path / "outside.json").write_text("{}")
+    assert fs.ls(str(tmp_path)) == []
+
+    now[0] += 61
+    assert fs.ls(str(tmp_path)) == [str(tmp_path / "outside.json")]
+
+
+def test_listing_cache_context_manager_restores_setting() -> None:
+    with fs.listing_cache(ttl=10):
+        fs.ls("memory://x")
+        assert fs.listing_cache_stats().entries == 1
+    assert fs.listing_cache_stats().entries == 0
+    with pytest.raises(ValueError):
+        fs.enable_listing_cache(ttl=0)
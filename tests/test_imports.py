@@ -0,0 +1,43 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# mypy: ignore-errors
+
+HEAVY_MODULES = ["gcsfs", "klass", "matplotlib", "networkx", "pandas", "polars"]
+
+
+def imported_after(statement: str) -> set[str]:
+    """Return the top level packages imported by *statement* in a fresh interpreter."""
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return {name.split(".")[0] for name in json.loads(result.stdout)}
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import ssb_timeseries",
+        "from ssb_timeseries.dataset import Dataset",
+        "from ssb_timeseries import config",
+    ],
+)
+def test_import_does_not_load_heavy_dependencies(statement) -> None:
+    assert not imported_after(statement) & set(HEAVY_MODULES)
+
+
+def test_plain_package_import_does_not_load_pyarrow() -> None:
+    modules = imported_after("import ssb_timeseries")
+    assert "pyarrow" not in modules
+    assert "ssb_timeseries" in modules
+
+
+def test_lazy_attributes_resolve_on_first_access() -> None:
+    modules = imported_after(
+        "import ssb_timeseries as ts; ts.dataset; ts.meta.Taxonomy"
+    )
+    assert "networkx" in modules
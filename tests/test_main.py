@@ -24,3 +24,15 @@ def test_main_succeeds(
     result = runner.invoke(__main__.main)
     assert '"repositories"' in result.output
     assert result.exit_code == 0
+
+
+def test_rebuild_manifests_command(
+    runner: CliRunner,
+    monkeypatch: pytest.MonkeyPatch,
+    buildup_and_teardown,
+    existing_estimate_set,
+) -> None:
+    monkeypatch.setenv("TIMESERIES_CONFIG", buildup_and_teardown.configuration_file)
+    result = runner.invoke(__main__.main, ["rebuild-manifests"])
+    assert result.exit_code == 0
+    assert "Rebuilt version manifests for" in result.output